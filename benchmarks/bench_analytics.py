@@ -0,0 +1,124 @@
+"""
+Benchmark: job-history aggregates from the materialized summaries vs full scans
+
+    python benchmarks/bench_analytics.py --rows 1000000
+
+Fills a JobDatabase with ``--rows`` synthetic jobs spread over ``--days`` days
+(bulk insert through the summary triggers), then times each aggregate three
+ways: the summary-table API, the equivalent ``GROUP BY`` over the jobs table
+(what ``get_job_count`` used to run every cycle), and a date-range report
+served by the covering index. Also reports what the triggers cost per
+``add_job`` and checks that summaries and scans agree.
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.database import JobDatabase
+
+SOURCES = ["Greenhouse", "Lever", "RemoteOK", "HN Hiring", "Employer Sites", "Indeed (Web)", "LinkedIn (Web)"]
+
+
+def populate(path: str, rows: int, days: int, companies: int, seed: int):
+    rng = random.Random(seed)
+    start = datetime.now() - timedelta(days=days)
+    conn = sqlite3.connect(path)
+    batch = []
+    for i in range(rows):
+        found = start + timedelta(seconds=rng.randrange(days * 86400))
+        batch.append((f"job{i}", f"Engineer {i}", f"Company {int(rng.paretovariate(1.2)) % companies}",
+                      "Remote", rng.choice(SOURCES), found.isoformat(), 'sent' if rng.random() < 0.7 else 'pending'))
+        if len(batch) == 50000 or i == rows - 1:
+            conn.executemany("INSERT INTO jobs (job_id, title, company, location, source, found_date, status) "
+                             "VALUES (?, ?, ?, ?, ?, ?, ?)", batch)
+            conn.commit()
+            batch.clear()
+    conn.close()
+
+
+def timed(fn, repeat: int = 5):
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def scan(path: str, sql: str, params=()):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute(sql, params).fetchall()
+    finally:
+        conn.close()
+
+
+def add_job_ms(db: JobDatabase, count: int) -> float:
+    start = time.perf_counter()
+    for i in range(count):
+        db.add_job({'job_id': f"extra{time.time_ns()}-{i}", 'title': "Intern", 'company': "Acme",
+                    'source': "Lever", 'description': "x" * 500})
+    return (time.perf_counter() - start) * 1000 / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--companies', type=int, default=20000)
+    parser.add_argument('--inserts', type=int, default=2000, help='add_job calls timed with/without triggers')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_analytics_")
+    path = os.path.join(workdir, 'jobs.db')
+    db = JobDatabase(path)
+    start = time.perf_counter()
+    populate(path, args.rows, args.days, args.companies, args.seed)
+    print(f"{args.rows} jobs inserted through the summary triggers in {time.perf_counter() - start:.1f}s "
+          f"({os.path.getsize(path) / 2 ** 20:.0f} MiB)")
+
+    week_ago = (datetime.now() - timedelta(days=7)).isoformat()
+    cases = [
+        ("counts by status", db.get_job_count,
+         "SELECT status, COUNT(*) FROM jobs GROUP BY status", (), dict),
+        ("jobs per source", lambda: db.count_by('source'),
+         "SELECT source, COUNT(*) FROM jobs GROUP BY source", (), dict),
+        ("top 20 companies", lambda: db.count_by('company', limit=20),
+         "SELECT company, COUNT(*) AS n FROM jobs GROUP BY company ORDER BY n DESC, company LIMIT 20", (), list),
+        ("pending per day", lambda: db.count_by('day', status='pending'),
+         "SELECT substr(found_date, 1, 10), COUNT(*) FROM jobs WHERE status = 'pending' GROUP BY 1", (), dict),
+    ]
+    print(f"\n{'query':<20} {'summary ms':>11} {'scan ms':>9} {'speedup':>8}  agree")
+    for name, api, sql, params, shape in cases:
+        fast_ms, fast = timed(api)
+        slow_ms, slow = timed(lambda: scan(path, sql, params), repeat=1)
+        agree = (dict(fast) == dict(slow)) if shape is dict else fast == [tuple(r) for r in slow]
+        print(f"{name:<20} {fast_ms:>11.2f} {slow_ms:>9.0f} {slow_ms / fast_ms:>7.0f}x  {agree}")
+
+    report = ("SELECT source, status, COUNT(*) FROM jobs WHERE found_date >= ? GROUP BY source, status")
+    plan = " ".join(row[-1] for row in scan(path, "EXPLAIN QUERY PLAN " + report, (week_ago,)))
+    ms, rows = timed(lambda: scan(path, report, (week_ago,)))
+    print(f"{'last 7 days by src':<20} {ms:>11.2f}  ({len(rows)} groups; {plan})")
+
+    with_triggers = add_job_ms(db, args.inserts)
+    conn = sqlite3.connect(path)
+    for trigger in ('insert', 'update', 'delete'):
+        conn.execute(f"DROP TRIGGER trg_job_summary_{trigger}")
+    conn.commit()
+    conn.close()
+    without = add_job_ms(db, args.inserts)
+    print(f"\nadd_job: {with_triggers:.3f} ms with summary triggers, {without:.3f} ms without "
+          f"({(with_triggers / without - 1) * 100:+.0f}%)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
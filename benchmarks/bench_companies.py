@@ -0,0 +1,238 @@
+"""
+Benchmark: company/location dictionary tables and canonical-company dedup vs inline names
+
+    python benchmarks/bench_companies.py --rows 200000 --companies 5000
+
+Dedup: one cycle of synthetic postings where each job is listed by one to
+three sources under different spellings of its company ("Stripe",
+"stripe", "Stripe, Inc.", "The Stripe Company"), plus sibling companies
+whose names differ by a letter ("Notion"/"Motion") posting the same titles.
+The old rule (fuzzy title and fuzzy raw company) and ``pipeline.Dedup``
+(fuzzy title within one canonical company) are scored against the truth.
+
+Storage: a database in the old layout (names inline, index on the company
+text) is measured, opened with the current JobDatabase (which moves the
+names into the dictionary tables) and measured again: file size,
+``add_job`` cost and one company's jobs of the last 30 days under every
+spelling (the old layout needs a scan for that, or misses spellings with
+its index).
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.canonical import company_key
+from src import database
+from src.database import JobDatabase
+from src.job_scraper import JobScraper
+from src.pipeline import Dedup
+
+SYLLABLES = "ba ca da fa ga la ma na pa ra sa ta va za bo co do lo mo no ro so to vo ri ni li ki xi qu".split()
+VARIANTS = ["{}", "{}", "{}", "{lower}", "{}, Inc.", "{} Inc", "{upper} INC.", "The {} Company", "{} LLC",
+            "{}, Ltd."]
+TITLES = ["Software Engineer Intern", "Data Science Intern", "Machine Learning Intern", "Backend Engineer Intern",
+          "Frontend Engineer Intern", "Product Design Intern", "Security Engineer Intern", "SRE Intern",
+          "Mobile Engineer Intern", "Research Intern", "Quantitative Analyst Intern", "Data Engineer Intern"]
+LOCATIONS = ["Remote - US", "Remote (US)", "remote us", "San Francisco, CA", "New York, NY", "Seattle, WA",
+             "Austin, TX", "London, United Kingdom", "Berlin, Germany", "Toronto, ON, Canada"]
+
+
+def company_names(count: int, rng: random.Random):
+    names = set()
+    while len(names) < count:
+        name = "".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))).capitalize()
+        names.add(name)
+        if rng.random() < 0.1:  # a distinct company one letter away
+            names.add(chr(ord('A') + (ord(name[0]) - ord('A') + 1) % 26) + name[1:])
+    return sorted(names)[:count]
+
+
+def spelling(name: str, rng: random.Random) -> str:
+    return rng.choice(VARIANTS).format(name, lower=name.lower(), upper=name.upper())
+
+
+def popular(companies, rng: random.Random) -> str:
+    """Half the jobs come from a few big companies, the rest from the long tail."""
+    if rng.random() < 0.5:
+        return companies[int(rng.paretovariate(1.2)) % len(companies)]
+    return rng.choice(companies)
+
+
+def cycle_postings(companies, jobs: int, rng: random.Random):
+    """Postings of one cycle as (truth, job dict); truth identifies the real job."""
+    postings = []
+    for n in range(jobs):
+        company, title = rng.choice(companies), rng.choice(TITLES)
+        for _ in range(rng.choice((1, 1, 2, 3))):
+            postings.append(((company, title), {'title': title, 'company': spelling(company, rng)}))
+    # Within a cycle the same (company, title) drawn twice is the same job
+    rng.shuffle(postings)
+    return postings
+
+
+def old_dedup(jobs, threshold: float):
+    sim = JobScraper._sim
+    kept = []
+    for job in jobs:
+        if any(sim(job['title'], kt) > threshold and sim(job['company'], kc) > threshold for kt, kc in kept):
+            continue
+        kept.append((job['title'], job['company']))
+        yield job
+
+
+def score_dedup(name: str, dedup, postings):
+    truth_of = {id(job): truth for truth, job in postings}
+    start = time.perf_counter()
+    kept = list(dedup(job for _, job in postings))
+    ms = (time.perf_counter() - start) * 1000
+    kept_truths = [truth_of[id(job)] for job in kept]
+    real = len({truth for truth, _ in postings})
+    missed = len(kept_truths) - len(set(kept_truths))   # duplicates let through
+    lost = real - len(set(kept_truths))                 # real jobs dropped as someone else's duplicate
+    print(f"{name:<34} {ms:>8.1f} {len(postings) - len(kept):>8} {missed:>8} {lost:>6}")
+
+
+def populate(path: str, rows: int, companies, rng: random.Random):
+    start = datetime.now() - timedelta(days=180)
+    conn = sqlite3.connect(path)
+    for offset in range(0, rows, 20000):
+        conn.executemany(
+            "INSERT INTO jobs (job_id, title, company, location, job_url, source, found_date, status) "
+            "VALUES (?, ?, ?, ?, ?, 'Greenhouse', ?, 'sent')",
+            [(f"job{i}", rng.choice(TITLES), spelling(popular(companies, rng), rng), rng.choice(LOCATIONS),
+              f"https://example.com/jobs/{i}", (start + timedelta(seconds=i * 180 * 86400 // rows)).isoformat())
+             for i in range(offset, min(rows, offset + 20000))])
+        conn.commit()
+    conn.close()
+
+
+def old_layout(path: str):
+    """Strip a fresh database back to the schema from before the dictionary tables."""
+    conn = sqlite3.connect(path)
+    conn.executescript("DROP TRIGGER trg_job_summary_insert; DROP TRIGGER trg_job_summary_update; "
+                       "DROP TRIGGER trg_job_summary_delete; DROP TABLE companies; DROP TABLE locations; "
+                       "DROP INDEX idx_jobs_company_id_found; "
+                       "CREATE INDEX idx_jobs_company_found ON jobs(company, found_date, status);")
+    # The summary triggers as they were, counting companies by the inline name
+    with mock.patch.dict(database.SUMMARY_DIMENSIONS, company="COALESCE({row}.company, '')"):
+        JobDatabase._init_summaries(JobDatabase.__new__(JobDatabase), conn.cursor())
+    conn.commit()
+    conn.close()
+
+
+def legacy_add_job(path: str, job: dict):
+    """``add_job`` as it was: names inline in the jobs row."""
+    conn = sqlite3.connect(path, timeout=10)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA foreign_keys=ON")
+    conn.execute("INSERT INTO jobs (job_id, title, company, location, job_url, source, posted_date, found_date, "
+                 "status, relevance_score) VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'pending', ?)",
+                 (job['job_id'], job['title'], job['company'], job['location'], '', job['source'], '',
+                  datetime.now().isoformat(), 0))
+    conn.commit()
+    conn.close()
+
+
+def timed(fn, repeat: int = 5):
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def query(path: str, sql: str, params):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute(sql, params).fetchall()
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--companies', type=int, default=5000)
+    parser.add_argument('--cycle-jobs', type=int, default=400, help='distinct jobs in the dedup cycle')
+    parser.add_argument('--inserts', type=int, default=2000)
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+    companies = company_names(args.companies, rng)
+
+    postings = cycle_postings(companies[:100], args.cycle_jobs, rng)
+    print(f"dedup: {len(postings)} postings of {len({t for t, _ in postings})} jobs at 100 companies")
+    print(f"{'':<34} {'ms':>8} {'removed':>8} {'missed':>8} {'lost':>6}")
+    score_dedup("fuzzy title + fuzzy company (old)", lambda jobs: old_dedup(jobs, 0.85), postings)
+    score_dedup("fuzzy title, canonical company", Dedup(0.85), postings)
+
+    workdir = tempfile.mkdtemp(prefix="bench_companies_")
+    path, inline_path = os.path.join(workdir, 'jobs.db'), os.path.join(workdir, 'inline.db')
+    JobDatabase(path)
+    old_layout(path)
+    populate(path, args.rows, companies, rng)
+    conn = sqlite3.connect(path)
+    conn.execute("VACUUM INTO ?", (inline_path,))
+    conn.close()
+    start = time.perf_counter()
+    db = JobDatabase(path)
+    migrate_s = time.perf_counter() - start
+    db.vacuum()
+    distinct = query(path, "SELECT (SELECT COUNT(*) FROM companies), (SELECT COUNT(*) FROM locations)", ())[0]
+    print(f"\n{args.rows} jobs; {distinct[0]} companies and {distinct[1]} locations after canonicalization; "
+          f"migrated in {migrate_s:.1f}s")
+
+    target = companies[5]
+    since = (datetime.now() - timedelta(days=30)).isoformat()
+    variants = sorted({v.format(target, lower=target.lower(), upper=target.upper()) for v in VARIANTS})
+    same = company_key(target)
+    cases = [
+        ("inline, index, exact name", inline_path,
+         "SELECT job_id, company FROM jobs WHERE company = ? AND found_date >= ?", (target, since)),
+        ("inline, scan, any spelling", inline_path,
+         "SELECT job_id, company FROM jobs WHERE lower(company) LIKE ? AND found_date >= ?",
+         (f"%{target.lower()}%", since)),
+    ]
+    print(f"\n{'one company, last 30 days':<34} {'ms':>8} {'jobs':>6}")
+    for name, db_path, sql, params in cases:
+        ms, rows = timed(lambda: query(db_path, sql, params))
+        # LIKE also finds names that merely contain this one
+        print(f"{name:<34} {ms:>8.2f} {sum(company_key(c) == same for _, c in rows):>6}")
+    ms, rows = timed(lambda: db.get_company_jobs(target.lower() + " inc", since=since, limit=100000))
+    print(f"{'dictionary id, index, any spelling':<34} {ms:>8.2f} {len(rows):>6}")
+    print(f"  ({len(variants)} spellings of {target!r} in the data)")
+
+    sizes = {'inline': os.path.getsize(inline_path), 'dictionary': os.path.getsize(path)}
+    adds = {'inline': lambda job: legacy_add_job(inline_path, job), 'dictionary': db.add_job}
+    best = {name: float('inf') for name in adds}
+    hits, misses = db._ids.hits, db._ids.misses
+    per_round = args.inserts // args.rounds
+    for r in range(args.rounds):
+        for name in (sorted(adds) if r % 2 else sorted(adds, reverse=True)):
+            jobs = [{'job_id': f"extra{r}-{i}", 'title': rng.choice(TITLES), 'source': 'Lever',
+                     'company': spelling(popular(companies, rng), rng), 'location': rng.choice(LOCATIONS)}
+                    for i in range(per_round)]
+            start = time.perf_counter()
+            for job in jobs:
+                adds[name](job)
+            best[name] = min(best[name], (time.perf_counter() - start) * 1000 / per_round)
+    print(f"\n{'':<22} {'inline':>10} {'dictionary':>11}")
+    print(f"{'database MiB':<22} {sizes['inline'] / 2 ** 20:>10.1f} {sizes['dictionary'] / 2 ** 20:>11.1f}")
+    print(f"{'add_job ms':<22} {best['inline']:>10.3f} {best['dictionary']:>11.3f}")
+    print(f"id cache during add_job: {db._ids.hits - hits} hits, {db._ids.misses - misses} misses, "
+          f"{len(db._ids)} entries")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+"""
+Benchmark: compressed side-table descriptions vs descriptions inline in the jobs table
+
+    python benchmarks/bench_descriptions.py --rows 200000
+
+Builds a database in the old layout (descriptions inline in ``jobs``) from
+synthetic postings: per-company intros, shared EEO/benefits boilerplate and
+role-specific text, a share of them cut to 500 characters the way the
+scrapers cut them. Measures it, opens it with the current JobDatabase (which
+moves the descriptions out, compressed with a trained dictionary) and
+measures again: file size, VACUUM time, ``job_exists`` throughput, a scan of
+the jobs table, ``add_job`` cost and a pending-jobs read with descriptions.
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.compression import DescriptionCodec
+from src.database import JobDatabase
+
+BOILERPLATE = [
+    "We are an equal opportunity employer and value diversity at our company.",
+    "We do not discriminate on the basis of race, religion, color, national origin, gender, sexual "
+    "orientation, age, marital status, veteran status, or disability status.",
+    "Reasonable accommodations are available for candidates with disabilities throughout the hiring process.",
+    "Benefits include comprehensive medical, dental and vision coverage for you and your dependents.",
+    "Interns receive a competitive hourly wage, housing stipend and relocation support.",
+    "This is a 12-week paid summer internship starting in May or June.",
+    "You will be paired with a mentor and present your project to the team at the end of the summer.",
+    "Candidates must be currently enrolled in a Bachelor's or Master's program in Computer Science or a "
+    "related field.",
+    "Applicants must be authorized to work in the United States.",
+    "Please submit your resume and an unofficial transcript with your application.",
+    "Flexible hybrid work with two days a week in the office.",
+    "All offers are contingent on the successful completion of a background check.",
+]
+WORDS = ("build ship scale design implement test review deploy monitor improve services platform data "
+         "pipelines infrastructure tooling backend frontend mobile distributed systems machine learning "
+         "models features customers product engineers teams code quality reliability performance latency "
+         "python java go rust typescript react kubernetes cloud storage database queries analytics "
+         "experiments metrics dashboards apis integrations security privacy payments search ranking "
+         "recommendations workflows automation infrastructure observability").split()
+
+
+def sentence(rng: random.Random) -> str:
+    return " ".join(rng.choices(WORDS, k=rng.randint(8, 18))).capitalize() + "."
+
+
+def company_intro(rng: random.Random, name: str) -> str:
+    return f"At {name}, " + " ".join(sentence(rng) for _ in range(3))
+
+
+def description(rng: random.Random, intro: str) -> str:
+    parts = [intro, "What you'll do:"]
+    parts += ["• " + sentence(rng) for _ in range(rng.randint(4, 10))]
+    parts += ["What we offer:"] + rng.sample(BOILERPLATE, rng.randint(4, 9))
+    text = "\n".join(parts)
+    return text[:500] if rng.random() < 0.4 else text
+
+
+def populate(path: str, rows: int, companies: int, seed: int):
+    rng = random.Random(seed)
+    intros = [company_intro(rng, f"Company {c}") for c in range(companies)]
+    start = datetime.now() - timedelta(days=60)
+    conn = sqlite3.connect(path)
+    for offset in range(0, rows, 20000):
+        batch = []
+        for i in range(offset, min(rows, offset + 20000)):
+            c = rng.randrange(companies)
+            batch.append((f"job{i}", f"Software Engineer Intern {i % 700}", f"Company {c}", "Remote",
+                          f"https://example.com/jobs/{i}", description(rng, intros[c]), "Greenhouse",
+                          (start + timedelta(seconds=i * 60 * 86400 // rows)).isoformat(),
+                          'sent' if rng.random() < 0.9 else 'pending'))
+        conn.executemany("INSERT INTO jobs (job_id, title, company, location, job_url, description, source, "
+                         "found_date, status) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", batch)
+        conn.commit()
+    conn.close()
+
+
+def old_layout(path: str):
+    """Strip a fresh database back to the schema from before the side table."""
+    conn = sqlite3.connect(path)
+    conn.executescript("DROP TRIGGER trg_job_descriptions_delete; DROP TABLE job_descriptions; "
+                       "DROP TABLE description_dicts;")
+    conn.close()
+
+
+def legacy_add_job(path: str, job: dict):
+    """``add_job`` as it was: description inline in the jobs row."""
+    conn = sqlite3.connect(path, timeout=10)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA foreign_keys=ON")
+    conn.execute("INSERT INTO jobs (job_id, title, company, location, job_url, description, source, posted_date, "
+                 "found_date, status, relevance_score) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 'pending', ?)",
+                 (job['job_id'], job['title'], job['company'], '', '', job['description'], job['source'], '',
+                  datetime.now().isoformat(), 0))
+    conn.commit()
+    conn.close()
+
+
+def best_rate(fn, count: int) -> float:
+    start = time.perf_counter()
+    for i in range(count):
+        fn(i)
+    return count / (time.perf_counter() - start)
+
+
+def compare(layouts: dict, rows: int, inserts: int, rounds: int, rng: random.Random) -> dict:
+    """Per layout: best of ``rounds`` interleaved rounds, so drift in the machine hits both alike."""
+    results = {name: {'exists_per_s': 0.0, 'scan_ms': float('inf'), 'add_ms': float('inf')} for name in layouts}
+    intro = company_intro(rng, "Acme")
+    for r in range(rounds):
+        for name, (path, db, add) in (list(layouts.items()) if r % 2 else list(layouts.items())[::-1]):
+            res = results[name]
+            probes = [f"job{rng.randrange(rows * 2)}" for _ in range(4000)]  # half of them miss
+            res['exists_per_s'] = max(res['exists_per_s'], best_rate(lambda i: db.job_exists(probes[i]), len(probes)))
+
+            conn = sqlite3.connect(path)
+            start = time.perf_counter()
+            conn.execute("SELECT COUNT(*) FROM jobs WHERE title LIKE '%Intern 42%'").fetchone()
+            res['scan_ms'] = min(res['scan_ms'], (time.perf_counter() - start) * 1000)
+            conn.close()
+
+            jobs = [{'job_id': f"extra{r}-{i}", 'title': "Intern", 'company': "Acme", 'source': "Lever",
+                     'description': description(rng, intro)} for i in range(inserts // rounds)]
+            res['add_ms'] = min(res['add_ms'], 1000 / best_rate(lambda i: add(jobs[i]), len(jobs)))
+    for name, (path, db, add) in layouts.items():
+        start = time.perf_counter()
+        db.vacuum()
+        results[name]['vacuum_s'] = time.perf_counter() - start
+        results[name]['mb'] = os.path.getsize(path) / 2 ** 20
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--companies', type=int, default=2000)
+    parser.add_argument('--inserts', type=int, default=2000, help='add_job calls per layout, over all rounds')
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_descriptions_")
+    path, inline_path = os.path.join(workdir, 'jobs.db'), os.path.join(workdir, 'inline.db')
+    JobDatabase(path)
+    old_layout(path)
+    populate(path, args.rows, args.companies, args.seed)
+    conn = sqlite3.connect(path)
+    raw_bytes = conn.execute("SELECT SUM(LENGTH(CAST(description AS BLOB))) FROM jobs").fetchone()[0]
+    sample = [text for (text,) in conn.execute("SELECT description FROM jobs ORDER BY id DESC LIMIT 20000")]
+    conn.execute("VACUUM INTO ?", (inline_path,))
+    conn.close()
+
+    start = time.perf_counter()
+    db = JobDatabase(path)
+    migrate_s = time.perf_counter() - start
+    conn = sqlite3.connect(path)
+    stored, bodies, with_dict = conn.execute(
+        "SELECT SUM(LENGTH(body)), COUNT(*), SUM(dict_id > 0) FROM job_descriptions").fetchone()
+    conn.close()
+    plain = DescriptionCodec()
+    plain_ratio = sum(len(t.encode('utf-8')) for t in sample) / sum(len(plain.encode(t)[1]) for t in sample)
+
+    # The inline copy is never opened with JobDatabase (that would migrate it); only its
+    # job_exists/vacuum are used, which read no descriptions
+    inline = JobDatabase.__new__(JobDatabase)
+    inline.db_path = inline_path
+    results = compare({'inline': (inline_path, inline, lambda job: legacy_add_job(inline_path, job)),
+                       'side table': (path, db, db.add_job)},
+                      args.rows, args.inserts, args.rounds, random.Random(args.seed))
+    start = time.perf_counter()
+    jobs = db.get_pending_jobs(100)
+    pending_ms = (time.perf_counter() - start) * 1000
+
+    print(f"{args.rows} descriptions, {raw_bytes / 2 ** 20:.1f} MiB of text; migrated in {migrate_s:.1f}s")
+    print(f"compression: {raw_bytes / stored:.1f}x with the trained dictionary ({with_dict} of {bodies} bodies "
+          f"use it); deflate alone would give {plain_ratio:.1f}x")
+    before, after = results['inline'], results['side table']
+    print(f"\n{'':<22} {'inline':>10} {'side table':>11}")
+    print(f"{'database MiB':<22} {before['mb']:>10.1f} {after['mb']:>11.1f}")
+    print(f"{'VACUUM s':<22} {before['vacuum_s']:>10.2f} {after['vacuum_s']:>11.2f}")
+    print(f"{'job_exists / s':<22} {before['exists_per_s']:>10.0f} {after['exists_per_s']:>11.0f}")
+    print(f"{'jobs scan ms':<22} {before['scan_ms']:>10.1f} {after['scan_ms']:>11.1f}")
+    print(f"{'add_job ms':<22} {before['add_ms']:>10.3f} {after['add_ms']:>11.3f}")
+    print(f"\nget_pending_jobs(100) with descriptions: {pending_ms:.1f} ms ({len(jobs)} jobs)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+Benchmark: streaming export of job history, throughput and peak memory vs table size
+
+    python benchmarks/bench_export.py --sizes 100000,500000 --format auto
+
+For each size, fills a fresh JobDatabase with synthetic jobs (500-char
+descriptions, spread over ``--days`` days), then exports it in a child process
+so peak RSS belongs to the export alone. A second, incremental export after
+adding 1% more rows shows that only the new rows are read. One JSON line per
+size: rows/s, output size vs the SQLite file, peak RSS.
+"""
+import argparse
+import json
+import os
+import random
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from src.database import JobDatabase
+
+WORDS = ("python intern backend data platform team build ship scalable systems remote hybrid "
+         "mentorship benefits equity growth cloud kubernetes react sql analytics").split()
+
+CHILD = """
+import json, resource, sys
+sys.path.insert(0, {root!r})
+from src.database import JobDatabase
+result = JobDatabase({db!r}).export_jobs({out!r}, fmt={fmt!r}, chunk_rows={chunk})
+result['peak_rss_mb'] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+print(json.dumps(result))
+"""
+
+
+def populate(path: str, start_id: int, rows: int, days: int, rng: random.Random):
+    base = datetime.now() - timedelta(days=days)
+    conn = sqlite3.connect(path)
+    for offset in range(0, rows, 20000):
+        conn.executemany(
+            "INSERT INTO jobs (job_id, title, company, location, job_url, description, source, found_date, status) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'pending')",
+            [(f"job{i}", f"Software Engineer Intern {i % 500}", f"Company {i % 3000}", "Remote",
+              f"https://example.com/jobs/{i}", " ".join(rng.choices(WORDS, k=70))[:500], "Greenhouse",
+              (base + timedelta(seconds=(i * days * 86400) // max(1, start_id + rows))).isoformat())
+             for i in range(start_id + offset, start_id + min(rows, offset + 20000))])
+        conn.commit()
+    conn.close()
+
+
+def export(db: str, out: str, fmt: str, chunk: int) -> dict:
+    code = CHILD.format(root=ROOT, db=db, out=out, fmt=fmt, chunk=chunk)
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def dir_size(path: str) -> int:
+    return sum(os.path.getsize(os.path.join(d, f)) for d, _, files in os.walk(path) for f in files)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='100000,500000')
+    parser.add_argument('--days', type=int, default=180)
+    parser.add_argument('--format', default='auto', choices=['auto', 'parquet', 'jsonl'])
+    parser.add_argument('--chunk-rows', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    for size in [int(s) for s in args.sizes.split(',') if s.strip()]:
+        workdir = tempfile.mkdtemp(prefix="bench_export_")
+        db_path, out = os.path.join(workdir, 'jobs.db'), os.path.join(workdir, 'export')
+        JobDatabase(db_path)
+        rng = random.Random(args.seed)
+        populate(db_path, 0, size, args.days, rng)
+
+        full = export(db_path, out, args.format, args.chunk_rows)
+        extra = max(1, size // 100)
+        populate(db_path, size, extra, args.days, rng)
+        start = time.perf_counter()
+        incremental = export(db_path, out, args.format, args.chunk_rows)
+        incremental_s = time.perf_counter() - start
+        print(json.dumps({
+            'rows': size,
+            'format': f"{full['format']}/{full['compression']}",
+            'rows_per_s': round(full['rows'] / full['seconds']),
+            'files': full['files'],
+            'db_mb': round(os.path.getsize(db_path) / 2 ** 20, 1),
+            'export_mb': round(dir_size(out) / 2 ** 20, 1),
+            'peak_rss_mb': full['peak_rss_mb'],
+            'incremental_rows': incremental['rows'],
+            'incremental_s': round(incremental_s, 2),
+            'incremental_peak_rss_mb': incremental['peak_rss_mb'],
+        }))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
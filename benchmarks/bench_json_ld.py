@@ -0,0 +1,99 @@
+"""
+Benchmark: JSON-LD JobPosting extraction, BeautifulSoup DOM vs raw byte scanning
+
+    python benchmarks/bench_json_ld.py [benchmarks/pages]
+
+``benchmarks/pages`` holds a small fixture set shaped like the career pages
+the crawler meets: Greenhouse/Lever-style job pages (posting in the head or
+at the end of the body), a heavy single-page app with inline bundles and an
+``@graph``, an ItemList listing, a top-level array next to a broken block,
+and a page without JSON-LD. Saved real pages can be added next to them, e.g.
+    curl -sL https://boards.greenhouse.io/stripe -o benchmarks/pages/stripe.html
+
+Both paths decode the same blocks with ``iter_job_postings``, so the job
+counts must agree and the times differ only in how the blocks are found.
+Needs beautifulsoup4 (requirements.txt) for the DOM path.
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.json_ld import iter_json_ld, iter_job_postings
+
+
+def dom_extract(content: bytes) -> int:
+    """The previous approach: build the full DOM, then read the ld+json script elements."""
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(content, 'html.parser')
+    count = 0
+    for script in soup.find_all("script", attrs={"type": "application/ld+json"}):
+        try:
+            data = json.loads(script.string or "", strict=False)
+        except ValueError:
+            continue
+        count += sum(1 for _ in iter_job_postings(data))
+    return count
+
+
+def scan_extract(content: bytes) -> int:
+    return sum(1 for data in iter_json_ld(content) for _ in iter_job_postings(data))
+
+
+def timed(fn, content: bytes, repeat: int):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(content)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pages", nargs="?", default=os.path.join(os.path.dirname(__file__), "pages"),
+                        help="directory of saved .html pages")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per page (best time is reported)")
+    args = parser.parse_args()
+
+    paths = sorted(glob.glob(os.path.join(args.pages, "*.htm*")))
+    if not paths:
+        print(f"❌ No saved pages in {args.pages}")
+        return 1
+
+    try:
+        import bs4  # noqa: F401
+    except ImportError:
+        print("❌ beautifulsoup4 is needed for the DOM path: pip install -r requirements.txt")
+        return 1
+
+    total_dom = total_scan = 0.0
+    mismatched = []
+    print(f"{'page':<32} {'KB':>7} {'dom ms':>9} {'jobs':>5} {'scan ms':>9} {'jobs':>5} {'speedup':>8}")
+    for path in paths:
+        with open(path, 'rb') as f:
+            content = f.read()
+        dom_t, dom_n = timed(dom_extract, content, args.repeat)
+        scan_t, scan_n = timed(scan_extract, content, args.repeat)
+        total_dom += dom_t
+        total_scan += scan_t
+        if dom_n != scan_n:
+            mismatched.append(os.path.basename(path))
+        print(f"{os.path.basename(path)[:32]:<32} {len(content) / 1024:>7.0f} {dom_t * 1000:>9.2f} {dom_n:>5} "
+              f"{scan_t * 1000:>9.2f} {scan_n:>5} {dom_t / max(scan_t, 1e-9):>7.1f}x")
+
+    print(f"\n📊 {len(paths)} pages: dom {total_dom * 1000:.1f} ms, scan {total_scan * 1000:.1f} ms "
+          f"({total_dom / max(total_scan, 1e-9):.1f}x faster)")
+    if mismatched:
+        print(f"⚠️  job counts differ on: {', '.join(mismatched)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+Benchmark: matching jobs to many saved searches, per-search scan vs inverted index
+
+    python benchmarks/bench_matcher.py --searches 10000 --jobs 2000
+
+Builds synthetic saved searches (1-3 keyword phrases, some with location
+filters) and job postings, then matches every job against every search twice:
+the straightforward way (``JobScraper._keyword_match`` per search) and with
+``ProfileMatcher`` (``KeywordIndex`` lookups, scoring only the candidates).
+Reports throughput for both and how many (job, search) matches differ; the
+index verifies candidates with the same substring rule, so both counts should
+be zero.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Dict, List, Set, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.job_scraper import JobScraper
+from src.profiles import ProfileMatcher, SearchProfile
+
+SKILLS = ["python", "java", "go", "rust", "react", "kubernetes", "aws", "sql", "spark", "pytorch", "django",
+          "node.js", "c++", "c#", "typescript", "android", "ios", "terraform", "kafka", "graphql", "scala",
+          "swift", "kotlin", "tensorflow", "airflow", "snowflake", "docker", "linux", "embedded", "fpga"]
+ROLES = ["software engineer", "backend developer", "frontend developer", "data scientist", "data engineer",
+         "machine learning engineer", "devops engineer", "qa engineer", "product manager", "security engineer",
+         "mobile developer", "site reliability engineer", "research scientist", "analyst", "designer"]
+KINDS = ["internship", "intern", "new grad", "junior", "co-op", "apprenticeship", "graduate program"]
+LOCATIONS = ["Remote", "New York, NY", "San Francisco, CA", "London, UK", "Berlin, Germany", "Toronto, Canada"]
+FILLER = ("we are looking for motivated people to join our team and build scalable systems with modern "
+          "tooling you will collaborate ship features learn mentor grow own projects benefits").split()
+
+
+def synthetic_searches(count: int, rng: random.Random) -> List[SearchProfile]:
+    phrases = ([f"{role} {kind}" for role in ROLES for kind in KINDS]
+               + [f"{skill} {kind}" for skill in SKILLS for kind in KINDS]
+               + [f"{skill} {role}" for skill in SKILLS for role in ROLES]
+               + SKILLS + ROLES)
+    searches = []
+    for i in range(count):
+        locations = tuple(rng.sample(LOCATIONS, 2)) if rng.random() < 0.3 else ()
+        searches.append(SearchProfile(f"search{i}", keywords=tuple(rng.sample(phrases, rng.randint(1, 3))),
+                                      locations=locations))
+    return searches
+
+
+def synthetic_jobs(count: int, rng: random.Random, desc_words: int) -> List[Dict]:
+    jobs = []
+    for i in range(count):
+        words = rng.choices(FILLER, k=desc_words)
+        for _ in range(rng.randint(1, 4)):
+            words.insert(rng.randrange(len(words) + 1), rng.choice(SKILLS))
+        jobs.append({
+            'job_id': f"job{i}",
+            'title': f"{rng.choice(['', 'Senior ', 'Junior '])}{rng.choice(ROLES).title()} "
+                     f"{rng.choice(KINDS).title()}",
+            'description': " ".join(words),
+            'location': rng.choice(LOCATIONS),
+        })
+    return jobs
+
+
+def scan_match(searches: List[SearchProfile], job: Dict) -> List[Tuple[SearchProfile, float]]:
+    """The per-search loop the index replaces: O(searches × keywords) per job."""
+    norm = JobScraper._normalize_text
+    text = f"{job['title']} {job['description']}"
+    location = norm(job['location'])
+    matched = []
+    for search in searches:
+        if not JobScraper._keyword_match(text, list(search.keywords)):
+            continue
+        if search.locations and not any(norm(l) in location for l in search.locations):
+            continue
+        matched.append((search, JobScraper.score_job(job, list(search.keywords))))
+    return matched
+
+
+def run(match, jobs: List[Dict]) -> Tuple[float, Set[Tuple[str, str]], Dict[Tuple[str, str], float]]:
+    start = time.perf_counter()
+    results = [(job['job_id'], match(job)) for job in jobs]
+    elapsed = time.perf_counter() - start
+    pairs = {(job_id, s.name): score for job_id, matched in results for s, score in matched}
+    return elapsed, set(pairs), pairs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--searches', type=int, default=10000, help='saved searches')
+    parser.add_argument('--jobs', type=int, default=2000, help='job postings to match')
+    parser.add_argument('--desc-words', type=int, default=120, help='words per description')
+    parser.add_argument('--scan-jobs', type=int, default=200,
+                        help='jobs timed with the per-search scan (it is slow); 0 = all')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    searches = synthetic_searches(args.searches, rng)
+    jobs = synthetic_jobs(args.jobs, rng, args.desc_words)
+
+    start = time.perf_counter()
+    matcher = ProfileMatcher(searches)
+    build = time.perf_counter() - start
+
+    index_time, index_pairs, index_scores = run(matcher.match, jobs)
+    scan_jobs = jobs[:args.scan_jobs] if args.scan_jobs else jobs
+    scan_time, scan_pairs, scan_scores = run(lambda job: scan_match(searches, job), scan_jobs)
+
+    sampled = {job['job_id'] for job in scan_jobs}
+    index_sampled = {p for p in index_pairs if p[0] in sampled}
+    missed = scan_pairs - index_sampled
+    extra = index_sampled - scan_pairs
+    score_diff = sum(1 for p in scan_pairs & index_sampled if abs(scan_scores[p] - index_scores[p]) > 1e-9)
+
+    per_job_index = index_time / len(jobs)
+    per_job_scan = scan_time / len(scan_jobs)
+    print(f"searches {args.searches}, distinct keywords {len(matcher._index)}, index built in {build * 1000:.0f} ms")
+    print(f"{'method':<8} {'jobs':>6} {'ms/job':>9} {'jobs/s':>9} {'matches/job':>12}")
+    print(f"{'scan':<8} {len(scan_jobs):>6} {per_job_scan * 1000:>9.3f} {1 / per_job_scan:>9.0f} "
+          f"{len(scan_pairs) / len(scan_jobs):>12.1f}")
+    print(f"{'index':<8} {len(jobs):>6} {per_job_index * 1000:>9.3f} {1 / per_job_index:>9.0f} "
+          f"{len(index_pairs) / len(jobs):>12.1f}")
+    print(f"\n📊 index is {per_job_scan / per_job_index:.0f}x faster per job; on {len(scan_jobs)} jobs: "
+          f"{len(missed)} matches missed, {len(extra)} extra, {score_diff} scores differ")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""
+Benchmark: coordinator/worker sharding, cycle time vs number of worker processes
+
+    python benchmarks/bench_sharding.py --boards 200 --latency 0.05 --workers 1,2,4,8
+
+Runs a real ``ShardingScraper`` coordinator against a temporary work queue
+with Greenhouse/Lever board lists of ``--boards`` each, and drains every
+cycle with N ``ShardWorker`` processes. Workers use a fake scraper that sleeps
+``--latency`` seconds per board (standing in for the HTTP round trip) and
+returns ``--jobs-per-board`` postings, so the numbers measure queue and
+coordination overhead and how close scaling gets to linear.
+
+The fake scraper never goes through the per-host guard. Real workers share
+HOST_RATE_LIMIT among themselves (see ``ShardWorker``), so sources that sit
+on one host (every Greenhouse board is boards-api.greenhouse.io) scale
+no further than that rate allows, however many workers run.
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from config.settings import override_settings
+from src.sharding import ShardingScraper, ShardWorker
+from src.work_queue import WorkQueue
+
+
+class FakeScraper:
+    """``scrape_shard`` with a fixed per-board latency instead of network requests."""
+
+    def __init__(self, latency: float, jobs_per_board: int):
+        self.latency = latency
+        self.jobs_per_board = jobs_per_board
+
+    def scrape_shard(self, shard: Dict) -> Dict:
+        boards = shard.get('boards') or [shard['source']]
+        start = time.monotonic()
+        time.sleep(self.latency * len(boards))
+        jobs = [{'job_id': f"{board}-{i}", 'title': f"Software Engineer Intern {i}", 'company': board,
+                 'source': shard['source'], 'url': f"https://example.com/{board}/{i}"}
+                for board in boards for i in range(self.jobs_per_board)]
+        return {'jobs': jobs, 'cursors': {}, 'timings': {'fetch': self.latency * len(boards)},
+                'seconds': time.monotonic() - start}
+
+
+def _worker(path: str, latency: float, jobs_per_board: int, ready, stop):
+    worker = ShardWorker(WorkQueue(path), FakeScraper(latency, jobs_per_board),
+                         worker_id=f"bench:{os.getpid()}", poll_interval=0.01)
+    ready.release()
+    worker.run(stop)
+
+
+def run_cycle(scraper: ShardingScraper, keywords: List[str]) -> Dict:
+    start = time.perf_counter()
+    jobs = scraper.scrape_all_sources(keywords, deadline=0, sources=["Greenhouse", "Lever"])
+    return {'seconds': time.perf_counter() - start, 'jobs': len(jobs), 'status': scraper.last_source_status}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--boards', type=int, default=200, help='boards per source (Greenhouse and Lever)')
+    parser.add_argument('--boards-per-shard', type=int, default=5)
+    parser.add_argument('--latency', type=float, default=0.05, help='simulated seconds per board')
+    parser.add_argument('--jobs-per-board', type=int, default=20)
+    parser.add_argument('--workers', default='1,2,4,8', help='comma-separated worker counts')
+    parser.add_argument('--cycles', type=int, default=2, help='cycles per worker count (best is reported)')
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="bench_sharding_")
+    path = os.path.join(tmp, "work_queue.db")
+    override_settings(
+        search_greenhouse=True, search_lever=True,
+        greenhouse_boards=[f"gh{i}" for i in range(args.boards)],
+        lever_boards=[f"lv{i}" for i in range(args.boards)],
+        work_queue_file=path, shard_boards_per_task=args.boards_per_shard,
+        shard_poll_interval=0.01, shard_stall_timeout=30,
+    )
+    scraper = ShardingScraper()
+    serial = 2 * args.boards * args.latency
+    shards = 2 * -(-args.boards // args.boards_per_shard)
+    print(f"{2 * args.boards} boards in {shards} shards, {args.latency * 1000:.0f} ms/board "
+          f"({serial:.1f}s if scraped serially)")
+    print(f"{'workers':>7} {'cycle s':>8} {'jobs':>7} {'shards/s':>9} {'speedup':>8} {'efficiency':>10}")
+
+    ctx = multiprocessing.get_context("spawn")
+    base = None
+    for count in [int(n) for n in args.workers.split(',') if n.strip()]:
+        stop, ready = ctx.Event(), ctx.Semaphore(0)
+        procs = [ctx.Process(target=_worker, args=(path, args.latency, args.jobs_per_board, ready, stop))
+                 for _ in range(count)]
+        for proc in procs:
+            proc.start()
+        for _ in procs:  # time the cycles, not interpreter start-up
+            ready.acquire()
+        try:
+            best = min((run_cycle(scraper, ["intern"]) for _ in range(args.cycles)), key=lambda r: r['seconds'])
+        finally:
+            stop.set()
+            for proc in procs:
+                proc.join()
+        if any(st != 'ok' for st in best['status'].values()):
+            print(f"❌ {count} workers: {best['status']}")
+            return 1
+        base = base or best['seconds'] * count
+        speedup = base / best['seconds']
+        print(f"{count:>7} {best['seconds']:>8.2f} {best['jobs']:>7} {shards / best['seconds']:>9.1f} "
+              f"{speedup:>7.2f}x {speedup / count:>9.0%}")
+        scraper.queue.purge(0)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""
+Startup benchmark: process wall time and import breakdown per entry point
+
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --runs 20 --budget-ms 100 --top 10
+
+Each target is started in a fresh interpreter ``--runs`` times; the median wall
+time is compared against ``--budget-ms`` for the non-scraping targets. A second
+run under ``python -X importtime`` lists the slowest imports and any heavy
+module (requests, bs4, smtplib, ...) a non-scraping target pulled in. Exits 1
+when a budgeted target is over budget or loads a heavy module.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+# name -> (statement, held to the budget)
+TARGETS: Dict[str, Tuple[str, bool]] = {
+    'python': ("pass", False),
+    'settings': ("from config.settings import get_settings; get_settings()", True),
+    'database': ("from src.database import JobDatabase", True),
+    'examples': ("import examples", True),
+    'notifications': ("from src.notifications import NotificationManager", True),
+    'main': ("import main", False),
+}
+
+# Only needed once a check actually fetches, parses or sends something
+HEAVY_MODULES = ('requests', 'bs4', 'smtplib', 'email.mime', 'http.server', 'cProfile', 'pstats')
+
+
+def wall_times(statement: str, runs: int) -> List[float]:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', statement], cwd=ROOT, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def import_times(statement: str) -> List[Tuple[str, int, int]]:
+    """``(module, self_us, cumulative_us)`` from ``-X importtime``, in import order.
+
+    Module names keep their indentation, which encodes the import nesting.
+    """
+    out = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement], cwd=ROOT,
+                         capture_output=True, text=True, check=True)
+    rows = []
+    for line in out.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header line
+        rows.append((parts[2][1:].rstrip(), int(parts[0]), int(parts[1])))
+    return rows
+
+
+def heavy_loaded(rows: List[Tuple[str, int, int]]) -> List[str]:
+    names = {name.strip() for name, _, _ in rows}
+    return sorted(m for m in HEAVY_MODULES if m in names or any(n.startswith(m + '.') for n in names))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10, help='interpreter starts per target (median is reported)')
+    parser.add_argument('--budget-ms', type=float, default=100.0, help='wall-time budget for non-scraping targets')
+    parser.add_argument('--top', type=int, default=8, help='slowest imports listed per target')
+    parser.add_argument('targets', nargs='*', help=f"subset of: {', '.join(TARGETS)}")
+    args = parser.parse_args()
+
+    names = args.targets or list(TARGETS)
+    unknown = [n for n in names if n not in TARGETS]
+    if unknown:
+        print(f"❌ Unknown target(s): {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    failures = []
+    print(f"{'target':<14} {'median ms':>10} {'min ms':>8} {'imports ms':>11}  budget")
+    details = []
+    for name in names:
+        statement, budgeted = TARGETS[name]
+        times = wall_times(statement, max(1, args.runs))
+        rows = import_times(statement)
+        median, best = statistics.median(times) * 1000, min(times) * 1000
+        total_imports = sum(self_us for _, self_us, _ in rows) / 1000
+        heavy = heavy_loaded(rows)
+        verdict = '-'
+        if budgeted:
+            verdict = '✅' if median <= args.budget_ms and not heavy else '❌'
+            if median > args.budget_ms:
+                failures.append(f"{name}: {median:.1f} ms > {args.budget_ms:.0f} ms")
+            if heavy:
+                failures.append(f"{name}: imports {', '.join(heavy)}")
+        print(f"{name:<14} {median:>10.1f} {best:>8.1f} {total_imports:>11.1f}  {verdict}")
+        details.append((name, rows, heavy))
+
+    baseline = {mod.strip() for mod, _, _ in import_times(TARGETS['python'][0])}
+    for name, rows, heavy in details:
+        # Modules the bare interpreter doesn't load, by their own (exclusive) import time
+        own = sorted(((mod.strip(), self_us) for mod, self_us, _ in rows if mod.strip() not in baseline),
+                     key=lambda r: r[1], reverse=True)
+        if not own:
+            continue
+        print(f"\n📦 {name}: {len(own)} modules, slowest imports (self time)")
+        for mod, self_us in own[:args.top]:
+            print(f"   {self_us / 1000:>8.1f} ms  {mod}")
+        if heavy:
+            print(f"   ⚠️  heavy modules loaded: {', '.join(heavy)}")
+
+    if failures:
+        print("\n❌ Startup budget exceeded:\n   " + "\n   ".join(failures), file=sys.stderr)
+        return 1
+    print(f"\n✅ Non-scraping targets start within {args.budget_ms:.0f} ms", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
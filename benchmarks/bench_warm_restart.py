@@ -0,0 +1,115 @@
+"""
+Benchmark: warm restart from a state snapshot vs a cold start
+
+    python benchmarks/bench_warm_restart.py --cycles 200 --hosts 60 --dead-hosts 10
+
+Runs a JobMonitoringSystem (adaptive scheduling on, scraper untouched) through
+``--cycles`` synthetic checks: per-source results feed the scheduler, timings
+feed the HealthMetrics histograms and ``--dead-hosts`` of ``--hosts`` trip
+their circuit breakers. The state is then snapshotted and two fresh systems
+are started from it, one with the snapshot and one without, as a deploy would.
+Reports snapshot size, save/restore time and what the first cycle after the
+restart would do: sources due immediately and dead hosts it would hit again.
+"""
+import argparse
+import os
+import pickle
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from config.settings import override_settings
+
+
+def start_system(app, scraper_module):
+    scraper_module._host_guard = None  # a new process starts with an empty fetch layer
+    return app.JobMonitoringSystem()
+
+
+def simulate(system, cycles: int, hosts: int, dead: int, rng: random.Random):
+    from src.job_scraper import _get_host_guard
+    labels = system.scheduler.sources
+    guard = _get_host_guard()
+    versions = {label: 0 for label in labels}
+    for cycle in range(cycles):
+        now = time.monotonic() - (cycles - cycle) * 60  # one check a minute, ending now
+        for label in labels:
+            versions[label] += rng.random() < 0.1  # listings change now and then
+            system.scheduler.record(label, [f"{label}-{versions[label]}-{i}" for i in range(30)], now=now)
+        system.health.record_timings(
+            {'scrape': rng.uniform(1, 5), 'dedup': rng.uniform(0, .2), 'db_write': rng.uniform(0, .1)},
+            {label: rng.uniform(.1, 3) for label in labels},
+            {label: {'fetch': rng.uniform(.1, 2), 'parse': rng.uniform(0, .5)} for label in labels})
+        system.health.record_source_status({label: 'ok' for label in labels})
+        system.health.record_jobs(rng.randrange(500), rng.randrange(5))
+        system.health.record_success(rng.uniform(2, 8))
+        system.check_count += 1
+        for h in range(hosts):
+            breaker = guard.breaker(f"host{h}.example.com")
+            breaker.record_failure() if h < dead else breaker.record_success()
+
+
+def backdate(path: str, seconds: float):
+    """Make the snapshot look ``seconds`` older, as if the deploy took that long."""
+    with open(path, 'rb') as f:
+        payload = pickle.load(f)
+    payload['saved_at'] -= seconds
+    with open(path, 'wb') as f:
+        pickle.dump(payload, f, protocol=5)
+
+
+def first_cycle(system, scraper_module):
+    """Sources due right away and circuits still open, i.e. what the first cycle would skip."""
+    open_circuits = sum(1 for st in scraper_module._get_host_guard().states().values() if st['state'] == 'open')
+    return len(system.scheduler.due()), open_circuits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--cycles', type=int, default=200)
+    parser.add_argument('--hosts', type=int, default=60)
+    parser.add_argument('--dead-hosts', type=int, default=10)
+    parser.add_argument('--downtime', type=float, default=30, help='seconds between shutdown and restart')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_warm_restart_")
+    snapshot = os.path.join(workdir, 'state.pkl')
+    override_settings(database_file=os.path.join(workdir, 'jobs.db'), log_file=os.path.join(workdir, 'log'),
+                      adaptive_scheduling=True, snapshot_file=snapshot, circuit_breaker_threshold=3,
+                      circuit_breaker_cooldown=900)
+    import main as app
+    import src.job_scraper as scraper_module
+
+    system = start_system(app, scraper_module)
+    simulate(system, args.cycles, args.hosts, args.dead_hosts, random.Random(args.seed))
+    start = time.perf_counter()
+    system.save_state()
+    save_ms = (time.perf_counter() - start) * 1000
+    size = os.path.getsize(snapshot)
+    labels = len(system.scheduler.sources)
+
+    backdate(snapshot, args.downtime)
+    rows = []
+    for name, path in (("warm", snapshot), ("cold", "")):
+        override_settings(snapshot_file=path)
+        start = time.perf_counter()
+        restarted = start_system(app, scraper_module)
+        init_ms = (time.perf_counter() - start) * 1000
+        observations = sum(h.count for _, h in restarted.health.check_seconds.items())
+        rows.append((name, init_ms, restarted.check_count, observations) + first_cycle(restarted, scraper_module))
+
+    print(f"snapshot: {size / 1024:.1f} KiB, saved in {save_ms:.1f} ms "
+          f"({args.cycles} checks, {labels} sources, {args.hosts} hosts, {args.downtime:.0f}s downtime)")
+    print(f"{'start':<6} {'init ms':>8} {'checks':>7} {'hist obs':>9} {'due now':>8} {'open circuits':>14}")
+    for name, init_ms, checks, observations, due, open_circuits in rows:
+        print(f"{name:<6} {init_ms:>8.1f} {checks:>7} {observations:>9} {due:>4}/{labels:<3} "
+              f"{open_circuits:>7}/{args.dead_hosts:<6}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
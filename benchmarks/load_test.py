@@ -0,0 +1,256 @@
+"""
+Synthetic load test for JobMonitoringSystem.check_new_jobs
+
+Generates realistic fake postings and pushes them through the real check
+(dedup, ranking, JobDatabase, notification) with the scraper and notifiers
+stubbed out:
+    python benchmarks/load_test.py --sizes 10000,100000,1000000 --dup-rate 0.1 --hit-rate 0.3
+    python benchmarks/load_test.py --sizes 10000 --profiles 50   # matching fan-out to 50 profiles
+
+Each size runs in its own process so peak RSS is per size. One JSON line per
+size is printed to stdout: throughput, end-to-end latency percentiles (job
+generated → notified), per-stage seconds and peak RSS. ``--time-limit`` stops
+feeding jobs after that many seconds, so sizes past the scaling limit still
+report how far they got.
+
+No fixtures are needed. With the default ``--notify-mode digest`` every job
+waits for the digest at the end of the check, so the latency percentiles
+track the length of the whole check; ``--notify-mode instant`` measures
+per-job latency.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, Iterator, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+SENIORITY = ["", "Junior ", "Senior ", "Staff ", "Lead ", "Principal ", "Graduate ", "Associate "]
+ROLES = ["Software Engineer", "Backend Developer", "Frontend Developer", "Data Scientist",
+         "Machine Learning Engineer", "DevOps Engineer", "QA Engineer", "Product Manager",
+         "Site Reliability Engineer", "Mobile Developer", "Data Engineer", "Security Engineer"]
+STACKS = ["", " (Python)", " (Go)", " (Java)", " - Platform", " - Payments", " (React)", " - Infrastructure"]
+LOCATIONS = ["Remote", "New York, NY", "San Francisco, CA", "London, UK", "Berlin, Germany",
+             "Toronto, Canada", "Austin, TX", "Bangalore, India", "Remote - US", "Amsterdam, NL"]
+SOURCES = ["Greenhouse", "Lever", "RemoteOK", "HN Hiring", "Employer Sites", "Indeed (Web)", "LinkedIn (Web)"]
+FILLER = ("we are looking for engineers to build scalable distributed systems and work with a "
+          "collaborative team on customer facing products using modern tooling cloud services "
+          "testing code review mentoring ownership impact growth benefits equity health").split()
+
+
+class SyntheticJobs:
+    """Deterministic stream of fake postings with tunable duplicate and keyword-hit rates."""
+
+    def __init__(self, keywords: List[str], dup_rate: float, hit_rate: float,
+                 desc_words: int, seed: int = 1):
+        self.keywords = keywords
+        self.dup_rate = dup_rate
+        self.hit_rate = hit_rate
+        self.desc_words = desc_words
+        self.rng = random.Random(seed)
+        self.companies = [f"{self.rng.choice(['Acme', 'Globex', 'Initech', 'Umbrella', 'Hooli', 'Stark'])}"
+                          f"{self.rng.choice(['', ' Labs', ' Systems', ' AI', ' Cloud'])} {i}" for i in range(5000)]
+        self._recent: List[Dict] = []
+        self._n = 0
+
+    def _description(self, hit: bool) -> str:
+        words = self.rng.choices(FILLER, k=self.desc_words)
+        if hit:
+            words.insert(self.rng.randrange(len(words) + 1), self.rng.choice(self.keywords))
+        return " ".join(words)
+
+    def job(self) -> Dict:
+        self._n += 1
+        rng = self.rng
+        if self._recent and rng.random() < self.dup_rate:
+            # Same posting seen through another source: different URL and id, near-identical text
+            original = rng.choice(self._recent)
+            job = dict(original)
+            job['title'] = original['title'] + rng.choice(["", " ", " - Remote"])
+            job['source'] = rng.choice(SOURCES)
+            job['job_url'] = f"https://mirror{rng.randrange(10)}.example.com/jobs/{self._n}"
+        else:
+            hit = rng.random() < self.hit_rate
+            title = f"{rng.choice(SENIORITY)}{rng.choice(ROLES)}{rng.choice(STACKS)}"
+            if hit and rng.random() < 0.5:
+                title = f"{title} - {rng.choice(self.keywords).title()}"
+            job = {
+                'title': title,
+                'company': rng.choice(self.companies),
+                'location': rng.choice(LOCATIONS),
+                'job_url': f"https://boards.example.com/{self._n}",
+                'description': self._description(hit),
+                'source': rng.choice(SOURCES),
+                'posted_date': "2024-01-01T00:00:00",
+            }
+            self._recent.append(job)
+            if len(self._recent) > 2000:
+                self._recent.pop(rng.randrange(len(self._recent)))
+        job['job_id'] = f"synthetic-{self._n}"
+        return job
+
+
+class LatencyNotifier:
+    """Stands in for NotificationManager; records generated→notified latency per job."""
+
+    def __init__(self):
+        self.latencies: List[float] = []
+
+    def send_job_alert(self, job) -> bool:
+        self.latencies.append(time.perf_counter() - job['_generated_at'])
+        return True
+
+    def send_digest(self, jobs) -> bool:
+        now = time.perf_counter()
+        self.latencies.extend(now - job['_generated_at'] for job in jobs)
+        return True
+
+
+def synthetic_profiles(keywords: List[str], count: int, seed: int) -> List[Dict]:
+    """``count`` search profiles, each with a few of ``keywords`` and sometimes a location filter."""
+    rng = random.Random(seed)
+    profiles = []
+    for i in range(count):
+        profile = {'name': f"user{i}", 'keywords': rng.sample(keywords, min(len(keywords), rng.randint(1, 3))),
+                   'email_recipient': f"user{i}@example.com"}
+        if rng.random() < 0.3:
+            profile['locations'] = rng.sample(LOCATIONS, 2)
+        profiles.append(profile)
+    return profiles
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_size(args) -> Dict:
+    from config.settings import override_settings
+    import main as app
+
+    with tempfile.TemporaryDirectory() as workdir:
+        settings = override_settings(database_file=os.path.join(workdir, 'jobs.db'), adaptive_scheduling=False,
+                                     incremental_fetch=False, notification_mode=args.notify_mode, snapshot_file='')
+        if args.profiles:
+            settings = override_settings(search_profiles=synthetic_profiles(
+                settings.job_search_keywords, args.profiles, args.seed))
+
+        keywords = list(settings.job_search_keywords)
+        generator = SyntheticJobs(keywords, args.dup_rate, args.hit_rate, args.desc_words, seed=args.seed)
+        rss_before = _peak_rss_mb()
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            system = app.JobMonitoringSystem()
+        notifier = LatencyNotifier()
+        system.notifiers = {name: notifier for name in system.notifiers}
+        scraper = system.scraper
+        fed = {'jobs': 0, 'stopped_early': False}
+
+        def synthetic_sources(keywords, deadline=None, sources=None) -> Iterator[Tuple[str, List[Dict]]]:
+            start = time.perf_counter()
+            results: Dict[str, List[Dict]] = {}
+            scraper.last_source_status = {}
+            scraper.last_source_results = results
+            batch_no = 0
+            while fed['jobs'] < args.size:
+                if args.time_limit and time.perf_counter() - start > args.time_limit:
+                    fed['stopped_early'] = True
+                    break
+                count = min(args.batch, args.size - fed['jobs'])
+                batch = []
+                for _ in range(count):
+                    job = generator.job()
+                    job['_generated_at'] = time.perf_counter()
+                    batch.append(job)
+                fed['jobs'] += count
+                label = f"synthetic-{batch_no}"
+                batch_no += 1
+                results[label] = batch
+                scraper.last_source_status[label] = 'ok'
+                yield label, batch
+
+        scraper.iter_source_results = synthetic_sources
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            system.check_new_jobs()
+        elapsed = time.perf_counter() - start
+        db_size = os.path.getsize(settings.database_file)
+
+    latencies = sorted(notifier.latencies)
+    return {
+        'size': args.size,
+        'processed': fed['jobs'],
+        'stopped_early': fed['stopped_early'],
+        'seconds': round(elapsed, 3),
+        'jobs_per_second': round(fed['jobs'] / elapsed, 1) if elapsed else 0.0,
+        'notified': len(latencies),  # job deliveries, one per matching profile
+        'latency_ms': {
+            'p50': round(_percentile(latencies, 50) * 1000, 2),
+            'p90': round(_percentile(latencies, 90) * 1000, 2),
+            'p99': round(_percentile(latencies, 99) * 1000, 2),
+            'max': round(latencies[-1] * 1000, 2) if latencies else 0.0,
+        },
+        'stages': {name: round(seconds, 4) for name, seconds in system.last_stage_timings.items()},
+        'peak_rss_mb': round(_peak_rss_mb(), 1),
+        'rss_before_mb': round(rss_before, 1),
+        'db_mb': round(db_size / (1024 * 1024), 2),
+        'params': {'dup_rate': args.dup_rate, 'hit_rate': args.hit_rate, 'desc_words': args.desc_words,
+                   'batch': args.batch, 'notify_mode': args.notify_mode, 'profiles': args.profiles},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='10000', help='comma-separated job counts, one process each')
+    parser.add_argument('--size', type=int, help=argparse.SUPPRESS)  # child process: run one size
+    parser.add_argument('--dup-rate', type=float, default=0.1, help='fraction of near-duplicate postings')
+    parser.add_argument('--hit-rate', type=float, default=0.3, help='fraction of postings matching a keyword')
+    parser.add_argument('--desc-words', type=int, default=120, help='words per description')
+    parser.add_argument('--batch', type=int, default=500, help='jobs per synthetic source batch')
+    parser.add_argument('--notify-mode', choices=['instant', 'digest'], default='digest')
+    parser.add_argument('--time-limit', type=float, default=0, help='stop feeding jobs after N seconds (0 = none)')
+    parser.add_argument('--profiles', type=int, default=0, help='synthetic search profiles (0 = single default)')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    if args.size is not None:
+        print(json.dumps(run_size(args)))
+        return 0
+
+    passthrough = ['--dup-rate', str(args.dup_rate), '--hit-rate', str(args.hit_rate),
+                   '--desc-words', str(args.desc_words), '--batch', str(args.batch),
+                   '--notify-mode', args.notify_mode, '--time-limit', str(args.time_limit),
+                   '--profiles', str(args.profiles), '--seed', str(args.seed)]
+    for size in [int(s) for s in args.sizes.split(',') if s.strip()]:
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), '--size', str(size)] + passthrough,
+                             capture_output=True, text=True)
+        if out.returncode != 0:
+            print(f"❌ size {size} failed:\n{out.stderr}", file=sys.stderr)
+            return 1
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        print(json.dumps(result))
+        print(f"📊 {size:>8} jobs: {result['jobs_per_second']:>9.0f} jobs/s, "
+              f"p99 {result['latency_ms']['p99']:.0f} ms, peak RSS {result['peak_rss_mb']:.0f} MB"
+              f"{' (stopped early)' if result['stopped_early'] else ''}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
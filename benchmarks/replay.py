@@ -0,0 +1,321 @@
+"""
+Offline replay benchmark for the monitoring cycle
+
+Record the responses of one live check once:
+    python benchmarks/replay.py record
+then time checks against the recording, with no network:
+    python benchmarks/replay.py run --runs 5 --output results.json
+    python benchmarks/replay.py run --baseline results.json   # flag regressions
+
+``benchmarks/fixtures`` ships a small synthetic recording so ``run`` works
+out of the box: the configured Greenhouse (14) and Lever (8) boards with 15
+postings each, 60 RemoteOK listings and a 120-comment HN thread, about 30%
+of them matching the default keywords. The HTML sources, GitHub Jobs and
+search are not in it; they get 404s and show up as ``fixture_misses``.
+``record`` replaces it with a real one.
+
+Every HTTP request made through ``requests`` (all ``scrape_*`` methods,
+robots.txt/sitemaps, search) is served from the fixture store; unknown URLs get
+a 404. Notifications are counted instead of sent, and the database, HN cache
+and crawl state live in a temporary directory, so every run starts cold.
+
+Reported stages (seconds): ``fetch`` and ``parse`` are summed over the fetch
+threads; ``scrape`` is the wall time the pipeline waited on the sources; the
+rest (``dedup``, ``rank``, ``db_lookup``, ``db_write``, ``notify``) are the
+exclusive times of the ``check_new_jobs`` pipeline stages.
+"""
+import argparse
+import hashlib
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+DEFAULT_FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+class FixtureStore:
+    """Recorded HTTP responses on disk: ``index.json`` plus one body file per request."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.index_file = os.path.join(path, 'index.json')
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                self.index = json.load(f)
+        except (OSError, ValueError):
+            self.index = {}
+        self.misses = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(method: str, url: str) -> str:
+        return hashlib.sha1(f"{method.upper()} {url}".encode()).hexdigest()[:20]
+
+    def save(self, method: str, url: str, status: int, content_type: str, body: bytes):
+        key = self.key(method, url)
+        os.makedirs(self.path, exist_ok=True)
+        with open(os.path.join(self.path, f"{key}.bin"), 'wb') as f:
+            f.write(body)
+        with self._lock:
+            self.index[key] = {'url': url, 'status': status, 'content_type': content_type}
+            with open(self.index_file, 'w', encoding='utf-8') as f:
+                json.dump(self.index, f, indent=1, sort_keys=True)
+
+    def load(self, method: str, url: str):
+        key = self.key(method, url)
+        entry = self.index.get(key)
+        if entry is None:
+            with self._lock:
+                self.misses.append(url)
+            return None
+        with open(os.path.join(self.path, f"{key}.bin"), 'rb') as f:
+            return entry, f.read()
+
+
+class _FetchClock:
+    def __init__(self):
+        self.seconds = 0.0
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float):
+        with self._lock:
+            self.seconds += seconds
+            self.requests += 1
+
+
+def install_transport(store: FixtureStore, record: bool, clock: _FetchClock):
+    """Route every ``requests`` call through the fixture store (or record live responses into it)."""
+    import requests
+    from requests.sessions import Session
+
+    live_request = Session.request
+
+    def _request(self, method, url, params=None, **kwargs):
+        full_url = requests.Request(method, url, params=params).prepare().url
+        start = time.perf_counter()
+        try:
+            if record:
+                resp = live_request(self, method, url, params=params, **kwargs)
+                store.save(method, full_url, resp.status_code, resp.headers.get('Content-Type', ''), resp.content)
+                return resp
+            resp = requests.Response()
+            resp.url = full_url
+            resp.request = requests.Request(method, full_url).prepare()
+            hit = store.load(method, full_url)
+            if hit is None:
+                resp.status_code = 404
+                resp._content = b''
+            else:
+                entry, body = hit
+                resp.status_code = entry['status']
+                resp.headers['Content-Type'] = entry['content_type']
+                resp._content = body
+            resp.encoding = resp.apparent_encoding if resp._content else 'utf-8'
+            return resp
+        finally:
+            clock.add(time.perf_counter() - start)
+
+    Session.request = _request
+
+
+def install_parse_clock(scraper_module) -> dict:
+    """Wrap the module-level ``_parse_*`` functions to sum the time spent parsing."""
+    totals = {'seconds': 0.0}
+    lock = threading.Lock()
+    for name in [n for n in dir(scraper_module) if n.startswith('_parse_')]:
+        fn = getattr(scraper_module, name)
+        if not callable(fn):
+            continue
+
+        def _timed(*args, _fn=fn, **kwargs):
+            start = time.perf_counter()
+            try:
+                return _fn(*args, **kwargs)
+            finally:
+                with lock:
+                    totals['seconds'] += time.perf_counter() - start
+        setattr(scraper_module, name, _timed)
+    return totals
+
+
+class CountingNotifier:
+    """Stands in for NotificationManager: counts what would have been sent."""
+
+    def __init__(self):
+        self.alerts = 0
+        self.digests = 0
+
+    def send_job_alert(self, job) -> bool:
+        self.alerts += 1
+        return True
+
+    def send_digest(self, jobs) -> bool:
+        self.digests += 1
+        return True
+
+
+def configure(workdir: str, record: bool):
+    """Point all state at ``workdir`` and make the run deterministic."""
+    from config.settings import override_settings
+    overrides = {
+        'database_file': os.path.join(workdir, 'jobs.db'),
+        'hn_cache_file': os.path.join(workdir, 'hn_cache.json'),
+        'employer_crawl_state_file': os.path.join(workdir, 'employer_crawl.json'),
+        'snapshot_file': '',  # a snapshot of the real monitor would warm up the run
+        'adaptive_scheduling': False,
+        'incremental_fetch': False,
+        'check_deadline': 0,
+        'parse_workers': 0,  # parse inline so the parse clock sees it
+    }
+    if not record:
+        overrides.update(host_rate_limit=1e9, host_rate_burst=10 ** 6)
+    override_settings(**overrides)
+
+
+class Harness:
+    def __init__(self, store: FixtureStore, record: bool):
+        import src.job_scraper as scraper_module
+        self.store = store
+        self.record = record
+        self.scraper_module = scraper_module
+        self.fetch_clock = _FetchClock()
+        install_transport(store, record, self.fetch_clock)
+        self.parse_clock = install_parse_clock(scraper_module)
+
+    def run_once(self) -> dict:
+        with tempfile.TemporaryDirectory() as workdir:
+            configure(workdir, self.record)
+            import main as app
+            self.scraper_module._host_guard = None  # rebuilt with the settings above
+            self.fetch_clock.seconds, self.fetch_clock.requests = 0.0, 0
+            self.parse_clock['seconds'] = 0.0
+            return self._check(app)
+
+    def _check(self, app) -> dict:
+        fetch_clock, parse_clock = self.fetch_clock, self.parse_clock
+        system = app.JobMonitoringSystem()
+        notifier = CountingNotifier()
+        system.notifiers = {name: notifier for name in system.notifiers}
+
+        start = time.perf_counter()
+        system.check_new_jobs()
+        total = time.perf_counter() - start
+        system.scraper.close()
+
+        stages = {'fetch': fetch_clock.seconds, 'parse': parse_clock['seconds']}
+        stages.update(system.last_stage_timings)
+        return {
+            'total': total,
+            'stages': stages,
+            'sources': dict(system.scraper.last_source_durations),
+            'source_status': dict(system.scraper.last_source_status),
+            'jobs_scraped': sum(len(j) for j in system.scraper.last_source_results.values()),
+            'requests': fetch_clock.requests,
+            'notifications': notifier.alerts + notifier.digests,
+        }
+
+
+def _summarize(values):
+    return {
+        'mean': statistics.mean(values),
+        'min': min(values),
+        'max': max(values),
+        'stdev': statistics.stdev(values) if len(values) > 1 else 0.0,
+    }
+
+
+def _git_rev() -> str:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except Exception:
+        return 'unknown'
+
+
+def compare(result: dict, baseline: dict, tolerance: float) -> list:
+    """Stages whose mean got slower than ``baseline`` by more than ``tolerance`` (fraction)."""
+    slower = []
+    for name, stats in result['stages'].items():
+        base = baseline.get('stages', {}).get(name)
+        if not base or base['mean'] < 1e-4:
+            continue
+        change = stats['mean'] / base['mean'] - 1
+        if change > tolerance:
+            slower.append((name, base['mean'], stats['mean'], change))
+    return slower
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('mode', choices=['record', 'run'])
+    parser.add_argument('--fixtures', default=DEFAULT_FIXTURES, help='fixture store directory')
+    parser.add_argument('--runs', type=int, default=3, help='timed runs (run mode)')
+    parser.add_argument('--output', help='write JSON results here (default: stdout)')
+    parser.add_argument('--baseline', help='previous JSON results to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed slowdown vs baseline (0.2 = 20%%)')
+    args = parser.parse_args()
+
+    store = FixtureStore(args.fixtures)
+    if args.mode == 'record':
+        result = Harness(store, record=True).run_once()
+        print(f"✅ Recorded {len(store.index)} responses to {args.fixtures} "
+              f"({result['jobs_scraped']} jobs)", file=sys.stderr)
+        return 0
+
+    if not store.index:
+        print(f"❌ No fixtures in {args.fixtures} - run 'record' first", file=sys.stderr)
+        return 1
+
+    harness = Harness(store, record=False)
+    runs = [harness.run_once() for _ in range(max(1, args.runs))]
+    stage_names = sorted({name for r in runs for name in r['stages']})
+    source_names = sorted({name for r in runs for name in r['sources']})
+    result = {
+        'timestamp': datetime.now().isoformat(),
+        'git_rev': _git_rev(),
+        'python': sys.version.split()[0],
+        'runs': len(runs),
+        'total': _summarize([r['total'] for r in runs]),
+        'stages': {n: _summarize([r['stages'].get(n, 0.0) for r in runs]) for n in stage_names},
+        'sources': {n: _summarize([r['sources'].get(n, 0.0) for r in runs]) for n in source_names},
+        'source_status': runs[-1]['source_status'],
+        'jobs_scraped': runs[-1]['jobs_scraped'],
+        'requests': runs[-1]['requests'],
+        'notifications': runs[-1]['notifications'],
+        'fixture_misses': sorted(set(store.misses)),
+    }
+
+    text = json.dumps(result, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    print(f"📊 {len(runs)} run(s): {result['total']['mean'] * 1000:.1f} ms mean per check, "
+          f"{result['jobs_scraped']} jobs, {len(result['fixture_misses'])} fixture misses", file=sys.stderr)
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        slower = compare(result, baseline, args.tolerance)
+        for name, before, after, change in slower:
+            print(f"⚠️  {name}: {before * 1000:.2f} ms → {after * 1000:.2f} ms (+{change:.0%})", file=sys.stderr)
+        if slower:
+            return 2
+        print(f"✅ No stage slower than baseline by more than {args.tolerance:.0%}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,10 @@
 """
 Configuration settings for the Job Monitoring System
+
+Plain values only: importing this module has no side effects. Code reads them
+through ``config.settings.get_settings()``.
 """
 import os
-from datetime import datetime
 
 # Job Search Configuration
 JOB_SEARCH_KEYWORDS = [
@@ -27,6 +29,61 @@ JOB_SITES = {
 # Check Interval (in seconds)
 CHECK_INTERVAL = 60  # 1 minute
 
+# Adaptive per-source polling: each source gets its own interval, shortened when
+# its listing changes and lengthened when it doesn't, within these bounds.
+ADAPTIVE_SCHEDULING = os.getenv("ADAPTIVE_SCHEDULING", "true").lower() == "true"
+SOURCE_MIN_INTERVAL = int(os.getenv("SOURCE_MIN_INTERVAL", "60"))  # seconds
+SOURCE_MAX_INTERVAL = int(os.getenv("SOURCE_MAX_INTERVAL", "21600"))  # 6 hours
+# Starting interval per source label (others start at CHECK_INTERVAL)
+SOURCE_POLL_INTERVALS = {
+    "HN Hiring": 3600,
+    "Employer Sites": 1800,
+    "Greenhouse": 300,
+    "Lever": 300,
+}
+
+# Incremental fetching: remember the newest posting seen per source (stored in the
+# database) and skip / don't request anything older on the next poll
+INCREMENTAL_FETCH = os.getenv("INCREMENTAL_FETCH", "true").lower() == "true"
+
+# Upper bound on a single check cycle's scraping phase (0 = no limit)
+CHECK_DEADLINE = int(os.getenv("CHECK_DEADLINE", "45"))  # seconds
+
+# Sharding: a coordinator queues each cycle's sources (Greenhouse/Lever boards in chunks)
+# in a shared SQLite work queue and worker processes, possibly on other hosts that mount
+# the same directory, scrape them. Dedup, storage and notifications stay on the coordinator.
+SHARD_ROLE = os.getenv("SHARD_ROLE", "standalone").lower()  # standalone | coordinator | worker
+WORK_QUEUE_FILE = os.getenv("WORK_QUEUE_FILE", "data/work_queue.db")
+SHARD_BOARDS_PER_TASK = int(os.getenv("SHARD_BOARDS_PER_TASK", "5"))
+SHARD_LEASE_SECONDS = int(os.getenv("SHARD_LEASE_SECONDS", "300"))  # a dead worker's shard is re-offered after this
+SHARD_MAX_ATTEMPTS = int(os.getenv("SHARD_MAX_ATTEMPTS", "3"))
+SHARD_POLL_INTERVAL = float(os.getenv("SHARD_POLL_INTERVAL", "1.0"))  # seconds
+SHARD_STALL_TIMEOUT = int(os.getenv("SHARD_STALL_TIMEOUT", "120"))  # give up on a cycle nobody is working on
+
+# Optional Prometheus-style /metrics endpoint (stage/source timing histograms); 0 = disabled
+METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+
+# Local control API (JSON): GET /stats, POST /trigger, /reload, /pause?source=..., /resume?source=...
+# Listens on CONTROL_SOCKET (a Unix socket path) if set, else on CONTROL_HOST:CONTROL_PORT; 0 = disabled
+CONTROL_PORT = int(os.getenv("CONTROL_PORT", "0"))
+CONTROL_HOST = os.getenv("CONTROL_HOST", "127.0.0.1")
+CONTROL_SOCKET = os.getenv("CONTROL_SOCKET", "")
+
+# Warm restart: health metrics, adaptive schedules, circuit breakers and paused sources are
+# snapshotted to this file periodically and on shutdown, and restored at startup ("" = off)
+SNAPSHOT_FILE = os.getenv("SNAPSHOT_FILE", "data/state_snapshot.pkl")
+SNAPSHOT_INTERVAL = int(os.getenv("SNAPSHOT_INTERVAL", "300"))  # seconds; 0 = only on shutdown
+SNAPSHOT_MAX_AGE = int(os.getenv("SNAPSHOT_MAX_AGE", "86400"))  # older snapshots are ignored
+
+# Cycle profiling: profile the next PROFILE_CHECKS checks at startup, or PROFILE_SIGNAL_CHECKS
+# after SIGUSR1. "sample" (all threads, low overhead) writes folded stacks; "cprofile" writes .prof
+PROFILE_CHECKS = int(os.getenv("PROFILE_CHECKS", "0"))
+PROFILE_SIGNAL_CHECKS = int(os.getenv("PROFILE_SIGNAL_CHECKS", "3"))
+PROFILE_MODE = os.getenv("PROFILE_MODE", "sample").lower()  # sample | cprofile
+PROFILE_DIR = "logs/profiles"
+PROFILE_TOP = 20  # functions listed in the log summary
+
 # Telegram Configuration
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "YOUR_BOT_TOKEN_HERE")
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID", "YOUR_CHAT_ID_HERE")
@@ -45,10 +102,12 @@ SMTP_PORT = 587
 # Database Configuration
 DATABASE_FILE = "data/jobs_database.db"
 JOBS_CACHE_FILE = "data/sent_jobs.json"
+ID_CACHE_SIZE = int(os.getenv("ID_CACHE_SIZE", "10000"))  # company/location names -> dictionary ids kept in memory
 
 # Logging Configuration
 LOG_FILE = "logs/job_monitor.log"
 LOG_LEVEL = "INFO"
+LOG_FORMAT = os.getenv("LOG_FORMAT", "console").lower()  # console (human) | json (JSON lines)
 
 # Search Filters
 LOCATION_FILTER = "Remote"  # Can be "Remote", "USA", "Canada", etc.
@@ -59,6 +118,17 @@ REQUEST_TIMEOUT = 10
 RETRY_ATTEMPTS = 3
 RETRY_DELAY = 5  # seconds
 
+# Parsing stage: HTML parsing runs in worker processes fed by the fetch threads
+# (0 = parse inline in the fetch threads)
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", str(max(1, (os.cpu_count() or 2) - 1))))
+PARSE_QUEUE_SIZE = int(os.getenv("PARSE_QUEUE_SIZE", "32"))  # pages waiting to be parsed before fetchers block
+
+# Per-host rate limiting and circuit breaker (fetch layer)
+HOST_RATE_LIMIT = float(os.getenv("HOST_RATE_LIMIT", "2.0"))  # requests/second per host (shared by all shard workers)
+HOST_RATE_BURST = int(os.getenv("HOST_RATE_BURST", "5"))
+CIRCUIT_BREAKER_THRESHOLD = int(os.getenv("CIRCUIT_BREAKER_THRESHOLD", "3"))  # consecutive failures
+CIRCUIT_BREAKER_COOLDOWN = int(os.getenv("CIRCUIT_BREAKER_COOLDOWN", "900"))  # seconds a dead host is skipped
+
 # API Keys for job boards (if needed)
 LINKEDIN_API_KEY = os.getenv("LINKEDIN_API_KEY", "")
 INDEED_API_KEY = os.getenv("INDEED_API_KEY", "")
@@ -84,6 +154,12 @@ SEARCH_LEVER = os.getenv("SEARCH_LEVER", "true").lower() == "true"
 SEARCH_REMOTEOK = os.getenv("SEARCH_REMOTEOK", "true").lower() == "true"
 SEARCH_HN_HIRING = os.getenv("SEARCH_HN_HIRING", "true").lower() == "true"
 
+# HN "Who is hiring?": the monthly thread is ingested once and cached with the IDs
+# of every processed comment; later cycles only parse comments not seen yet.
+HN_CACHE_FILE = "data/hn_cache.json"
+HN_THREAD_RECHECK = 3600  # seconds between lookups for a new month's thread
+HN_PARALLEL_THRESHOLD = 300  # comments in one batch before parsing fans out to the parse stage
+
 # Popular Greenhouse boards to monitor (company slugs)
 GREENHOUSE_BOARDS = [
     "stripe", "airbnb", "figma", "notion", "coinbase",
@@ -103,6 +179,10 @@ SEARCH_EMPLOYER_SITES = os.getenv("SEARCH_EMPLOYER_SITES", "true").lower() == "t
 SEARCH_ENGINE_ENABLED = os.getenv("SEARCH_ENGINE_ENABLED", "true").lower() == "true"
 SEARCH_ENGINE_PROVIDER = os.getenv("SEARCH_ENGINE_PROVIDER", "duckduckgo").lower()
 SEARCH_ENGINE_MAX_RESULTS = int(os.getenv("SEARCH_ENGINE_MAX_RESULTS", "15"))
+# Search results are cached on disk (EMPLOYER_CRAWL_STATE_FILE) and only re-queried after this many seconds
+SEARCH_CACHE_TTL = int(os.getenv("SEARCH_CACHE_TTL", str(6 * 3600)))
+# ...or after this many seconds when the search came back empty (often a throttled search)
+SEARCH_EMPTY_CACHE_TTL = int(os.getenv("SEARCH_EMPTY_CACHE_TTL", str(15 * 60)))
 
 # Optional: add specific employer career pages or job boards to scan directly
 # Examples:
@@ -116,6 +196,27 @@ EMPLOYER_SITE_URLS = []
 # URL path keywords to keep when using search-engine discovery
 EMPLOYER_SITE_PATH_KEYWORDS = ["careers", "career", "jobs", "job", "vacancies", "opportunities", "openings"]
 
+# Employer-site crawler: pages are fetched concurrently (bounded per domain) over
+# keep-alive connections; career URLs are also discovered from robots.txt/sitemap.xml
+EMPLOYER_CRAWL_WORKERS = int(os.getenv("EMPLOYER_CRAWL_WORKERS", "8"))
+EMPLOYER_PER_DOMAIN_LIMIT = int(os.getenv("EMPLOYER_PER_DOMAIN_LIMIT", "2"))
+EMPLOYER_SITEMAP_DISCOVERY = os.getenv("EMPLOYER_SITEMAP_DISCOVERY", "true").lower() == "true"
+EMPLOYER_SITEMAP_REFRESH = 86400  # seconds between sitemap re-reads per domain
+EMPLOYER_SITEMAP_MAX_URLS = 50  # career URLs kept per domain
+EMPLOYER_NO_JSONLD_TTL = 7 * 86400  # skip pages without JSON-LD for this long
+EMPLOYER_CRAWL_STATE_FILE = "data/employer_crawl.json"
+
+# Search profiles: serve several recipients with different interests from one scrape.
+# Sources are fetched once with the union of all keywords; each job is then matched
+# against every profile. Empty = a single profile using JOB_SEARCH_KEYWORDS and the
+# Telegram/email recipients above. Profiles don't inherit recipients.
+# SEARCH_PROFILES = [
+#     {"name": "alice", "keywords": ["data science internship"], "locations": ["Remote", "NY"],
+#      "exclude": ["unpaid"], "email_recipient": "alice@example.com"},
+#     {"name": "bob", "keywords": ["software engineer internship"], "telegram_chat_id": "123456"},
+# ]
+SEARCH_PROFILES = []
+
 # Notification mode: "instant" (one per job) or "digest" (batched per check cycle)
 NOTIFICATION_MODE = os.getenv("NOTIFICATION_MODE", "digest").lower()  # instant | digest
 
@@ -124,10 +225,3 @@ DEDUP_THRESHOLD = float(os.getenv("DEDUP_THRESHOLD", "0.85"))
 
 # Demo Mode (for testing without external APIs)
 DEMO_MODE = os.getenv("DEMO_MODE", "false").lower() == "true"
-
-print("""
-╔════════════════════════════════════════════════════════════════════╗
-║           Job & Internship Monitoring System                       ║
-║           Configuration Loaded Successfully                        ║
-╚════════════════════════════════════════════════════════════════════╝
-""")
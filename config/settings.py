@@ -0,0 +1,185 @@
+"""
+Typed settings object, built once from config/config.py
+"""
+import importlib
+import os
+import threading
+from dataclasses import dataclass, field, fields, replace
+from typing import Dict, List, Optional
+
+_DEFAULT_PATH_KEYWORDS = ["careers", "career", "jobs", "job", "vacancies", "opportunities", "openings"]
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Every value in ``config/config.py``, under its lower-case name.
+
+    Defaults only apply when an older config file lacks a setting; they match
+    the fallbacks the modules used before settings were centralised.
+    """
+
+    # Search
+    job_search_keywords: List[str] = field(default_factory=list)
+    job_sites: Dict[str, str] = field(default_factory=dict)
+    location_filter: str = "Remote"
+    employment_type: List[str] = field(default_factory=list)
+    demo_mode: bool = False
+
+    # Scheduling
+    check_interval: int = 60
+    adaptive_scheduling: bool = False
+    source_min_interval: int = 60
+    source_max_interval: int = 21600
+    source_poll_intervals: Dict[str, int] = field(default_factory=dict)
+    incremental_fetch: bool = False
+    check_deadline: int = 0
+
+    # Sharding
+    shard_role: str = "standalone"
+    work_queue_file: str = "data/work_queue.db"
+    shard_boards_per_task: int = 5
+    shard_lease_seconds: int = 300
+    shard_max_attempts: int = 3
+    shard_poll_interval: float = 1.0
+    shard_stall_timeout: int = 120
+
+    # Metrics, control API, profiling and logging
+    metrics_port: int = 0
+    metrics_host: str = "127.0.0.1"
+    control_port: int = 0
+    control_host: str = "127.0.0.1"
+    control_socket: str = ""
+    snapshot_file: str = "data/state_snapshot.pkl"
+    snapshot_interval: int = 300
+    snapshot_max_age: int = 86400
+    profile_checks: int = 0
+    profile_signal_checks: int = 3
+    profile_mode: str = "sample"
+    profile_dir: str = "logs/profiles"
+    profile_top: int = 20
+    log_file: str = "logs/job_monitor.log"
+    log_level: str = "INFO"
+    log_format: str = "console"
+
+    # Notifications
+    telegram_bot_token: str = ""
+    telegram_chat_id: str = ""
+    telegram_enabled: bool = False
+    email_sender: str = ""
+    email_password: str = ""
+    email_recipient: str = ""
+    email_enabled: bool = False
+    smtp_server: str = "smtp.gmail.com"
+    smtp_port: int = 587
+    search_profiles: List[Dict] = field(default_factory=list)
+    notification_mode: str = "digest"
+    dedup_threshold: float = 0.85
+
+    # Storage
+    database_file: str = "data/jobs_database.db"
+    jobs_cache_file: str = "data/sent_jobs.json"
+    id_cache_size: int = 10000
+
+    # Fetch layer
+    request_timeout: int = 10
+    retry_attempts: int = 3
+    retry_delay: int = 5
+    parse_workers: int = field(default_factory=lambda: max(1, (os.cpu_count() or 2) - 1))
+    parse_queue_size: int = 32
+    host_rate_limit: float = 2.0
+    host_rate_burst: int = 5
+    circuit_breaker_threshold: int = 3
+    circuit_breaker_cooldown: int = 900
+
+    # API keys
+    linkedin_api_key: str = ""
+    indeed_api_key: str = ""
+    indeed_publisher_id: str = ""
+    linkedin_api_base_url: str = "https://api.linkedin.com/v2"
+    linkedin_use_api: bool = False
+    indeed_api_base_url: str = "https://api.indeed.com/ads/apisearch"
+    indeed_use_api: bool = False
+
+    # Sources
+    search_github_jobs: bool = False
+    search_indeed: bool = False
+    search_linkedin: bool = False
+    search_stackoverflow: bool = False
+    search_greenhouse: bool = False
+    search_lever: bool = False
+    search_remoteok: bool = False
+    search_hn_hiring: bool = False
+    hn_cache_file: str = "data/hn_cache.json"
+    hn_thread_recheck: int = 3600
+    hn_parallel_threshold: int = 300
+    greenhouse_boards: List[str] = field(default_factory=list)
+    lever_boards: List[str] = field(default_factory=list)
+
+    # Employer sites / search engine discovery
+    search_employer_sites: bool = False
+    search_engine_enabled: bool = False
+    search_engine_provider: str = "duckduckgo"
+    search_engine_max_results: int = 10
+    search_cache_ttl: int = 6 * 3600
+    search_empty_cache_ttl: int = 15 * 60
+    employer_site_urls: List[str] = field(default_factory=list)
+    employer_site_path_keywords: List[str] = field(default_factory=lambda: list(_DEFAULT_PATH_KEYWORDS))
+    employer_crawl_workers: int = 8
+    employer_per_domain_limit: int = 2
+    employer_sitemap_discovery: bool = False
+    employer_sitemap_refresh: int = 86400
+    employer_sitemap_max_urls: int = 50
+    employer_no_jsonld_ttl: int = 7 * 86400
+    employer_crawl_state_file: str = "data/employer_crawl.json"
+
+
+def load_settings(module=None) -> Settings:
+    """Build a ``Settings`` from a config module (``config.config`` by default)."""
+    if module is None:
+        module = importlib.import_module("config.config")
+    values = {}
+    for f in fields(Settings):
+        name = f.name.upper()
+        if hasattr(module, name):
+            values[f.name] = getattr(module, name)
+    return Settings(**values)
+
+
+_settings: Optional[Settings] = None
+_lock = threading.Lock()
+
+
+def get_settings() -> Settings:
+    """The process-wide settings, loaded on first use."""
+    global _settings
+    if _settings is None:
+        with _lock:
+            if _settings is None:
+                _settings = load_settings()
+    return _settings
+
+
+def reload_settings() -> Settings:
+    """Re-read ``config/config.py`` (and the environment variables it consults)."""
+    global _settings
+    module = importlib.reload(importlib.import_module("config.config"))
+    with _lock:
+        _settings = load_settings(module)
+    return _settings
+
+
+def use_settings(settings: Settings) -> Settings:
+    """Make ``settings`` the process-wide settings (e.g. to roll back a rejected reload)."""
+    global _settings
+    with _lock:
+        _settings = settings
+    return _settings
+
+
+def override_settings(**changes) -> Settings:
+    """Replace individual settings for the rest of the process (tools and benchmarks)."""
+    global _settings
+    current = get_settings()
+    with _lock:
+        _settings = replace(current, **changes)
+    return _settings
@@ -7,9 +7,7 @@ import os
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from config.config import JOB_SEARCH_KEYWORDS, TELEGRAM_ENABLED, EMAIL_ENABLED
-from src.job_scraper import JobScraper
-from src.database import JobDatabase
+from config.settings import get_settings
 
 
 def example_scrape():
@@ -18,11 +16,13 @@ def example_scrape():
     print("📚 Example: Single Job Search Without Notifications")
     print("="*70 + "\n")
     
+    from src.job_scraper import JobScraper
+    keywords = get_settings().job_search_keywords
     scraper = JobScraper()
     
     # Search for jobs
     print("🔍 Searching for jobs...")
-    jobs = scraper.scrape_all_sources(JOB_SEARCH_KEYWORDS[:2])  # Use first 2 keywords
+    jobs = scraper.scrape_all_sources(keywords[:2])  # Use first 2 keywords
     
     # Display results
     print(f"\n✅ Found {len(jobs)} jobs:\n")
@@ -40,6 +40,7 @@ def example_database():
     print("📚 Example: Database Operations")
     print("="*70 + "\n")
     
+    from src.database import JobDatabase
     db = JobDatabase()
     
     # Sample job
@@ -78,10 +79,11 @@ def example_notification_config():
     print("📚 Example: Notification Configuration")
     print("="*70 + "\n")
     
+    settings = get_settings()
     print("Current configuration:")
-    print(f"  Telegram enabled: {TELEGRAM_ENABLED}")
-    print(f"  Email enabled: {EMAIL_ENABLED}")
-    print(f"  Search keywords: {', '.join(JOB_SEARCH_KEYWORDS[:3])}...")
+    print(f"  Telegram enabled: {settings.telegram_enabled}")
+    print(f"  Email enabled: {settings.email_enabled}")
+    print(f"  Search keywords: {', '.join(settings.job_search_keywords[:3])}...")
     
     print("\n💡 To enable notifications:")
     print("  1. Run: python setup.py")
@@ -5,74 +5,170 @@ Continuously checks for new job postings and sends notifications
 import sys
 import time
 import logging
-import traceback
+import argparse
+import signal
+import threading
+import pickle
 from datetime import datetime, timedelta
 from collections import deque
+from dataclasses import fields
 import os
 
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from config.config import *  # noqa: F403,F401
+from config.settings import get_settings, override_settings, reload_settings, use_settings
 from src.job_scraper import JobScraper
 from src.database import JobDatabase
 from src.notifications import NotificationManager
-
-# Ensure new config vars have defaults if missing
-try:
-    NOTIFICATION_MODE  # noqa: F405
-except NameError:
-    NOTIFICATION_MODE = 'digest'
-try:
-    DEDUP_THRESHOLD  # noqa: F405
-except NameError:
-    DEDUP_THRESHOLD = 0.85
+from src.profiles import ProfileMatcher, load_profiles, scrape_keywords
+from src.scheduler import AdaptiveScheduler
+from src import pipeline
+from src.metrics import HistogramFamily, MetricsServer, render_samples
+from src.profiler import CycleProfiler
+from src.logging_setup import configure_logging
+from src.control import CommandQueue, ControlServer
+from src.snapshot import load_snapshot, save_snapshot, validate_state
 
 # Maximum consecutive failures before pausing
 MAX_CONSECUTIVE_FAILURES = 5
 FAILURE_COOLDOWN = 300  # seconds to wait after hitting max failures
 
+# Settings a config reload can't apply to the running process (servers, files, pools)
+RESTART_SETTINGS = (
+    'database_file', 'id_cache_size', 'shard_role', 'work_queue_file', 'metrics_port', 'metrics_host',
+    'control_port', 'control_host', 'control_socket', 'log_file', 'log_level', 'log_format',
+    'parse_workers', 'parse_queue_size', 'host_rate_limit', 'host_rate_burst',
+    'circuit_breaker_threshold', 'circuit_breaker_cooldown', 'profile_dir', 'profile_mode', 'profile_top',
+)
+
 
 class HealthMetrics:
-    """Track uptime, error rates, and per-source availability."""
+    """Track uptime, error rates, per-source availability and stage/source timings.
+
+    Everything is constant-memory: windowed check times keep a running sum,
+    and timings go into fixed-bucket histograms (see ``src/metrics.py``),
+    exposed in Prometheus text format by ``to_prometheus``.
+    """
 
     def __init__(self, window_seconds: int = 3600):
         self.start_time = datetime.now()
         self._window = window_seconds
         self._errors: deque = deque()          # (timestamp, message)
         self._check_times: deque = deque()     # (timestamp, duration_sec)
+        self._check_sum = 0.0                  # running sum of durations in _check_times
         self.consecutive_failures = 0
+        self._lock = threading.Lock()          # the windows are also read from the control API thread
+        self.source_states: dict = {}          # host -> circuit breaker snapshot
+        self.source_timeouts: dict = {}        # source label -> cycles it hit the deadline
+
+        self.checks_total = 0
+        self.check_failures_total = 0
+        self.jobs_found_total = 0
+        self.new_jobs_total = 0
+        self.source_status_total: dict = {}    # (label, status) -> count
+        self.check_seconds = HistogramFamily(
+            "job_monitor_check_seconds", "Duration of successful checks.", [])
+        self.stage_seconds = HistogramFamily(
+            "job_monitor_stage_seconds", "Time per check spent in each pipeline stage.", ["stage"])
+        self.source_seconds = HistogramFamily(
+            "job_monitor_source_seconds", "Wall time to scrape each source.", ["source"])
+        self.source_stage_seconds = HistogramFamily(
+            "job_monitor_source_stage_seconds", "Per-source time in fetch, throttle and parse.", ["source", "stage"])
 
     # --- recording ---
     def record_success(self, duration: float):
         now = datetime.now()
-        self._check_times.append((now, duration))
+        with self._lock:
+            self._check_times.append((now, duration))
+            self._check_sum += duration
         self.consecutive_failures = 0
+        self.checks_total += 1
+        self.check_seconds.labels().observe(duration)
         self._prune()
 
     def record_failure(self, message: str):
         now = datetime.now()
-        self._errors.append((now, message))
+        with self._lock:
+            self._errors.append((now, message))
         self.consecutive_failures += 1
+        self.checks_total += 1
+        self.check_failures_total += 1
+        self._prune()
+
+    def record_timings(self, stage_timings: dict, source_durations: dict, source_timings: dict):
+        """Feed one check's stage timings and per-source durations/fetch/parse times into the histograms."""
+        per_stage = dict(stage_timings)
+        for label, stages in source_timings.items():
+            for stage, seconds in stages.items():
+                self.source_stage_seconds.labels(label, stage).observe(seconds)
+                per_stage[stage] = per_stage.get(stage, 0.0) + seconds
+        for stage, seconds in per_stage.items():
+            self.stage_seconds.labels(stage).observe(seconds)
+        for label, seconds in source_durations.items():
+            self.source_seconds.labels(label).observe(seconds)
+
+    def record_jobs(self, found: int, new: int):
+        self.jobs_found_total += found
+        self.new_jobs_total += new
+
+    def update_source_states(self, states: dict):
+        self.source_states = dict(states)
+
+    def record_source_status(self, status: dict):
+        for label, st in status.items():
+            key = (label, st)
+            self.source_status_total[key] = self.source_status_total.get(key, 0) + 1
+            if st == 'timed_out':
+                self.source_timeouts[label] = self.source_timeouts.get(label, 0) + 1
+
+    # --- warm restart ---
+    _COUNTERS = ('consecutive_failures', 'checks_total', 'check_failures_total', 'jobs_found_total',
+                 'new_jobs_total', 'source_status_total', 'source_timeouts')
+
+    def _families(self) -> dict:
+        return {f.name: f for f in (self.check_seconds, self.stage_seconds, self.source_seconds,
+                                    self.source_stage_seconds)}
+
+    def dump_state(self) -> dict:
+        with self._lock:
+            state = {'errors': list(self._errors), 'check_times': list(self._check_times)}
+        state.update({name: getattr(self, name) for name in self._COUNTERS})
+        state['histograms'] = {name: family.dump_state() for name, family in self._families().items()}
+        return state
+
+    def load_state(self, state: dict):
+        """Restore ``dump_state`` output; uptime still counts from this process's start."""
+        with self._lock:
+            self._errors = deque(state['errors'])
+            self._check_times = deque(state['check_times'])
+            self._check_sum = sum(d for _, d in self._check_times)
+        for name in self._COUNTERS:
+            setattr(self, name, state[name])
+        families = self._families()
+        for name, family_state in state['histograms'].items():
+            if name in families:
+                families[name].load_state(family_state)
         self._prune()
 
     # --- queries ---
+    @property
+    def open_circuits(self) -> list:
+        return sorted(h for h, st in self.source_states.items() if st.get('state') != 'closed')
+
     @property
     def uptime(self) -> timedelta:
         return datetime.now() - self.start_time
 
     @property
     def errors_last_hour(self) -> int:
-        cutoff = datetime.now() - timedelta(seconds=self._window)
-        return sum(1 for ts, _ in self._errors if ts >= cutoff)
+        self._prune()
+        return len(self._errors)
 
     @property
     def avg_check_duration(self) -> float:
-        if not self._check_times:
-            return 0.0
-        cutoff = datetime.now() - timedelta(seconds=self._window)
-        recent = [d for ts, d in self._check_times if ts >= cutoff]
-        return sum(recent) / len(recent) if recent else 0.0
+        self._prune()
+        return self._check_sum / len(self._check_times) if self._check_times else 0.0
 
     def should_cooldown(self) -> bool:
         return self.consecutive_failures >= MAX_CONSECUTIVE_FAILURES
@@ -84,47 +180,110 @@ class HealthMetrics:
             f"Uptime {hh}h{mm:02d}m | "
             f"Errors/hr {self.errors_last_hour} | "
             f"Avg check {self.avg_check_duration:.1f}s | "
-            f"Consecutive fails {self.consecutive_failures}"
+            f"Consecutive fails {self.consecutive_failures} | "
+            f"Open circuits {len(self.open_circuits)}"
         )
 
+    def to_prometheus(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        lines = []
+        lines += render_samples("job_monitor_uptime_seconds", "Seconds since the monitor started.", "gauge",
+                                [((), round(self.uptime.total_seconds(), 1))])
+        lines += render_samples("job_monitor_checks_total", "Checks run.", "counter", [((), self.checks_total)])
+        lines += render_samples("job_monitor_check_failures_total", "Checks that raised.", "counter",
+                                [((), self.check_failures_total)])
+        lines += render_samples("job_monitor_consecutive_failures", "Failed checks in a row.", "gauge",
+                                [((), self.consecutive_failures)])
+        lines += render_samples("job_monitor_jobs_found_total", "Jobs returned by all sources.", "counter",
+                                [((), self.jobs_found_total)])
+        lines += render_samples("job_monitor_new_jobs_total", "Jobs stored as new.", "counter",
+                                [((), self.new_jobs_total)])
+        lines += render_samples(
+            "job_monitor_source_checks_total", "Source scrapes by outcome.", "counter",
+            [((("source", label), ("status", st)), n) for (label, st), n in sorted(self.source_status_total.items())])
+        lines += render_samples(
+            "job_monitor_circuit_open", "1 while a host's circuit breaker is not closed.", "gauge",
+            [((("host", host),), int(st.get('state') != 'closed')) for host, st in sorted(self.source_states.items())])
+        for family in (self.check_seconds, self.stage_seconds, self.source_seconds, self.source_stage_seconds):
+            lines += family.render()
+        return "\n".join(lines) + "\n"
+
     def _prune(self):
-        cutoff = datetime.now() - timedelta(seconds=self._window * 2)
-        while self._errors and self._errors[0][0] < cutoff:
-            self._errors.popleft()
-        while self._check_times and self._check_times[0][0] < cutoff:
-            self._check_times.popleft()
+        cutoff = datetime.now() - timedelta(seconds=self._window)
+        with self._lock:
+            while self._errors and self._errors[0][0] < cutoff:
+                self._errors.popleft()
+            while self._check_times and self._check_times[0][0] < cutoff:
+                _, duration = self._check_times.popleft()
+                self._check_sum -= duration
+            if not self._check_times:
+                self._check_sum = 0.0  # drop accumulated float error
 
 
 class JobMonitoringSystem:
     def __init__(self):
+        self.settings = get_settings()
         self.setup_logging()
         self.logger = logging.getLogger(__name__)
         
-        self.scraper = JobScraper(timeout=REQUEST_TIMEOUT)
-        self.database = JobDatabase(DATABASE_FILE)
+        if self.settings.shard_role == 'coordinator':
+            from src.sharding import ShardingScraper
+            self.scraper = ShardingScraper(timeout=self.settings.request_timeout)
+        else:
+            self.scraper = JobScraper(timeout=self.settings.request_timeout)
+        self.database = JobDatabase(self.settings.database_file, id_cache_size=self.settings.id_cache_size)
+        if self.settings.incremental_fetch:
+            self.scraper.load_cursors(self.database.get_source_cursors())
         
-        # Import config module to pass to NotificationManager
-        import config.config as config_module
-        self.notifications = NotificationManager(config_module)
+        self._load_profiles()
         
         self.check_count = 0
         self.jobs_found = 0
         self.notifications_sent = 0
         self.health = HealthMetrics()
+        # Exclusive seconds per pipeline stage (scrape, dedup, rank, db_*, notify) of the last check
+        self.last_stage_timings = {}
+
+        self.profiler = CycleProfiler(self.settings.profile_dir, self.settings.profile_mode,
+                                      top=self.settings.profile_top)
+        if self.settings.profile_checks:
+            self.profiler.arm(self.settings.profile_checks)
+
+        self.scheduler = None
+        if self.settings.adaptive_scheduling:
+            self.scheduler = AdaptiveScheduler(
+                self.scraper.source_labels(),
+                base_interval=self.settings.check_interval,
+                min_interval=self.settings.source_min_interval,
+                max_interval=self.settings.source_max_interval,
+                initial_intervals=self.settings.source_poll_intervals,
+            )
+
+        # Control API requests are queued here and executed by the run loop between checks
+        self.commands = CommandQueue()
+        self.paused_sources = set()
+
+        self._snapshot_at = time.monotonic()
+        self.restore_state()
+
+    def _load_profiles(self):
+        # One scrape serves every search profile: sources are queried with the union of
+        # their keywords, then each new job is matched against all profiles at once
+        self.profiles, self.matcher, self.search_keywords, self.notifiers = self._build_profiles(self.settings)
+
+    @staticmethod
+    def _build_profiles(settings):
+        """Profiles, their matcher, the union of their keywords and their notifiers for ``settings``."""
+        profiles = load_profiles(settings)
+        notifiers = {p.name: NotificationManager(p.notification_settings(settings)) for p in profiles}
+        return profiles, ProfileMatcher(profiles), scrape_keywords(profiles, settings.job_search_keywords), notifiers
     
     def setup_logging(self):
-        """Setup logging configuration"""
+        """Queue-based logging: console (human) or JSON lines, see LOG_FORMAT"""
         os.makedirs('logs', exist_ok=True)
-        
-        logging.basicConfig(
-            level=LOG_LEVEL,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(LOG_FILE),
-                logging.StreamHandler()
-            ]
-        )
-    
+        configure_logging(level=self.settings.log_level, log_file=self.settings.log_file,
+                          fmt=self.settings.log_format)
+
     def display_banner(self):
         """Display application banner"""
         banner = """
@@ -137,52 +296,93 @@ class JobMonitoringSystem:
 ║                                                                    ║
 ╚════════════════════════════════════════════════════════════════════╝
         """
-        print(banner)
+        self.logger.info(banner)
     
-    def check_new_jobs(self):
-        """Check for new jobs and send notifications (self-recovering)."""
+    def check_new_jobs(self, sources=None):
+        """Check for new jobs and send notifications (self-recovering).
+
+        ``sources`` limits the check to the given source labels (all when None).
+        Profiled when the cycle profiler is armed (PROFILE_CHECKS or SIGUSR1).
+        """
+        with self.profiler.cycle(f"check-{self.check_count + 1}"):
+            self._check_new_jobs(sources)
+
+    def _check_new_jobs(self, sources=None):
         self.check_count += 1
         
-        print(f"\n{'='*70}")
-        print(f"🔍 Check #{self.check_count} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"{'='*70}")
+        self.logger.info("%s", '='*70)
+        self.logger.info("🔍 Check #%s - %s", self.check_count, datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        self.logger.info("%s", '='*70)
         
         t0 = time.time()
         try:
-            # Scrape jobs from all sources
-            jobs = self.scraper.scrape_all_sources(JOB_SEARCH_KEYWORDS)
-            self.jobs_found += len(jobs)
-
-            # Fuzzy deduplication
-            jobs = self.scraper.deduplicate_jobs(jobs, threshold=DEDUP_THRESHOLD)
-
-            # Relevance scoring & ranking
-            jobs = self.scraper.rank_jobs(jobs, JOB_SEARCH_KEYWORDS)
-            
-            # Filter to only truly new jobs
+            # Streaming pipeline: each source's jobs are deduplicated, scored, stored
+            # and (in instant mode) sent as soon as that source finishes
+            dedup = pipeline.Dedup(threshold=self.settings.dedup_threshold)
             new_jobs = []
-            for job in jobs:
-                job_id = job.get('job_id')
-                if not job_id:
-                    job['job_id'] = self.scraper.generate_job_id(job)
-                    job_id = job['job_id']
-                if not self.database.job_exists(job_id):
-                    if self.database.add_job(job):
-                        new_jobs.append(job)
-
-            # Send notifications
-            if new_jobs:
-                if NOTIFICATION_MODE == 'digest':
-                    if self.notifications.send_digest(new_jobs):
-                        for job in new_jobs:
-                            self.database.mark_job_sent(job['job_id'], 'digest')
-                        self.notifications_sent += len(new_jobs)
-                else:
-                    for job in new_jobs:
-                        if self.notifications.send_job_alert(job):
-                            self.database.mark_job_sent(job['job_id'], 'multi-channel')
-                            self.notifications_sent += 1
+            digests = {}  # profile -> [(score, job)] in digest mode
+
+            def _on_new_job(job):
+                new_jobs.append(job)
+                if self.settings.notification_mode != 'digest':
+                    self._send_alerts(job)
+                    return
+                for profile, score in self.matcher.match(job):
+                    digests.setdefault(profile, []).append((score, job))
+
+            timer = pipeline.StageTimer()
+            stream = pipeline.build_pipeline(
+                self.scraper.iter_source_results(self.search_keywords, sources=sources),
+                pipeline.flatten,
+                pipeline.normalize,
+                dedup,
+                pipeline.score(self.search_keywords),
+                pipeline.only_new(self.database),
+                pipeline.persist(self.database),
+                pipeline.notify_each(_on_new_job),
+                timer=timer,
+            )
+            for _job in stream:
+                pass
+            self.last_stage_timings = timer.exclusive()
+
+            found_count = sum(len(j) for j in self.scraper.last_source_results.values())
+            self.jobs_found += found_count
+            if dedup.removed:
+                self.logger.info("🧹 Removed %s near-duplicate job(s)", dedup.removed)
+            new_jobs.sort(key=lambda j: j.get('relevance_score', 0), reverse=True)
+
+            self.health.update_source_states(self.scraper.source_health())
+            self.health.record_source_status(self.scraper.last_source_status)
+            if self.scheduler:
+                for label, status in self.scraper.last_source_status.items():
+                    source_jobs = self.scraper.last_source_results.get(label, [])
+                    self.scheduler.record(label, [j['job_id'] for j in source_jobs if j.get('job_id')],
+                                          ok=status == 'ok')
+
+            # Everything scraped is stored: advance the per-source high-water marks
+            if self.settings.incremental_fetch:
+                cursors = self.scraper.pending_cursors()
+                if cursors:
+                    self.database.save_source_cursors(cursors)
+                    self.scraper.commit_cursors(cursors)
+
+            # Digest mode: one message per profile with its matches this cycle, best first
+            if digests:
+                notify_start = time.perf_counter()
+                for profile, matched in digests.items():
+                    matched.sort(key=lambda m: m[0], reverse=True)
+                    jobs = [job for _, job in matched]
+                    if self.notifiers[profile.name].send_digest(jobs):
+                        for job in jobs:
+                            self.database.mark_job_sent(job['job_id'], profile.channel('digest'))
+                        self.notifications_sent += len(jobs)
+                self.last_stage_timings['notify'] = (self.last_stage_timings.get('notify', 0.0)
+                                                     + time.perf_counter() - notify_start)
             
+            self.health.record_timings(self.last_stage_timings, self.scraper.last_source_durations,
+                                       self.scraper.last_source_timings)
+            self.health.record_jobs(found_count, len(new_jobs))
             duration = time.time() - t0
             self.health.record_success(duration)
 
@@ -190,79 +390,317 @@ class JobMonitoringSystem:
             if self.check_count % 50 == 0:
                 try:
                     self.database.cleanup_old_jobs(days=90)
+                    self.database.compact_descriptions()
                     self.database.vacuum()
                     self.logger.info("Periodic DB maintenance completed")
                 except Exception as maint_err:
-                    self.logger.warning(f"DB maintenance error (non-fatal): {maint_err}")
+                    self.logger.warning("DB maintenance error (non-fatal): %s", maint_err)
 
             # Display statistics
             db_stats = self.database.get_job_count()
-            print(f"\n📊 Statistics:")
-            print(f"   Total jobs in database: {sum(db_stats.values())}")
-            print(f"   Pending notifications: {db_stats.get('pending', 0)}")
-            print(f"   Sent notifications: {db_stats.get('sent', 0)}")
-            print(f"   New jobs this check: {len(new_jobs)}")
+            self.logger.info(
+                "📊 Statistics:\n"
+                "   Total jobs in database: %s\n"
+                "   Pending notifications: %s\n"
+                "   Sent notifications: %s\n"
+                "   New jobs this check: %s\n"
+                "   Total checks: %s\n"
+                "   Total notifications sent: %s\n"
+                "   ⚡ %s",
+                sum(db_stats.values()), db_stats.get('pending', 0), db_stats.get('sent', 0), len(new_jobs),
+                self.check_count, self.notifications_sent, self.health.summary(),
+                extra={'check': self.check_count, 'new_jobs': len(new_jobs), 'duration': round(duration, 3),
+                       'stages': {k: round(v, 4) for k, v in self.last_stage_timings.items()}},
+            )
             if new_jobs:
                 top = new_jobs[0]
-                print(f"   🏆 Top match: {top.get('title','')} @ {top.get('company','')} (score {top.get('relevance_score',0)})")
-            print(f"   Total checks: {self.check_count}")
-            print(f"   Total notifications sent: {self.notifications_sent}")
-            print(f"   ⚡ {self.health.summary()}")
+                self.logger.info("   🏆 Top match: %s @ %s (score %s)",
+                                 top.get('title', ''), top.get('company', ''), top.get('relevance_score', 0))
+            for host in self.health.open_circuits:
+                st = self.health.source_states[host]
+                self.logger.info("   ⏸️  %s: circuit %s (retry in %.0fs)", host, st['state'], st['retry_in'])
             
             if not new_jobs:
-                print(f"   ✅ No new jobs found (already sent or no matches)")
+                self.logger.info("   ✅ No new jobs found (already sent or no matches)")
             
         except Exception as e:
             duration = time.time() - t0
             self.health.record_failure(str(e))
-            self.logger.error(f"Error during job check #{self.check_count}: {e}\n{traceback.format_exc()}")
-            print(f"❌ Error during check: {e}")
-            print(f"   ⚡ {self.health.summary()}")
+            self.logger.error("❌ Error during check #%s: %s", self.check_count, e, exc_info=True)
+            self.logger.info("   ⚡ %s", self.health.summary())
     
     def run(self):
         """Main monitoring loop — self-recovering with cooldown."""
         self.display_banner()
+        settings = self.settings
         
-        print(f"\n⚙️  Configuration:")
-        print(f"   Check interval: {CHECK_INTERVAL} seconds")
-        print(f"   Telegram enabled: {TELEGRAM_ENABLED}")
-        print(f"   Email enabled: {EMAIL_ENABLED}")
-        print(f"   Keywords: {', '.join(JOB_SEARCH_KEYWORDS[:3])}...")
-        print(f"   Max consecutive failures before cooldown: {MAX_CONSECUTIVE_FAILURES}")
-        print(f"\n⏰ Starting monitoring system...")
-        print(f"📝 Press Ctrl+C to stop\n")
+        self.logger.info("⚙️  Configuration:")
+        self.logger.info("   Check interval: %s seconds", settings.check_interval)
+        if self.scheduler:
+            self.logger.info("   Adaptive scheduling: %ss–%ss per source",
+                             settings.source_min_interval, settings.source_max_interval)
+        self.logger.info("   Check deadline: %s%s", settings.check_deadline or 'none',
+                         's' if settings.check_deadline else '')
+        if settings.shard_role == 'coordinator':
+            self.logger.info("   Sharding: coordinator, work queue %s", settings.work_queue_file)
+        self.logger.info("   Telegram enabled: %s", settings.telegram_enabled)
+        self.logger.info("   Email enabled: %s", settings.email_enabled)
+        self.logger.info("   Keywords: %s...", ', '.join(self.search_keywords[:3]))
+        if len(self.profiles) > 1:
+            self.logger.info("   Search profiles: %s (%s)", len(self.profiles),
+                             ', '.join(p.name for p in self.profiles[:5]))
+        self.logger.info("   Max consecutive failures before cooldown: %s", MAX_CONSECUTIVE_FAILURES)
+        if hasattr(signal, 'SIGUSR1'):
+            # `kill -USR1 <pid>` profiles the next few checks without a restart
+            # (the handler only bumps a counter; the next check picks it up and logs it)
+            signal.signal(signal.SIGUSR1,
+                          lambda *_: self.profiler.arm_from_signal(self.settings.profile_signal_checks))
+            self.logger.info("   Profiling: kill -USR1 %s profiles the next %s checks",
+                             os.getpid(), settings.profile_signal_checks)
+        metrics_server = None
+        if settings.metrics_port:
+            try:
+                metrics_server = MetricsServer(self.health.to_prometheus, settings.metrics_host,
+                                               settings.metrics_port).start()
+                self.logger.info("   Metrics: http://%s:%s/metrics", settings.metrics_host, metrics_server.port)
+            except OSError as e:
+                self.logger.warning("Metrics endpoint not started: %s", e)
+        control_server = None
+        if settings.control_socket or settings.control_port:
+            try:
+                control_server = ControlServer(self.commands, self.stats, settings.control_host,
+                                               settings.control_port, settings.control_socket).start()
+                self.logger.info("   Control API: %s (/stats, /trigger, /reload, /pause, /resume)",
+                                 control_server.address)
+            except OSError as e:
+                self.logger.warning("Control API not started: %s", e)
+        self.logger.info("⏰ Starting monitoring system...")
+        self.logger.info("📝 Press Ctrl+C to stop")
         
         try:
             while True:
                 # Cooldown if too many consecutive failures
                 if self.health.should_cooldown():
-                    self.logger.warning(
-                        f"{MAX_CONSECUTIVE_FAILURES} consecutive failures — "
-                        f"cooling down for {FAILURE_COOLDOWN}s"
-                    )
-                    print(
-                        f"\n⚠️  {MAX_CONSECUTIVE_FAILURES} consecutive failures. "
-                        f"Pausing {FAILURE_COOLDOWN}s before retrying..."
-                    )
-                    time.sleep(FAILURE_COOLDOWN)
+                    self.logger.warning("⚠️  %s consecutive failures. Pausing %ss before retrying...",
+                                        MAX_CONSECUTIVE_FAILURES, FAILURE_COOLDOWN)
+                    self.wait(FAILURE_COOLDOWN)
                     self.health.consecutive_failures = 0  # reset after cooldown
 
-                self.check_new_jobs()
+                if self.scheduler:
+                    due = self.scheduler.due()
+                    paused = [l for l in due if l in self.paused_sources]
+                    due = [l for l in due if l not in self.paused_sources]
+                    if due:
+                        self.check_new_jobs(sources=due)
+                        self.scheduler.postpone(due)  # no-op unless the check crashed before recording
+                    self.scheduler.postpone(paused)
+                    self._maybe_save_state()
+                    wait = self.scheduler.seconds_until_next()
+                    upcoming = [l for l, st in self.scheduler.snapshot().items() if st['due_in'] <= wait + 1]
+                    self.logger.info("⏳ Next check in %.0f seconds (%s)...", wait, ', '.join(upcoming))
+                    self.wait(wait)
+                    continue
+
+                sources = self._active_sources()
+                if sources is None or sources:
+                    self.check_new_jobs(sources=sources)
+                self._maybe_save_state()
                 
-                print(f"\n⏳ Next check in {CHECK_INTERVAL} seconds...")
-                print(f"   (This is {CHECK_INTERVAL // 60} minute{'s' if CHECK_INTERVAL > 60 else ''})")
+                self.logger.info("⏳ Next check in %s seconds...", self.settings.check_interval)
+                self.logger.info("   (This is %s minute%s)",
+                                 self.settings.check_interval // 60, 's' if self.settings.check_interval > 60 else '')
                 
-                time.sleep(CHECK_INTERVAL)
+                self.wait(self.settings.check_interval)
         
         except KeyboardInterrupt:
             self.logger.info("Monitoring system stopped by user")
             self.display_shutdown_message()
         
         except Exception as e:
-            self.logger.critical(f"Fatal error in main loop: {e}\n{traceback.format_exc()}")
-            print(f"\n❌ Fatal error: {e}")
+            self.logger.critical("❌ Fatal error in main loop: %s", e, exc_info=True)
             self.display_shutdown_message()
+
+        finally:
+            self.save_state()
+            if control_server is not None:
+                control_server.stop()
+            if metrics_server is not None:
+                metrics_server.stop()
+            self.scraper.close()
     
+    def wait(self, seconds: float):
+        """Sleep until the next check, running control API commands as they arrive.
+
+        Returns early after a config reload when the adaptive scheduler is on,
+        so newly enabled sources are picked up right away.
+        """
+        until = time.monotonic() + seconds
+        while True:
+            command = self.commands.wait(until - time.monotonic())
+            if command is None:
+                return
+            self.handle_command(command)
+            if command.name == 'reload' and self.scheduler:
+                return
+
+    def handle_command(self, command):
+        """Execute one control API command on the loop thread and resolve its result."""
+        if not command.result.set_running_or_notify_cancel():
+            return
+        self.logger.info("🎛️  Control: %s%s", command.name, f" {', '.join(command.sources)}" if command.sources else "",
+                         extra={'command': command.name, 'sources': command.sources})
+        try:
+            if command.name == 'reload':
+                result = self.reload_config()
+            else:
+                labels = self.scraper.source_labels()
+                unknown = [l for l in command.sources if l not in labels]
+                if unknown:
+                    raise ValueError(f"unknown source(s) {', '.join(unknown)}; enabled: {', '.join(labels)}")
+                if command.name == 'pause':
+                    self.paused_sources.update(command.sources)
+                    result = {'paused': sorted(self.paused_sources)}
+                elif command.name == 'resume':
+                    self.paused_sources.difference_update(command.sources)
+                    result = {'paused': sorted(self.paused_sources)}
+                else:
+                    sources = command.sources or self._active_sources()
+                    self.check_new_jobs(sources=sources)
+                    result = {'check': self.check_count, 'sources': dict(self.scraper.last_source_status)}
+        except Exception as e:
+            self.logger.error("❌ Control command %s failed: %s", command.name, e)
+            command.result.set_exception(e)
+        else:
+            command.result.set_result(result)
+
+    def _active_sources(self):
+        """Source labels minus the paused ones; None (= all) when nothing is paused."""
+        if not self.paused_sources:
+            return None
+        return [l for l in self.scraper.source_labels() if l not in self.paused_sources]
+
+    def reload_config(self) -> dict:
+        """Re-read the configuration without a restart.
+
+        The scraper (HTTP session, caches, cursors, parse pool), the database
+        connection, health metrics and scheduler state are kept; profiles,
+        notifiers and the source list are rebuilt. Values in ``RESTART_SETTINGS``
+        keep their running value until the next restart.
+
+        Profiles and notifiers are built from the new settings first; if that
+        fails, the running configuration is left exactly as it was.
+        """
+        old = self.settings
+        try:
+            new = reload_settings()
+            kept = {name: getattr(old, name) for name in RESTART_SETTINGS
+                    if getattr(new, name) != getattr(old, name)}
+            if kept:
+                new = override_settings(**kept)
+            profiles = self._build_profiles(new)
+        except Exception:
+            use_settings(old)
+            raise
+        if kept:
+            self.logger.warning("⚠️  Restart needed to apply: %s", ', '.join(sorted(kept)))
+        changed = sorted(f.name for f in fields(new) if getattr(new, f.name) != getattr(old, f.name))
+
+        self.settings = new
+        self.scraper.apply_settings(new)
+        if new.incremental_fetch and not old.incremental_fetch:
+            self.scraper.load_cursors(self.database.get_source_cursors())
+        self.profiles, self.matcher, self.search_keywords, self.notifiers = profiles
+        if new.adaptive_scheduling:
+            labels = self.scraper.source_labels()
+            if self.scheduler is None:
+                self.scheduler = AdaptiveScheduler(labels, new.check_interval, new.source_min_interval,
+                                                   new.source_max_interval, new.source_poll_intervals)
+            else:
+                self.scheduler.sync(labels, new.check_interval, new.source_min_interval,
+                                    new.source_max_interval, new.source_poll_intervals)
+        else:
+            self.scheduler = None
+        self.logger.info("🔄 Configuration reloaded: %s", ', '.join(changed) or 'no changes')
+        return {'changed': changed, 'restart_required': sorted(kept)}
+
+    def stats(self) -> dict:
+        """Live state for the control API (called from its thread; reads only)."""
+        status = dict(self.scraper.last_source_status)
+        schedule = self.scheduler.snapshot() if self.scheduler else {}
+        return {
+            'pid': os.getpid(),
+            'uptime_seconds': round(self.health.uptime.total_seconds(), 1),
+            'checks': self.check_count,
+            'jobs_found': self.jobs_found,
+            'notifications_sent': self.notifications_sent,
+            'errors_last_hour': self.health.errors_last_hour,
+            'avg_check_seconds': round(self.health.avg_check_duration, 3),
+            'consecutive_failures': self.health.consecutive_failures,
+            'open_circuits': self.health.open_circuits,
+            'last_stage_seconds': {k: round(v, 4) for k, v in dict(self.last_stage_timings).items()},
+            'profiles': [p.name for p in self.profiles],
+            'sources': {
+                label: {'status': status.get(label), 'paused': label in self.paused_sources,
+                        **schedule.get(label, {})}
+                for label in self.scraper.source_labels()
+            },
+        }
+
+    def save_state(self):
+        """Snapshot metrics, schedules, breakers and pauses to SNAPSHOT_FILE for a warm restart."""
+        path = self.settings.snapshot_file
+        if not path:
+            return
+        state = {
+            'system': {'check_count': self.check_count, 'jobs_found': self.jobs_found,
+                       'notifications_sent': self.notifications_sent,
+                       'paused_sources': sorted(self.paused_sources)},
+            'health': self.health.dump_state(),
+            'scheduler': self.scheduler.dump_state() if self.scheduler else {},
+            'scraper': self.scraper.dump_state(),
+        }
+        start = time.perf_counter()
+        try:
+            size = save_snapshot(path, state)
+        except (OSError, pickle.PicklingError) as e:
+            self.logger.warning("⚠️  Could not write snapshot %s: %s", path, e)
+            return
+        self._snapshot_at = time.monotonic()
+        self.logger.debug("Snapshot written to %s (%s bytes, %.1f ms)", path, size,
+                          (time.perf_counter() - start) * 1000)
+
+    def restore_state(self):
+        """Load the last snapshot, if recent enough, so the first cycles run warm."""
+        path = self.settings.snapshot_file
+        if not path:
+            return
+        try:
+            loaded = load_snapshot(path, max_age=self.settings.snapshot_max_age)
+            if loaded is None:
+                return
+            state, elapsed = loaded
+            # Refuse the whole snapshot up front rather than stop half way through restoring it
+            validate_state(state)
+        except Exception as e:
+            self.logger.warning("⚠️  Snapshot %s doesn't match this version (%s); starting cold", path, e)
+            return
+        system = state['system']
+        self.check_count = system['check_count']
+        self.jobs_found = system['jobs_found']
+        self.notifications_sent = system['notifications_sent']
+        self.paused_sources = set(system['paused_sources'])
+        self.health.load_state(state['health'])
+        if self.scheduler:
+            self.scheduler.load_state(state['scheduler'], elapsed)
+        self.scraper.load_state(state['scraper'], elapsed)
+        self.logger.info("♻️  Restored state from %s (saved %.0fs ago, %s checks)", path, elapsed,
+                         self.check_count)
+
+    def _maybe_save_state(self):
+        interval = self.settings.snapshot_interval
+        if interval and time.monotonic() - self._snapshot_at >= interval:
+            self.save_state()
+
     def display_shutdown_message(self):
         """Display shutdown message with statistics"""
         hh, rem = divmod(int(self.health.uptime.total_seconds()), 3600)
@@ -284,12 +722,9 @@ class JobMonitoringSystem:
 
 ✅ System stopped gracefully. Thank you for using Job Monitoring System!
         """
-        print(shutdown_msg)
-        self.logger.info(
-            f"Monitoring stopped. Checks: {self.check_count}, "
-            f"Jobs: {self.jobs_found}, Notifications: {self.notifications_sent}, "
-            f"Uptime: {hh}h{mm:02d}m"
-        )
+        self.logger.info(shutdown_msg)
+        self.logger.info("Monitoring stopped. Checks: %s, Jobs: %s, Notifications: %s, Uptime: %sh%02dm",
+                         self.check_count, self.jobs_found, self.notifications_sent, hh, mm)
 
     def notify_if_new(self, job: dict) -> bool:
         """Send notification only if job doesn't exist yet."""
@@ -303,16 +738,59 @@ class JobMonitoringSystem:
             return False
 
         if self.database.add_job(job):
-            if self.notifications.send_job_alert(job):
-                self.database.mark_job_sent(job_id, 'multi-channel')
-                self.notifications_sent += 1
+            self._send_alerts(job)
             return True
 
         return False
 
+    def _send_alerts(self, job: dict) -> int:
+        """Instant alert to every profile ``job`` matches; returns how many were sent."""
+        sent = 0
+        for profile, _score in self.matcher.match(job):
+            if self.notifiers[profile.name].send_job_alert(job):
+                self.database.mark_job_sent(job['job_id'], profile.channel('multi-channel'))
+                sent += 1
+        self.notifications_sent += sent
+        return sent
+
+
+def run_worker(worker_id=None):
+    """Scrape shards queued by a coordinator until interrupted (``--role worker``)."""
+    from src.sharding import ShardWorker
+    from src.work_queue import WorkQueue
+
+    settings = get_settings()
+    os.makedirs('logs', exist_ok=True)
+    configure_logging(level=settings.log_level, log_file=settings.log_file, fmt=settings.log_format)
+    logger = logging.getLogger(__name__)
+    scraper = JobScraper(timeout=settings.request_timeout)
+    worker = ShardWorker(WorkQueue(settings.work_queue_file, max_attempts=settings.shard_max_attempts),
+                         scraper, worker_id=worker_id, lease_seconds=settings.shard_lease_seconds,
+                         poll_interval=settings.shard_poll_interval, host_rate=settings.host_rate_limit,
+                         host_burst=settings.host_rate_burst)
+    try:
+        worker.run()
+    except KeyboardInterrupt:
+        logger.info("🛑 Worker %s stopped: %s shards done, %s failed",
+                    worker.worker_id, worker.completed, worker.failed)
+    finally:
+        scraper.close()
+
 
 def main():
     """Entry point"""
+    parser = argparse.ArgumentParser(description="Job & internship monitoring system")
+    parser.add_argument('--role', choices=['standalone', 'coordinator', 'worker'],
+                        help='standalone (default, SHARD_ROLE), coordinator (queue sources for '
+                             'workers) or worker (scrape queued sources)')
+    parser.add_argument('--worker-id', help='worker name in the queue (default host:pid)')
+    args = parser.parse_args()
+    if args.role:
+        override_settings(shard_role=args.role)
+
+    if get_settings().shard_role == 'worker':
+        run_worker(args.worker_id)
+        return
     system = JobMonitoringSystem()
     system.run()
 
@@ -2,7 +2,6 @@
 Setup script for initial configuration
 """
 import os
-from config.config import *
 
 
 def setup_environment():
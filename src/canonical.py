@@ -0,0 +1,71 @@
+"""
+Canonical company and location names, and the LRU cache of their dictionary-table ids
+"""
+import re
+import unicodedata
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Hashable, Optional
+
+# Trailing words that name a legal form, not the company: "Stripe, Inc." is Stripe
+_LEGAL_FORMS = {
+    'inc', 'incorporated', 'llc', 'ltd', 'limited', 'corp', 'corporation', 'co', 'company', 'plc',
+    'gmbh', 'ag', 'sa', 'sas', 'bv', 'nv', 'ab', 'oy', 'pbc', 'lp', 'llp', 'pty', 'srl', 'spa',
+}
+_SEPARATOR_RE = re.compile(r"[^\w&+#]+")
+
+
+def _words(text: str):
+    text = unicodedata.normalize('NFKD', text or '')
+    text = "".join(ch for ch in text if not unicodedata.combining(ch)).lower()
+    # Dots join rather than split, so "L.L.C." is "llc" and "Inc." is "inc"
+    return _SEPARATOR_RE.sub(" ", text.replace(".", "")).split()
+
+
+@lru_cache(maxsize=65536)
+def company_key(name: str) -> str:
+    """Canonical form of a company name: "Stripe", "stripe" and "Stripe, Inc." are all "stripe".
+
+    Case, accents, punctuation, a leading "The" and trailing legal forms
+    (Inc, LLC, GmbH, ...) are dropped. A name that is nothing but those keeps them.
+    """
+    words = _words(name)
+    if len(words) > 1 and words[0] == 'the':
+        words = words[1:]
+    while len(words) > 1 and words[-1] in _LEGAL_FORMS:
+        words.pop()
+    return " ".join(words)
+
+
+@lru_cache(maxsize=65536)
+def location_key(name: str) -> str:
+    """Canonical form of a location: "Remote - US" and "remote (US)" are both "remote us"."""
+    return " ".join(_words(name))
+
+
+class IdCache:
+    """Bounded LRU map from names as written to their dictionary-table ids."""
+
+    def __init__(self, maxsize: int = 10000):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._ids: "OrderedDict[Hashable, int]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[int]:
+        entity_id = self._ids.get(key)
+        if entity_id is None:
+            self.misses += 1
+            return None
+        self._ids.move_to_end(key)
+        self.hits += 1
+        return entity_id
+
+    def put(self, key: Hashable, entity_id: int):
+        self._ids[key] = entity_id
+        self._ids.move_to_end(key)
+        while len(self._ids) > self.maxsize:
+            self._ids.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._ids)
@@ -0,0 +1,156 @@
+"""
+Local control API for the monitoring daemon: trigger a check, reload config, pause sources, stats
+"""
+import json
+import logging
+import os
+import queue
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from typing import Callable, Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+logger = logging.getLogger(__name__)
+
+# POST endpoints and the command each one queues
+COMMANDS = {'/trigger': 'trigger', '/reload': 'reload', '/pause': 'pause', '/resume': 'resume'}
+
+
+class Command:
+    """A request from the control API, executed by the daemon loop; ``result`` resolves when done."""
+
+    def __init__(self, name: str, sources: Optional[List[str]] = None):
+        self.name = name
+        self.sources = sources or []
+        self.result: Future = Future()
+
+    def __repr__(self):
+        return f"Command({self.name!r}, {self.sources!r})"
+
+
+class CommandQueue:
+    """Hands commands from the API threads to the daemon loop, which is their only executor.
+
+    The loop calls ``wait(timeout)`` instead of sleeping between checks, so a
+    command is picked up immediately, and checks, reloads and pauses never run
+    concurrently with each other.
+    """
+
+    def __init__(self):
+        self._queue: "queue.Queue[Command]" = queue.Queue()
+
+    def submit(self, name: str, sources: Optional[List[str]] = None) -> Command:
+        command = Command(name, sources)
+        self._queue.put(command)
+        return command
+
+    def wait(self, timeout: Optional[float]) -> Optional[Command]:
+        """Next command, or None once ``timeout`` seconds pass without one."""
+        try:
+            return self._queue.get(timeout=None if timeout is None else max(0.0, timeout))
+        except queue.Empty:
+            return None
+
+
+class ControlServer:
+    """JSON over HTTP on a loopback port or a Unix socket, served from a daemon thread.
+
+        GET  /stats                  live counters, source status and schedule
+        POST /trigger[?source=...]   run a check now (all or the given sources)
+        POST /reload                 re-read config/config.py, keeping caches and connections
+        POST /pause?source=...       skip sources until resumed
+        POST /resume?source=...
+
+    Commands wait up to ``reply_timeout`` seconds for the loop to execute
+    them; if a check is still running the reply is ``202`` with
+    ``{"queued": true}`` and the command runs when the check ends.
+    """
+
+    def __init__(self, commands: CommandQueue, stats: Callable[[], Dict], host: str = "127.0.0.1",
+                 port: int = 0, socket_path: str = "", reply_timeout: float = 5.0):
+        self.commands = commands
+        self.stats = stats
+        self.host = host
+        self.port = port
+        self.socket_path = socket_path
+        self.reply_timeout = reply_timeout
+        self._server = None
+
+    @property
+    def address(self) -> str:
+        return f"unix:{self.socket_path}" if self.socket_path else f"http://{self.host}:{self.port}"
+
+    def start(self):
+        import socketserver
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        control = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def _reply(self, status: int, payload: Dict):
+                body = (json.dumps(payload, default=str, indent=2) + "\n").encode('utf-8')
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                if urlsplit(self.path).path != '/stats':
+                    self._reply(404, {'error': 'not found'})
+                    return
+                try:
+                    self._reply(200, control.stats())
+                except Exception as e:
+                    logger.error("Rendering stats failed: %s", e)
+                    self._reply(500, {'error': str(e)})
+
+            def do_POST(self):
+                url = urlsplit(self.path)
+                name = COMMANDS.get(url.path)
+                if name is None:
+                    self._reply(404, {'error': 'not found'})
+                    return
+                sources = parse_qs(url.query).get('source', [])
+                if name in ('pause', 'resume') and not sources:
+                    self._reply(400, {'error': f"{name} needs ?source=<label>"})
+                    return
+                command = control.commands.submit(name, sources)
+                try:
+                    result = command.result.result(timeout=control.reply_timeout)
+                except FutureTimeout:
+                    self._reply(202, {'command': name, 'queued': True})
+                except ValueError as e:
+                    self._reply(400, {'command': name, 'error': str(e)})
+                except Exception as e:
+                    self._reply(500, {'command': name, 'error': str(e)})
+                else:
+                    self._reply(200, {'command': name, **result})
+
+            def address_string(self):  # Unix sockets have no peer address
+                return self.client_address[0] if self.client_address else control.socket_path
+
+            def log_message(self, fmt, *args):
+                logger.debug(fmt, *args)
+
+        if self.socket_path:
+            class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+                daemon_threads = True
+
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)  # left over from a process that didn't shut down cleanly
+            self._server = _UnixServer(self.socket_path, _Handler)
+        else:
+            self._server = ThreadingHTTPServer((self.host, self.port), _Handler)
+            self._server.daemon_threads = True
+            self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, name="control-api", daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            if self.socket_path and os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
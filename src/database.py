@@ -6,14 +6,46 @@ import os
 import logging
 from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
+
+from src.canonical import IdCache, company_key, location_key
+from src.compression import DescriptionCodec, train_dictionary
 
 logger = logging.getLogger(__name__)
 
+# Materialized counts kept in job_summary: dimension -> SQL expression over a jobs row
+# ('{row}' is NEW or OLD inside the triggers, jobs in the rebuild query). Companies
+# are counted under their dictionary name; the text column only for rows written
+# without a company_id.
+SUMMARY_DIMENSIONS = {
+    'total': "''",
+    'source': "COALESCE({row}.source, '')",
+    'company': "COALESCE((SELECT name FROM companies WHERE id = {row}.company_id), {row}.company, '')",
+    'day': "COALESCE(substr({row}.found_date, 1, 10), '')",
+}
+
+# Dictionary tables: jobs column holding the id -> (table, text column it replaces, canonical key)
+ENTITIES = {
+    'company_id': ('companies', 'company', company_key),
+    'location_id': ('locations', 'location', location_key),
+}
+
+# Company and location names of a jobs row, from the dictionaries (old rows: inline text)
+_ENTITY_JOINS = ("LEFT JOIN companies c ON c.id = jobs.company_id "
+                 "LEFT JOIN locations l ON l.id = jobs.location_id")
+_COMPANY = "COALESCE(c.name, jobs.company, '')"
+_LOCATION = "COALESCE(l.name, jobs.location, '')"
+
+# Descriptions a dictionary is trained on, and how many there must be before one is worth it
+DICT_SAMPLES = 2000
+DICT_MIN_SAMPLES = 200
+
 
 class JobDatabase:
-    def __init__(self, db_path: str = "data/jobs_database.db"):
+    def __init__(self, db_path: str = "data/jobs_database.db", id_cache_size: int = 10000):
         self.db_path = db_path
+        self._codec = DescriptionCodec()
+        self._ids = IdCache(id_cache_size)
         self._init_database()
 
     # ---- connection helper (context manager) ----
@@ -32,242 +64,654 @@ class JobDatabase:
             conn.rollback()
             raise
         finally:
-            conn.close("""
-Database management module for tracking sent jobs
-"""
-import sqlite3
-import os
-import lasDawith tables and indexes."""
-        os.makedirs(os.pimh.import os
-impdbimport lr from contextl=Tfrom datetime import datetime, timeds from typing import List, Dict, Optionalut
-logger = logging.getLogger(__name__)
-NOT
+            conn.close()
 
-class JobDatabase:
-    def __initid I    def __init__(Y         self.db_path = db_path
-        self._init_database()
+    def _init_database(self):
+        """Create the database file with tables and indexes."""
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
 
-          self._init_database()  
-    # ---- connection helpe   
-    @contextmanager
-    def _connect(self):
-     job    def _connect(s          """Yield a (co T        conn = sqlite3.connect(self.db_path, timeout=10)
-        da        conn.execute("PRAGMA journal_mode=WT,
-                   conn.execute("PRAGMA foreign_keys=ON")ot        cursor = conn.cursor()
-        try:
- va        try:
-            yiel                           conn.commit()
-   g'        except Exception         ")
+        with self._connect() as (conn, cursor):
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    job_id TEXT UNIQUE NOT NULL,
+                    title TEXT,
+                    company TEXT,
+                    location TEXT,
+                    job_url TEXT,
+                    description TEXT,
+                    source TEXT,
+                    posted_date TEXT,
+                    found_date TEXT,
+                    sent_date TEXT,
+                    notification_type TEXT,
+                    status TEXT DEFAULT 'pending',
+                    relevance_score REAL DEFAULT 0,
+                    company_id INTEGER,
+                    location_id INTEGER
+                )
+            ''')
 
-            cur            raise
-                  finally: I            contiDatabase management modul  """
-import sqlite3
-import os
-import lasDawith ta  im  import os
-impidimport l          os.makedirs(os.pimh.import os
-EXimpdbimport lr from contextl=Tfrom dT,logger = logging.getLogger(__name__)
-NOT
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS notifications (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    job_id TEXT,
+                    notification_method TEXT,
+                    sent_date TEXT,
+                    status TEXT,
+                    FOREIGN KEY (job_id) REFERENCES jobs(job_id) ON DELETE CASCADE
+                )
+            ''')
 
-class JobDatabase:
-    def __initid I    def __init__(Y         se  NOT
+            # Indexes for frequent lookups
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_found_date ON jobs(found_date)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_notifications_job_id ON notifications(job_id)")
+            # Covering index for history queries the summaries can't answer (date ranges
+            # by source/status) so they never touch the table rows; see _init_entities for
+            # the one over a company's postings
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_found_source ON jobs(found_date, source, status)")
 
-class JobDatabase:
-    def __i  
-c In  xes for frequent         self._init_database()
-
-          self._init_database()  
- _j
-          self._init_databa
-      # ---- connection helpe   
-  I    @contextmanager
-    def _ound_date ON jobs(foun     job    def _connecu        da        conn.execute("PRAGMA journal_mode=WT,
-                   conn.execute("PRAGMA foreign_keyle                   conn.execute("PRAGMA foreign_keys=O          try:
- va        try:
-            yiel                           conn.commit()
-  L  va        
-            excep   g'        except Exception         ")
-
-        # colum
-            cur            raise
-     
-                    finally: I   icimport sqlite3
-import os
-import lasDawith ta  im  import os
-impid
-          import os
-impcoimport lasimpidimport l          os.makedirsoEXimpdbimport lr from contextl=Tfrom dT,logger = lo  NOT
+            # Older databases were created without relevance_score or the dictionary ids
+            columns = {row[1] for row in cursor.execute("PRAGMA table_info(jobs)")}
+            if 'relevance_score' not in columns:
+                cursor.execute("ALTER TABLE jobs ADD COLUMN relevance_score REAL DEFAULT 0")
+            for column in ENTITIES:
+                if column not in columns:
+                    cursor.execute(f"ALTER TABLE jobs ADD COLUMN {column} INTEGER")
 
-class JobDatabase:
-    def __initid I    def __init__(Y         se  NO  
-c       def __initid rc
-class JobDatabase:
-    def __i  
-c In  xes for fre)
-     def __i  
-c I  c In  xes fo, 
-          self._init_database()  
- _j
-          se    _j
-          self._init_databa
-b_  ')      # ---- connection heda  I    @contextmanager
-    def       def _ound_date ONpa                   conn.execute("PRAGMA foreign_keyle                   conn.execute("PRAGMA foreign_keys=O     va        try:
-            yiel                           conn.commit()
-  L  va        
-            excep   g'        ete            yi    L  va        
-            excep   g'        except Ex              exge
-        # colum
-            cur            raise
-     
-                ))
-     
-                    final e    t import os
-import lasDawith ta  im  import os
-imp
- import lxcimpid
-          import os
-impcoimog    erimpcoimport lasimp j
-class JobDatabase:
-    def __initid I    def __init__(Y         se  NO  
-c       def __initid rc
-class Jrt     def __initid . c       def __initid rc
-class JobDatabase:
-    def _  class JobDatabase:
-   wi    def __i  
-c I) c In  xes for)     def __i  
-c  fc I  c In  xen           self._in   _j
-  try:
-                         ur          self._i  b_  ')      # ---- connectNS    def       def _ound_date ONpa                   conb_            yiel                           conn.commit()
-  L  va        
-            excep   g'        ete            yi    L  va        
-            excep       L  va        
-            excep   g'        ete                    ex "            excep   g'        except Ex              exge
-               # colum
-            cur            raise
-     
-               cujo     
-                ))
-     
-             
-           at    t(import lasDawith ta  im  import os
-imp
- ijoimp
- import lxcimpid
-          im   i            impor_dimpcoimog    erimponclass JobDatabase:
-    def __initi      def __initid rcc       def __initid rc
-class Jrt     def __initid .d_class Jrt     def __in  class JobDatabase:
-    def _  class JobDatabase:
-        def _  class b_   wi    'relevance_score', 0)c I) c In  xes fo  c  fc I  c In  xen           sel    try:
-                         ur        c     .r  L  va        
-            excep   g'        ete            yi    L  va        
-            excep       L  va        
-            excep   g'        ete                    ex "           i            ex}"            excep       L  va        
-            excep   g'   >             excep   g'        ete   y                # colum
-            cur            raise
-     
-               cujo     
+            # Per-source high-water marks for incremental fetching
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS source_cursors (
+                    source TEXT PRIMARY KEY,
+                    last_ts REAL,
+                    last_id TEXT,
+                    updated_date TEXT
+                )
+            ''')
+
+            # Incremental exports: last jobs.id written to each export target
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS export_state (
+                    target TEXT PRIMARY KEY,
+                    last_id INTEGER NOT NULL,
+                    exported_date TEXT
+                )
+            ''')
+
+            normalized = self._init_entities(cursor)
+            self._init_summaries(cursor)
+            moved = self._init_descriptions(cursor)
+
+        if normalized or moved:
+            # The inline copies only became free pages; give them back to the filesystem
+            self.vacuum()
+
+    def _init_entities(self, cursor) -> int:
+        """Company/location dictionary tables; moves the inline names of older databases into them.
+
+        Each distinct name gets an integer id per canonical key (``company_key``,
+        ``location_key``), so "Stripe" and "Stripe, Inc." share one. The name
+        stored is the first spelling seen. Jobs rows keep only the ids.
+        """
+        existing = {name for (name,) in cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        for table, _column, _key in ENTITIES.values():
+            cursor.execute(f'''
+                CREATE TABLE IF NOT EXISTS {table} (
+                    id INTEGER PRIMARY KEY,
+                    key TEXT UNIQUE NOT NULL,
+                    name TEXT NOT NULL
+                )
+            ''')
+        # One company's postings by date: an index range scan, never the table
+        cursor.execute("DROP INDEX IF EXISTS idx_jobs_company_found")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_company_id_found ON jobs(company_id, found_date, status)")
+        if 'companies' in existing:
+            return 0
+
+        # The summary triggers now key companies by dictionary name: _init_summaries
+        # recreates them and recounts once, instead of the update trigger firing per row
+        for trigger in ('insert', 'update', 'delete'):
+            cursor.execute(f"DROP TRIGGER IF EXISTS trg_job_summary_{trigger}")
+        cursor.execute("SELECT 1 FROM jobs WHERE company IS NOT NULL OR location IS NOT NULL LIMIT 1")
+        if cursor.fetchone() is None:
+            return 0
+        names = {}
+        for id_column, (table, column, key) in ENTITIES.items():
+            cursor.execute(f"CREATE TEMP TABLE {table}_map (name TEXT PRIMARY KEY, id INTEGER)")
+            cursor.execute(f"SELECT DISTINCT {column} FROM jobs WHERE {column} != ''")
+            mapping = [(name, self._entity_id(cursor, id_column, name, {})) for (name,) in cursor.fetchall()]
+            cursor.executemany(f"INSERT INTO temp.{table}_map (name, id) VALUES (?, ?)", mapping)
+            names[table] = len(mapping)
+        cursor.execute('''
+            UPDATE jobs SET
+                company_id = (SELECT id FROM temp.companies_map WHERE name = jobs.company),
+                location_id = (SELECT id FROM temp.locations_map WHERE name = jobs.location),
+                company = NULL, location = NULL
+            WHERE company IS NOT NULL OR location IS NOT NULL
+        ''')
+        normalized = cursor.rowcount
+        for table, _column, _key in ENTITIES.values():
+            cursor.execute(f"DROP TABLE temp.{table}_map")
+        logger.info("🏷️  Normalized %s jobs: %s company and %s location names into dictionary tables",
+                    normalized, names['companies'], names['locations'])
+        return normalized
+
+    def _entity_id(self, cursor, id_column: str, name: Optional[str], fresh: Dict) -> Optional[int]:
+        """Dictionary id of a company/location name, adding it if new (None for a blank name).
+
+        Looked up in the LRU cache first. Ids found in the database go into
+        ``fresh`` rather than the cache: the caller caches them once its
+        transaction has committed, so a rollback can't leave a dangling id.
+        """
+        if not name:
+            return None
+        name = " ".join(str(name).split())
+        entity_id = self._ids.get((id_column, name))
+        if entity_id is not None:
+            return entity_id
+        table, _column, canonical = ENTITIES[id_column]
+        key = canonical(name)
+        if not key:
+            return None
+        cursor.execute(f"SELECT id FROM {table} WHERE key = ?", (key,))
+        row = cursor.fetchone()
+        if row is None:
+            cursor.execute(f"INSERT OR IGNORE INTO {table} (key, name) VALUES (?, ?)", (key, name))
+            cursor.execute(f"SELECT id FROM {table} WHERE key = ?", (key,))
+            row = cursor.fetchone()
+        fresh[(id_column, name)] = row[0]
+        return row[0]
+
+    def _cache_ids(self, fresh: Dict):
+        for key, entity_id in fresh.items():
+            self._ids.put(key, entity_id)
+
+    def _init_descriptions(self, cursor) -> int:
+        """Compressed side table for descriptions; moves inline ones out of older databases.
+
+        ``jobs.description`` stays in the schema but is left NULL, so the jobs
+        rows that every lookup and scan reads stay small.
+        """
+        existing = {name for (name,) in cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS job_descriptions (
+                id INTEGER PRIMARY KEY,
+                dict_id INTEGER NOT NULL,
+                body BLOB NOT NULL
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS description_dicts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                dict BLOB NOT NULL,
+                samples INTEGER,
+                created_date TEXT
+            )
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_job_descriptions_delete AFTER DELETE ON jobs BEGIN
+                DELETE FROM job_descriptions WHERE id = OLD.id;
+            END
+        ''')
+        self._load_dictionaries(cursor)
+        if 'job_descriptions' in existing:
+            return 0
+
+        # Database from before the side table: train on what is there, then move it all
+        cursor.execute("SELECT description FROM jobs WHERE description != '' ORDER BY id DESC LIMIT ?",
+                       (DICT_SAMPLES,))
+        samples = [text for (text,) in cursor.fetchall()]
+        if not samples:
+            return 0
+        self._train_dictionary(cursor, samples)
+        moved, last_id = 0, 0
+        while True:
+            cursor.execute("SELECT id, description FROM jobs WHERE id > ? AND description != '' "
+                           "ORDER BY id LIMIT 5000", (last_id,))
+            rows = cursor.fetchall()
+            if not rows:
+                break
+            cursor.executemany("INSERT OR REPLACE INTO job_descriptions (id, dict_id, body) VALUES (?, ?, ?)",
+                               [(pk,) + self._codec.encode(text) for pk, text in rows])
+            moved += len(rows)
+            last_id = rows[-1][0]
+        cursor.execute("UPDATE jobs SET description = NULL WHERE description IS NOT NULL")
+        logger.info("🗜️  Moved %s job descriptions to compressed storage", moved)
+        return moved
+
+    def _load_dictionaries(self, cursor):
+        cursor.execute("SELECT id, dict FROM description_dicts")
+        self._codec = DescriptionCodec({dict_id: bytes(data) for dict_id, data in cursor.fetchall()})
+
+    def _train_dictionary(self, cursor, samples: List[str]) -> bool:
+        """Store a dictionary trained on ``samples`` and make it the one new bodies use."""
+        if len(samples) < DICT_MIN_SAMPLES:
+            return False
+        cursor.execute("INSERT INTO description_dicts (dict, samples, created_date) VALUES (?, ?, ?)",
+                       (train_dictionary(samples), len(samples), datetime.now().isoformat()))
+        self._load_dictionaries(cursor)
+        return True
+
+    def _decode(self, cursor, dict_id: Optional[int], body: Optional[bytes]) -> str:
+        if body is None:
+            return ''
+        if dict_id > 0 and dict_id not in self._codec.dictionaries:
+            self._load_dictionaries(cursor)  # trained by another process after ours were loaded
+        return self._codec.decode(dict_id, body)
+
+    def _init_summaries(self, cursor):
+        """Summary table plus the triggers that keep it in step with every write to jobs."""
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS job_summary (
+                dimension TEXT NOT NULL,
+                key TEXT NOT NULL,
+                status TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                PRIMARY KEY (dimension, key, status)
+            ) WITHOUT ROWID
+        ''')
+        existing = {name for (name,) in cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")}
+
+        def _rows(row: str) -> str:
+            return ", ".join(f"('{dim}', {expr.format(row=row)}, COALESCE({row}.status, ''), 1)"
+                             for dim, expr in SUMMARY_DIMENSIONS.items())
+
+        def _decrement(row: str) -> str:
+            return "\n".join(
+                f"UPDATE job_summary SET count = count - 1 WHERE dimension = '{dim}' "
+                f"AND key = {expr.format(row=row)} AND status = COALESCE({row}.status, '');"
+                for dim, expr in SUMMARY_DIMENSIONS.items())
+
+        increment = ("INSERT INTO job_summary (dimension, key, status, count) VALUES {rows} "
+                     "ON CONFLICT (dimension, key, status) DO UPDATE SET count = count + 1;")
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_job_summary_insert AFTER INSERT ON jobs BEGIN
+                {increment.format(rows=_rows('NEW'))}
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_job_summary_update
+            AFTER UPDATE OF status, source, company, company_id, found_date ON jobs
+            WHEN OLD.status IS NOT NEW.status OR OLD.source IS NOT NEW.source
+                 OR OLD.company IS NOT NEW.company OR OLD.company_id IS NOT NEW.company_id
+                 OR OLD.found_date IS NOT NEW.found_date BEGIN
+                {_decrement('OLD')}
+                {increment.format(rows=_rows('NEW'))}
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_job_summary_delete AFTER DELETE ON jobs BEGIN
+                {_decrement('OLD')}
+            END
+        ''')
+        if 'trg_job_summary_insert' not in existing:
+            # Database from before the summaries: count what is already there
+            self._rebuild_summaries(cursor)
+
+    def _rebuild_summaries(self, cursor):
+        cursor.execute("DELETE FROM job_summary")
+        for dim, expr in SUMMARY_DIMENSIONS.items():
+            key = expr.format(row='jobs')
+            cursor.execute(f'''
+                INSERT INTO job_summary (dimension, key, status, count)
+                SELECT '{dim}', {key}, COALESCE(status, ''), COUNT(*) FROM jobs GROUP BY 2, 3
+            ''')
+
+    # ---- jobs ----
+
+    def job_exists(self, job_id: str) -> bool:
+        """Check if a job is already in the database."""
+        with self._connect() as (conn, cursor):
+            cursor.execute("SELECT 1 FROM jobs WHERE job_id = ? LIMIT 1", (job_id,))
+            return cursor.fetchone() is not None
+
+    def add_job(self, job: Dict) -> bool:
+        """Insert a new job. Returns False if it already exists."""
+        fresh: Dict = {}
+        try:
+            with self._connect() as (conn, cursor):
+                cursor.execute('''
+                    INSERT INTO jobs (job_id, title, company_id, location_id, job_url,
+                                      source, posted_date, found_date, status, relevance_score)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'pending', ?)
+                ''', (
+                    job.get('job_id'),
+                    job.get('title', ''),
+                    self._entity_id(cursor, 'company_id', job.get('company'), fresh),
+                    self._entity_id(cursor, 'location_id', job.get('location'), fresh),
+                    job.get('job_url', ''),
+                    job.get('source', ''),
+                    job.get('posted_date', ''),
+                    datetime.now().isoformat(),
+                    job.get('relevance_score', 0),
                 ))
-     
- id            cur             
-               cujo     
- i    t                 ))
-    se     
-           st   met           a bimp
- ijoimp
- import lxcimpid
-          im   i          i   imporw           im   ).    def __initi      def __initid rcc       def __initid rc
-class Jrt     class Jrt     def __initid .d_class Jrt     def __in  clasnt    def _  class JobDatabase:
-        def _  class b_   wi    'relevanc          def _  class b_   witi                         ur        c     .r  L  va        
-            excep   g'        ete            yi    Lod            excep   g'        et)
+                description = job.get('description') or ''
+                if description:
+                    cursor.execute("INSERT INTO job_descriptions (id, dict_id, body) VALUES (?, ?, ?)",
+                                   (cursor.lastrowid,) + self._codec.encode(str(description)))
+            self._cache_ids(fresh)
             return True
-             excep       L  va        
-            excep   g'   ma            excep   g'        ete   tu            excep   g'   >             excep   g'        ete   y                # colum
-            cur            raise
-t             cur            raise
-     
-               cujo     
-                ))
-   ).     
-               cujo     
-lf    nn                ))
-           
- id        ji id  j               cujo     
- i   rs i    t                 S    se     
-           sten          ob ijoi", (now, jid))
-                  imporso          im     class Jrt     class Jrt     def __initid .d_class Jrt     def __in  clasnt    def _  class JobDatabase:
-        
-         def _  class b_   wi    'relevanc          def _  class b_   w )
-                    marked += 1            excep   g'        ete            yi    Lod            excep   g'        et)
+        except sqlite3.IntegrityError:
+            return False
+        except sqlite3.Error as e:
+            logger.error("Error adding job %s: %s", job.get('job_id'), e)
+            return False
+
+    def mark_job_sent(self, job_id: str, notification_type: str) -> bool:
+        """Mark a job as sent and log the notification."""
+        now = datetime.now().isoformat()
+        try:
+            with self._connect() as (conn, cursor):
+                cursor.execute('''
+                    UPDATE jobs SET status = 'sent', sent_date = ?, notification_type = ?
+                    WHERE job_id = ?
+                ''', (now, notification_type, job_id))
+                cursor.execute('''
+                    INSERT INTO notifications (job_id, notification_method, sent_date, status)
+                    VALUES (?, ?, ?, 'sent')
+                ''', (job_id, notification_type, now))
             return True
-             exceps             return True
-             excep       L  va        
-            excep   g' "
-             excep    ne            excep   g'   ma          or            cur            raise
-t             cur            raise
-     
-               cujo     
-                ))
-   ).     
-               cujo   g't             cur            raan     
-               cujo     
-                rn [
-                 ).     
-      ,          r[lf    nn                            
- id        jir[ id       rl i   rs i    t                 S    se    'r           sten          ob ijoi", (now, j r                  imporso          im     clage        
-         def _  class b_   wi    'relevanc          def _  class b_   w )
-                    marked += 1            excep   g'        ex       SE                    marked += 1            excep   g'        ete        w[            return True
-             exceps             return True
-             excep       L  va        
-                         exceps   cr             excep       L  va        
-                 excep   g' "
-            el             excep    nsot             cur            raise
-     
-               cujo     
-                ))
-   ).    b_     
-               cujo     
-  or                      ))
-   )     ).     
-      E          E                cujo     
-                rn [
-               ER                rn [
-  C
-                 ).IT      ,          r[lf  tt id        jir[ id     limit))
+        except sqlite3.Error as e:
+            logger.error("Error marking job %s as sent: %s", job_id, e)
+            return False
+
+    def get_pending_jobs(self, limit: int = 100, descriptions: bool = True) -> List[Dict]:
+        """Jobs found but not yet notified, best match first.
+
+        Only the returned jobs' descriptions are decompressed; with
+        ``descriptions=False`` none are, and ``get_descriptions`` fetches them later.
+        """
+        with self._connect() as (conn, cursor):
+            cursor.execute(f'''
+                SELECT jobs.id, job_id, title, {_COMPANY}, {_LOCATION}, job_url, source, posted_date, relevance_score
+                FROM jobs {_ENTITY_JOINS} WHERE status = 'pending'
+                ORDER BY relevance_score DESC, found_date DESC
+                LIMIT ?
+            ''', (limit,))
+            rows = cursor.fetchall()
+            jobs = [
+                {
+                    'job_id': r[1], 'title': r[2], 'company': r[3], 'location': r[4],
+                    'job_url': r[5], 'source': r[6], 'posted_date': r[7], 'relevance_score': r[8],
+                }
+                for r in rows
+            ]
+            if descriptions:
+                texts = self._descriptions_by_pk(cursor, [r[0] for r in rows])
+                for r, job in zip(rows, jobs):
+                    job['description'] = texts.get(r[0], '')
+            return jobs
+
+    def get_description(self, job_id: str) -> str:
+        """One job's description ('' if it has none or is unknown)."""
+        return self.get_descriptions([job_id]).get(job_id, '')
+
+    def get_descriptions(self, job_ids: Iterable[str]) -> Dict[str, str]:
+        """Descriptions of the given jobs, decompressed on demand: {job_id: text}."""
+        job_ids = list(job_ids)
+        found: Dict[str, str] = {}
+        with self._connect() as (conn, cursor):
+            for start in range(0, len(job_ids), 500):
+                batch = job_ids[start:start + 500]
+                cursor.execute(f'''
+                    SELECT jobs.job_id, d.dict_id, d.body FROM jobs JOIN job_descriptions d ON d.id = jobs.id
+                    WHERE jobs.job_id IN ({", ".join("?" * len(batch))})
+                ''', batch)
+                for job_id, dict_id, body in cursor.fetchall():
+                    found[job_id] = self._decode(cursor, dict_id, body)
+        return found
+
+    def _descriptions_by_pk(self, cursor, ids: List[int]) -> Dict[int, str]:
+        found: Dict[int, str] = {}
+        for start in range(0, len(ids), 500):
+            batch = ids[start:start + 500]
+            cursor.execute(f"SELECT id, dict_id, body FROM job_descriptions "
+                           f"WHERE id IN ({', '.join('?' * len(batch))})", batch)
+            for pk, dict_id, body in cursor.fetchall():
+                found[pk] = self._decode(cursor, dict_id, body)
+        return found
+
+    def get_recent_jobs(self, hours: int = 24, limit: int = 100) -> List[Dict]:
+        """Jobs found in the last ``hours`` hours, newest first."""
+        cutoff = (datetime.now() - timedelta(hours=hours)).isoformat()
+        with self._connect() as (conn, cursor):
+            cursor.execute(f'''
+                SELECT job_id, title, {_COMPANY}, {_LOCATION}, job_url, source, found_date, status
+                FROM jobs {_ENTITY_JOINS} WHERE found_date >= ?
+                ORDER BY found_date DESC
+                LIMIT ?
+            ''', (cutoff, limit))
             return [
-             def _  class b_   wi    'relevanc          def _  class b_   w )
-                    marked += 1            excep   g'        ex       SE                 relevanc                    marked += 1            excep   g'        ex       SE
-
-             exceps             return True
-             excep       L  va        
-                         exceps   cr             excep       L  va        
-          
-              excep       L  va        
-                              exceps   cr *)                 excep   g' "
-            el             excep    nsot                 el             eLE     
-               cujo     
-                ))
-   ).    b_     
-     so    tc                ))
-   )ur   ).    b_     
-CT                s  or                        )     ).     
-      E   ho      E                          rn [
-               ER     F               ER  ou  C
-                 ).IT      ,         b            return [
-             def _  class b_   wi    'relevanc   {
-                  def _  t                    marked += 1            excep   g'        ex       SE    'b
-             exceps             return True
-             excep       L  va        
-                         exceps   cr             exete jobs older than N days to keep t             excep       L  va        
-   et                         exceps   cr fo          
-              excep       L  va        
-                                  c                              exceps  LE            el             excep    nsot                 el             nd               cujo     
-                ))
-   ).    b_     
-     so    tc     ur                ))
-   )M    ).    b_     
-da     so    tc  f,   )ur   ).    b_     
-CT     urCT                s          E   ho      E                          rn [
-         et               ER     F               ER  ou  C
-tu                 ).IT      ,         b                       def _  class b_   wi    'relevanc   {
-                          def _  t                    marai             exceps             return True
-             excep       L  va        
-                    "V                conn.close()
+                {
+                    'job_id': r[0], 'title': r[1], 'company': r[2], 'location': r[3],
+                    'job_url': r[4], 'source': r[5], 'found_date': r[6], 'status': r[7],
+                }
+                for r in cursor.fetchall()
+            ]
+
+    def get_company_jobs(self, company: str, since: Optional[str] = None, until: Optional[str] = None,
+                         limit: int = 100) -> List[Dict]:
+        """One company's jobs, newest first, under any spelling of its name ("stripe", "Stripe, Inc.").
+
+        ``since``/``until`` bound ``found_date`` (ISO strings, ``until``
+        exclusive). Resolved through the company dictionary, then a range of
+        ``idx_jobs_company_id_found``.
+        """
+        sql = f'''
+            SELECT job_id, title, c.name, {_LOCATION}, job_url, source, found_date, status
+            FROM companies c JOIN jobs ON jobs.company_id = c.id
+            LEFT JOIN locations l ON l.id = jobs.location_id
+            WHERE c.key = ?
+        '''
+        params: list = [company_key(company)]
+        if since is not None:
+            sql += " AND found_date >= ?"
+            params.append(since)
+        if until is not None:
+            sql += " AND found_date < ?"
+            params.append(until)
+        sql += " ORDER BY found_date DESC LIMIT ?"
+        params.append(limit)
+        with self._connect() as (conn, cursor):
+            return [
+                {
+                    'job_id': r[0], 'title': r[1], 'company': r[2], 'location': r[3],
+                    'job_url': r[4], 'source': r[5], 'found_date': r[6], 'status': r[7],
+                }
+                for r in cursor.execute(sql, params)
+            ]
+
+    def get_job_count(self) -> Dict[str, int]:
+        """Job counts by status (read from the summary table, not counted)."""
+        with self._connect() as (conn, cursor):
+            cursor.execute("SELECT status, count FROM job_summary "
+                           "WHERE dimension = 'total' AND key = '' AND count > 0")
+            return {status: count for status, count in cursor.fetchall()}
+
+    # ---- analytics (materialized summaries) ----
+
+    def count_by(self, dimension: str, status: Optional[str] = None, since: Optional[str] = None,
+                 until: Optional[str] = None, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """``(key, jobs)`` per source, company or day, largest first (days in date order).
+
+        ``status`` restricts to pending/sent jobs; ``since``/``until``
+        (inclusive ``YYYY-MM-DD`` strings) select a day range and are only
+        accepted for ``day``. Answered from ``job_summary`` alone.
+        """
+        if dimension not in SUMMARY_DIMENSIONS or dimension == 'total':
+            raise ValueError(f"unknown dimension {dimension!r}; use source, company or day")
+        if dimension != 'day' and (since is not None or until is not None):
+            # The keys are names there, so a date bound would silently compare them as text
+            raise ValueError(f"since/until select days; they do not apply to {dimension!r}")
+        sql = "SELECT key, SUM(count) AS n FROM job_summary WHERE dimension = ?"
+        params: list = [dimension]
+        if status is not None:
+            sql += " AND status = ?"
+            params.append(status)
+        if since is not None:
+            sql += " AND key >= ?"
+            params.append(since)
+        if until is not None:
+            sql += " AND key <= ?"
+            params.append(until)
+        sql += " GROUP BY key HAVING n > 0"
+        sql += " ORDER BY key" if dimension == 'day' else " ORDER BY n DESC, key"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._connect() as (conn, cursor):
+            return [(key, n) for key, n in cursor.execute(sql, params)]
+
+    def status_by(self, dimension: str, key: str) -> Dict[str, int]:
+        """Counts by status for one source, company (any spelling of its name) or day."""
+        with self._connect() as (conn, cursor):
+            if dimension == 'company':
+                cursor.execute("SELECT name FROM companies WHERE key = ?", (company_key(key),))
+                row = cursor.fetchone()
+                key = row[0] if row else key
+            cursor.execute("SELECT status, count FROM job_summary WHERE dimension = ? AND key = ? AND count > 0",
+                           (dimension, key))
+            return {status: count for status, count in cursor.fetchall()}
+
+    def rebuild_summaries(self):
+        """Recount ``job_summary`` from the jobs table (after edits made with the triggers off)."""
+        with self._connect() as (conn, cursor):
+            self._rebuild_summaries(cursor)
+
+    # ---- source cursors (incremental fetching) ----
+
+    def get_source_cursors(self) -> Dict[str, Tuple[float, Optional[str]]]:
+        """All per-source high-water marks as {source: (last_ts, last_id)}."""
+        with self._connect() as (conn, cursor):
+            cursor.execute("SELECT source, last_ts, last_id FROM source_cursors")
+            return {source: (ts, last_id) for source, ts, last_id in cursor.fetchall()}
+
+    def save_source_cursors(self, cursors: Dict[str, Tuple[float, Optional[str]]]) -> int:
+        """Advance high-water marks. A cursor never moves backwards."""
+        if not cursors:
+            return 0
+        now = datetime.now().isoformat()
+        with self._connect() as (conn, cursor):
+            cursor.executemany('''
+                INSERT INTO source_cursors (source, last_ts, last_id, updated_date)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(source) DO UPDATE SET
+                    last_ts = excluded.last_ts,
+                    last_id = excluded.last_id,
+                    updated_date = excluded.updated_date
+                WHERE excluded.last_ts > source_cursors.last_ts
+            ''', [(src, ts, last_id, now) for src, (ts, last_id) in cursors.items()])
+        return len(cursors)
+
+    def reset_source_cursor(self, source: Optional[str] = None):
+        """Forget one source's cursors, under every keyword set (or all of them), to force a full re-fetch."""
+        with self._connect() as (conn, cursor):
+            if source is None:
+                cursor.execute("DELETE FROM source_cursors")
+            else:
+                cursor.execute("DELETE FROM source_cursors WHERE source = ? OR substr(source, 1, ?) = ?",
+                               (source, len(source) + 1, f"{source}#"))
+
+    # ---- export ----
+
+    EXPORT_COLUMNS = ('id', 'job_id', 'title', 'company', 'location', 'job_url', 'description', 'source',
+                      'posted_date', 'found_date', 'sent_date', 'notification_type', 'status', 'relevance_score')
+
+    def iter_job_chunks(self, after_id: int = 0, chunk_rows: int = 10000) -> Iterator[List[Tuple]]:
+        """Jobs with ``id > after_id`` in id order, ``chunk_rows`` rows (``EXPORT_COLUMNS``) at a time.
+
+        Pages by primary key, so memory stays at one chunk however large the table.
+        """
+        expressions = {'description': "d.dict_id, d.body", 'company': _COMPANY, 'location': _LOCATION}
+        columns = ", ".join(expressions.get(c, f"jobs.{c}") for c in self.EXPORT_COLUMNS)
+        at = self.EXPORT_COLUMNS.index('description')
+        last_id = after_id
+        while True:
+            with self._connect() as (conn, cursor):
+                cursor.execute(f"SELECT {columns} FROM jobs LEFT JOIN job_descriptions d ON d.id = jobs.id "
+                               f"{_ENTITY_JOINS} WHERE jobs.id > ? ORDER BY jobs.id LIMIT ?", (last_id, chunk_rows))
+                rows = [r[:at] + (self._decode(cursor, r[at], r[at + 1]),) + r[at + 2:] for r in cursor.fetchall()]
+            if not rows:
+                return
+            last_id = rows[-1][0]
+            yield rows
+
+    def get_export_position(self, target: str) -> int:
+        """Last ``jobs.id`` exported to ``target`` (0 if never)."""
+        with self._connect() as (conn, cursor):
+            cursor.execute("SELECT last_id FROM export_state WHERE target = ?", (target,))
+            row = cursor.fetchone()
+            return row[0] if row else 0
+
+    def set_export_position(self, target: str, last_id: int):
+        with self._connect() as (conn, cursor):
+            cursor.execute('''
+                INSERT INTO export_state (target, last_id, exported_date) VALUES (?, ?, ?)
+                ON CONFLICT(target) DO UPDATE SET last_id = excluded.last_id, exported_date = excluded.exported_date
+            ''', (target, last_id, datetime.now().isoformat()))
+
+    def export_jobs(self, out_dir: str, **options) -> Dict:
+        """Stream jobs into date-partitioned files under ``out_dir`` (see ``src/export.py``)."""
+        from src.export import export_jobs
+        return export_jobs(self, out_dir, **options)
+
+    # ---- maintenance ----
+
+    def cleanup_old_jobs(self, days: int = 90) -> int:
+        """Delete jobs older than N days to keep the database small."""
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+        with self._connect() as (conn, cursor):
+            cursor.execute("DELETE FROM jobs WHERE found_date < ?", (cutoff,))
+            deleted = cursor.rowcount
+        if deleted:
+            logger.info("Cleaned up %s jobs older than %s days", deleted, days)
+        return deleted
+
+    def compact_descriptions(self, retrain: bool = False) -> int:
+        """Train a description dictionary once there are enough samples, and recompress with it.
+
+        A dictionary is trained when there is none yet, or on ``retrain``
+        (e.g. after the mix of sources changed); otherwise this only reloads
+        the dictionaries. After training, every body is rewritten with the new
+        dictionary, 5000 per transaction, and dictionaries nothing refers to
+        any more are dropped. Returns the number of bodies rewritten.
+        """
+        with self._connect() as (conn, cursor):
+            self._load_dictionaries(cursor)  # picks up one another process trained
+            if self._codec.dictionaries and not retrain:
+                return 0
+            cursor.execute("SELECT dict_id, body FROM job_descriptions ORDER BY id DESC LIMIT ?", (DICT_SAMPLES,))
+            if not self._train_dictionary(
+                    cursor, [self._decode(cursor, dict_id, body) for dict_id, body in cursor.fetchall()]):
+                return 0
+        current = self._codec.current
+        rewritten, last_id = 0, 0
+        while True:
+            with self._connect() as (conn, cursor):
+                cursor.execute("SELECT id, dict_id, body FROM job_descriptions WHERE id > ? AND dict_id != ? "
+                               "ORDER BY id LIMIT 5000", (last_id, current))
+                rows = cursor.fetchall()
+                if not rows:
+                    break
+                cursor.executemany("UPDATE job_descriptions SET dict_id = ?, body = ? WHERE id = ?",
+                                   [self._codec.encode(self._decode(cursor, dict_id, body)) + (pk,)
+                                    for pk, dict_id, body in rows])
+            rewritten += len(rows)
+            last_id = rows[-1][0]
+        with self._connect() as (conn, cursor):
+            cursor.execute("DELETE FROM description_dicts WHERE id != ? "
+                           "AND id NOT IN (SELECT DISTINCT dict_id FROM job_descriptions)", (current,))
+        if rewritten:
+            logger.info("🗜️  Recompressed %s job descriptions with dictionary %s", rewritten, current)
+        return rewritten
+
+    def vacuum(self):
+        """Reclaim free pages after cleanup."""
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            conn.execute("VACUUM")
+        finally:
+            conn.close()
@@ -0,0 +1,258 @@
+"""
+Concurrent employer career-page crawler with robots.txt / sitemap discovery
+"""
+import json
+import logging
+import os
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+logger = logging.getLogger(__name__)
+
+
+class EmployerCrawler:
+    """Crawls career pages concurrently, at most ``per_domain_limit`` requests per domain at once.
+
+    ``fetch(url)`` must return a response-like object with ``.content`` and
+    raise on HTTP errors; ``parse(content, url)`` must return
+    ``(jobs, has_json_ld)``. Both are passed in by ``JobScraper`` on every
+    ``discover``/``crawl`` call, bound to the calling cycle, so the crawler
+    shares its session, rate limiting and parse stage and can itself be
+    shared between cycles.
+
+    Persistent state (``state_file``):
+      * search-engine results per query, refreshed every ``search_ttl`` s
+        (``empty_search_ttl`` s when the search returned nothing)
+      * sitemap-discovered career URLs per domain, refreshed every ``sitemap_refresh`` s
+      * URLs that had no JSON-LD, skipped for ``no_jsonld_ttl`` s
+    """
+
+    def __init__(self, path_keywords: Iterable[str], state_file: str,
+                 workers: int = 8, per_domain_limit: int = 2,
+                 sitemap_refresh: float = 86400, sitemap_max_urls: int = 50,
+                 no_jsonld_ttl: float = 7 * 86400, search_ttl: float = 6 * 3600,
+                 empty_search_ttl: float = 15 * 60):
+        self.path_keywords = [k.lower() for k in path_keywords]
+        self.state_file = state_file
+        self.workers = max(1, workers)
+        self.per_domain_limit = max(1, per_domain_limit)
+        self.sitemap_refresh = sitemap_refresh
+        self.sitemap_max_urls = sitemap_max_urls
+        self.no_jsonld_ttl = no_jsonld_ttl
+        self.search_ttl = search_ttl
+        self.empty_search_ttl = min(empty_search_ttl, search_ttl)
+
+        self._domain_slots: Dict[str, threading.Semaphore] = {}
+        self._robots: Dict[str, Tuple[Optional[RobotFileParser], float]] = {}
+        self._lock = threading.Lock()
+        self._state = self._load_state()
+
+    # ---- persistent state ----
+
+    def _load_state(self) -> Dict:
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            state = {}
+        state.setdefault('searches', {})
+        state.setdefault('sitemaps', {})
+        state.setdefault('no_jsonld', {})
+        return state
+
+    def save_state(self):
+        try:
+            os.makedirs(os.path.dirname(self.state_file) or '.', exist_ok=True)
+            tmp = f"{self.state_file}.tmp"
+            with self._lock:
+                data = json.dumps(self._state)
+            with open(tmp, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp, self.state_file)
+        except OSError as e:
+            logger.warning("Could not write crawl state %s: %s", self.state_file, e)
+
+    def _known_without_json_ld(self, url: str, now: float) -> bool:
+        ts = self._state['no_jsonld'].get(url)
+        return ts is not None and now - ts < self.no_jsonld_ttl
+
+    # ---- politeness ----
+
+    def _slot(self, domain: str) -> threading.Semaphore:
+        with self._lock:
+            sem = self._domain_slots.get(domain)
+            if sem is None:
+                sem = self._domain_slots[domain] = threading.Semaphore(self.per_domain_limit)
+            return sem
+
+    def _robots_for(self, base: str, fetch: Callable) -> Optional[RobotFileParser]:
+        """robots.txt for ``scheme://host`` (None when missing or unreadable = allow all)."""
+        now = time.time()
+        with self._lock:
+            cached = self._robots.get(base)
+            if cached is not None and now - cached[1] < self.sitemap_refresh:
+                return cached[0]
+        parser = None
+        try:
+            text = fetch(f"{base}/robots.txt").content.decode('utf-8', 'replace')
+            parser = RobotFileParser()
+            parser.parse(text.splitlines())
+        except Exception as e:
+            if getattr(e, 'response', None) is None:
+                return None  # network trouble: allow for now, ask again next time
+        with self._lock:
+            self._robots[base] = (parser, now)
+        return parser
+
+    def allowed(self, url: str, fetch: Callable) -> bool:
+        parsed = urlparse(url)
+        robots = self._robots_for(f"{parsed.scheme}://{parsed.netloc}", fetch)
+        return robots is None or robots.can_fetch("*", url)
+
+    # ---- search-engine discovery ----
+
+    def search(self, queries: Iterable[str], search: Callable[[str], Optional[List[str]]],
+               now: Optional[float] = None) -> Tuple[List[str], int]:
+        """Career URLs for ``queries``, only asking ``search`` for entries older than ``search_ttl``.
+
+        ``search(query)`` returns result URLs, or None when the query failed;
+        failed queries keep serving their previous results and are retried
+        on the next call. An empty answer (often a throttled search) is only
+        kept for ``empty_search_ttl``. Returns (career URLs, number of queries
+        answered).
+        """
+        now = time.time() if now is None else now
+        queries = list(dict.fromkeys(queries))
+        cache = self._state['searches']
+        stale = [q for q in queries
+                 if now - cache.get(q, {}).get('checked_at', 0) >= self._search_ttl_of(cache.get(q))]
+        answered = 0
+        if stale:
+            with ThreadPoolExecutor(max_workers=min(len(stale), 4)) as pool:
+                for query, results in zip(stale, pool.map(search, stale)):
+                    if results is None:
+                        continue
+                    answered += 1
+                    with self._lock:
+                        cache[query] = {'checked_at': now, 'hits': len(results),
+                                        'urls': [u for u in results if self._is_career_url(u)]}
+        urls: List[str] = []
+        for query in queries:
+            urls.extend(cache.get(query, {}).get('urls', []))
+        return list(dict.fromkeys(urls)), answered
+
+    def _search_ttl_of(self, entry: Optional[Dict]) -> float:
+        if not entry:
+            return 0.0
+        # Entries written before 'hits' was recorded count as non-empty if they kept any URL
+        return self.search_ttl if entry.get('hits', len(entry.get('urls', []))) else self.empty_search_ttl
+
+    # ---- sitemap discovery ----
+
+    def _is_career_url(self, url: str) -> bool:
+        path = urlparse(url).path.lower()
+        return any(k in path for k in self.path_keywords)
+
+    def _sitemap_locs(self, url: str, fetch: Callable) -> Tuple[List[str], List[str]]:
+        """Return (page URLs, child sitemap URLs) listed in one sitemap document."""
+        root = ET.fromstring(fetch(url).content)
+        locs = [el.text.strip() for el in root.iter() if el.tag.endswith('loc') and el.text]
+        if root.tag.endswith('sitemapindex'):
+            return [], locs
+        return locs, []
+
+    def _discover_domain(self, base: str, fetch: Callable) -> List[str]:
+        robots = self._robots_for(base, fetch)
+        sitemaps = list(robots.site_maps() or []) if robots else []
+        if not sitemaps:
+            sitemaps = [f"{base}/sitemap.xml"]
+
+        found: List[str] = []
+        queue = list(sitemaps)
+        visited: Set[str] = set()
+        while queue and len(visited) < 10 and len(found) < self.sitemap_max_urls:
+            sitemap_url = queue.pop(0)
+            if sitemap_url in visited:
+                continue
+            visited.add(sitemap_url)
+            try:
+                pages, children = self._sitemap_locs(sitemap_url, fetch)
+            except Exception as e:
+                logger.debug("Sitemap %s unavailable: %s", sitemap_url, e)
+                continue
+            # Child sitemaps that look job-related first (e.g. /sitemap-jobs.xml)
+            children.sort(key=lambda u: not self._is_career_url(u) and 'job' not in u.lower())
+            queue.extend(children)
+            found.extend(u for u in pages if self._is_career_url(u))
+        return found[:self.sitemap_max_urls]
+
+    def discover(self, seeds: Iterable[str], fetch: Callable, now: Optional[float] = None) -> List[str]:
+        """Career URLs from the sitemaps of the seeds' domains (cached for ``sitemap_refresh``)."""
+        now = time.time() if now is None else now
+        bases = sorted({f"{urlparse(u).scheme}://{urlparse(u).netloc}" for u in seeds if urlparse(u).netloc})
+        stale = [b for b in bases
+                 if now - self._state['sitemaps'].get(b, {}).get('checked_at', 0) >= self.sitemap_refresh]
+        if stale:
+            with ThreadPoolExecutor(max_workers=min(len(stale), self.workers)) as pool:
+                for base, urls in zip(stale, pool.map(lambda base: self._discover_domain(base, fetch), stale)):
+                    with self._lock:
+                        self._state['sitemaps'][base] = {'checked_at': now, 'urls': urls}
+        urls: List[str] = []
+        for base in bases:
+            urls.extend(self._state['sitemaps'].get(base, {}).get('urls', []))
+        return urls
+
+    # ---- crawling ----
+
+    def _crawl_one(self, url: str, check_robots: bool, fetch: Callable,
+                   parse: Callable[[bytes, str], Tuple[List[Dict], bool]]) -> List[Dict]:
+        if check_robots and not self.allowed(url, fetch):
+            return []
+        with self._slot(urlparse(url).netloc):
+            content = fetch(url).content
+        jobs, has_json_ld = parse(content, url)
+        if not has_json_ld:
+            with self._lock:
+                self._state['no_jsonld'][url] = time.time()
+        return jobs
+
+    def crawl(self, urls: Iterable[str], fetch: Callable, parse: Callable[[bytes, str], Tuple[List[Dict], bool]],
+              trusted: Iterable[str] = ()) -> List[Dict]:
+        """Fetch and parse ``urls`` concurrently. ``trusted`` URLs skip the robots.txt check."""
+        now = time.time()
+        trusted_set = set(trusted)
+        todo: List[str] = []
+        seen: Set[str] = set()
+        for url in urls:
+            if url in seen or self._known_without_json_ld(url, now):
+                continue
+            seen.add(url)
+            todo.append(url)
+        if not todo:
+            return []
+
+        jobs: List[Dict] = []
+        with ThreadPoolExecutor(max_workers=min(len(todo), self.workers)) as pool:
+            futures = {pool.submit(self._crawl_one, u, u not in trusted_set, fetch, parse): u for u in todo}
+            for future, url in futures.items():
+                try:
+                    jobs.extend(future.result())
+                except Exception as e:
+                    logger.info("Employer page %s failed: %s", url, e)
+        self._prune(now)
+        return jobs
+
+    def _prune(self, now: float):
+        with self._lock:
+            searches = self._state['searches']
+            # Queries for keywords that were dropped from the config
+            for query in [q for q, e in searches.items() if now - e.get('checked_at', 0) >= 4 * self.search_ttl]:
+                del searches[query]
+            no_jsonld = self._state['no_jsonld']
+            for url in [u for u, ts in no_jsonld.items() if now - ts >= self.no_jsonld_ttl]:
+                del no_jsonld[url]
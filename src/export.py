@@ -0,0 +1,177 @@
+"""
+Streaming, date-partitioned export of job history (Parquet via pyarrow, else compressed JSON lines)
+"""
+import argparse
+import gzip
+import importlib.util
+import json
+import logging
+import os
+import time
+import uuid
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ('auto', 'parquet', 'jsonl')
+
+
+def _available(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+class _JsonlWriter:
+    """One JSON object per line, gzip- or zstd-compressed as it is written."""
+
+    def __init__(self, path: str, compression: str):
+        self._file = open(path, 'wb')
+        if compression == 'zstd':
+            import zstandard
+            self._stream = zstandard.ZstdCompressor(level=3).stream_writer(self._file, closefd=False)
+        else:
+            self._stream = gzip.GzipFile(fileobj=self._file, mode='wb', compresslevel=6)
+
+    def write(self, columns: Sequence[str], rows: List[Tuple]):
+        lines = "".join(json.dumps(dict(zip(columns, row)), ensure_ascii=False) + "\n" for row in rows)
+        self._stream.write(lines.encode('utf-8'))
+
+    def close(self):
+        self._stream.close()
+        self._file.close()
+
+
+class _ParquetWriter:
+    """Appends each chunk to one Parquet file as a row group (zstd-compressed columns)."""
+
+    def __init__(self, path: str, columns: Sequence[str]):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        self._pa = pa
+        types = {'id': pa.int64(), 'relevance_score': pa.float64()}
+        self._schema = pa.schema([(c, types.get(c, pa.string())) for c in columns])
+        self._writer = pq.ParquetWriter(path, self._schema, compression='zstd')
+
+    def write(self, columns: Sequence[str], rows: List[Tuple]):
+        pa = self._pa
+        arrays = [pa.array(list(values), type=field.type) for values, field in zip(zip(*rows), self._schema)]
+        self._writer.write_table(pa.Table.from_arrays(arrays, schema=self._schema))
+
+    def close(self):
+        self._writer.close()
+
+
+def export_jobs(database, out_dir: str, fmt: str = 'auto', compression: Optional[str] = None,
+                chunk_rows: int = 10000, incremental: bool = True, max_open: int = 16) -> Dict:
+    """Write jobs to ``out_dir/found_date=YYYY-MM-DD/part-<run>-<n>.<ext>`` in bounded memory.
+
+    ``fmt`` is ``parquet`` (needs pyarrow), ``jsonl`` or ``auto`` (Parquet when
+    pyarrow is installed). JSON lines use zstd when ``zstandard`` is
+    installed, gzip otherwise, unless ``compression`` says which. Rows are
+    read ``chunk_rows`` at a time and appended to the file of their day; at
+    most ``max_open`` files are open at once.
+
+    With ``incremental`` only jobs added since the last export to ``out_dir``
+    are written. Rows are exported as they are at that moment: later status
+    changes of already exported jobs are not re-exported. Files are written
+    under a ``.tmp`` name and renamed, and the position only advances, once
+    the whole run succeeded.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown export format {fmt!r}; use one of {', '.join(FORMATS)}")
+    if fmt == 'auto':
+        fmt = 'parquet' if _available('pyarrow') else 'jsonl'
+    if fmt == 'jsonl':
+        compression = compression or ('zstd' if _available('zstandard') else 'gzip')
+        if compression not in ('zstd', 'gzip'):
+            raise ValueError(f"unknown compression {compression!r}; use zstd or gzip")
+        ext = f"jsonl.{'zst' if compression == 'zstd' else 'gz'}"
+    else:
+        compression = 'zstd'
+        ext = 'parquet'
+
+    target = os.path.abspath(out_dir)
+    after_id = database.get_export_position(target) if incremental else 0
+    columns = database.EXPORT_COLUMNS
+    run = f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:6]}"
+    open_writers: "OrderedDict[str, Tuple[object, str]]" = OrderedDict()
+    pieces: Dict[str, int] = {}
+    tmp_paths: List[str] = []
+    start = time.monotonic()
+    rows_written = 0
+    last_id = after_id
+
+    def _writer(day: str):
+        if day in open_writers:
+            open_writers.move_to_end(day)
+            return open_writers[day][0]
+        if len(open_writers) >= max_open:
+            _, (oldest, _path) = open_writers.popitem(last=False)
+            oldest.close()
+        partition = os.path.join(out_dir, f"found_date={day}")
+        os.makedirs(partition, exist_ok=True)
+        pieces[day] = pieces.get(day, 0) + 1
+        path = os.path.join(partition, f"part-{run}-{pieces[day]:03d}.{ext}.tmp")
+        writer = _ParquetWriter(path, columns) if fmt == 'parquet' else _JsonlWriter(path, compression)
+        tmp_paths.append(path)
+        open_writers[day] = (writer, path)
+        return writer
+
+    found_index = columns.index('found_date')
+    try:
+        for chunk in database.iter_job_chunks(after_id, chunk_rows):
+            by_day: Dict[str, List[Tuple]] = {}
+            for row in chunk:
+                by_day.setdefault((row[found_index] or '')[:10] or 'unknown', []).append(row)
+            for day, rows in by_day.items():
+                _writer(day).write(columns, rows)
+            rows_written += len(chunk)
+            last_id = chunk[-1][0]
+        while open_writers:
+            _, (writer, _path) = open_writers.popitem(last=False)
+            writer.close()
+    except BaseException:
+        for writer, _path in open_writers.values():
+            try:
+                writer.close()
+            except Exception:
+                pass
+        for path in tmp_paths:
+            if os.path.exists(path):
+                os.remove(path)
+        raise
+
+    for path in tmp_paths:
+        os.replace(path, path[:-len('.tmp')])
+    if last_id != after_id:
+        database.set_export_position(target, last_id)
+    result = {
+        'rows': rows_written, 'files': len(tmp_paths), 'partitions': len(pieces), 'format': fmt,
+        'compression': compression, 'first_id': after_id + 1 if rows_written else None, 'last_id': last_id,
+        'seconds': round(time.monotonic() - start, 3),
+    }
+    logger.info("📦 Exported %s jobs to %s (%s files in %s partitions, %s/%s)", rows_written, out_dir,
+                len(tmp_paths), len(pieces), fmt, compression, extra=result)
+    return result
+
+
+def main():
+    from config.settings import get_settings
+    from src.database import JobDatabase
+
+    parser = argparse.ArgumentParser(description="Export job history to date-partitioned files")
+    parser.add_argument('out_dir')
+    parser.add_argument('--format', choices=FORMATS, default='auto')
+    parser.add_argument('--compression', choices=['zstd', 'gzip'], help='JSON lines only')
+    parser.add_argument('--chunk-rows', type=int, default=10000)
+    parser.add_argument('--full', action='store_true', help='export everything, not just new jobs')
+    parser.add_argument('--database', default=get_settings().database_file)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    result = export_jobs(JobDatabase(args.database), args.out_dir, fmt=args.format, compression=args.compression,
+                         chunk_rows=args.chunk_rows, incremental=not args.full)
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
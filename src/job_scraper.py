@@ -1,15 +1,19 @@
 """
 Job scraper module for collecting job listings from various sources
+
+``requests`` and ``bs4`` are imported on first use, so importing this module
+(e.g. for ``JobScraper.generate_job_id``) stays cheap for tools that never fetch.
 """
-import requests
 import hashlib
 import time as _time
 import re
+import html
+import math
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
 from datetime import datetime
-from typing import List, Dict, Optional, Callable, Tuple
-from bs4 import BeautifulSoup
+from typing import List, Dict, Optional, Callable, Tuple, Iterator, TYPE_CHECKING
 import json
 import sys
 import os
@@ -19,34 +23,188 @@ from difflib import SequenceMatcher
 # Add config to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+from src.canonical import company_key
+from src.source_guard import HostGuard, CircuitBreaker, SourceUnavailableError, DeadlineExceededError
+from src.parse_stage import ParseStage, ParseTask
+from src.json_ld import iter_json_ld, iter_job_postings, has_json_ld
+from src.metrics import StageClock
+from config.settings import get_settings
+
+if TYPE_CHECKING:
+    import requests
+
 scraper_logger = logging.getLogger(__name__)
 
 
-def _requests_get_with_retry(url, *, max_retries=3, backoff=1.5, **kwargs):
-    """GET request with exponential-backoff retry on transient errors."""
+_host_guard: Optional[HostGuard] = None
+
+# Per-worker cycle context (cancel event, monotonic deadline, cursor updates, the
+# source's StageClock and its list of deadline hits), set by iter_source_results
+_fetch_ctx = threading.local()
+_FETCH_CTX_ATTRS = ('cancel', 'deadline', 'cursor_updates', 'stages', 'deadline_hits')
+
+
+def _record_stage(stage: str, seconds: float):
+    """Charge ``seconds`` of ``stage`` (fetch, throttle, parse) to the calling worker's source."""
+    clock: Optional[StageClock] = getattr(_fetch_ctx, 'stages', None)
+    if clock is not None:
+        clock.add(stage, seconds)
+
+
+def _deadline_exceeded(message: str) -> DeadlineExceededError:
+    """Build a ``DeadlineExceededError`` and note the hit on the calling worker's source.
+
+    The note survives scrapers that catch the error per board and carry on, so
+    the source is still reported ``timed_out`` and its cursors are not kept.
+    """
+    hits: Optional[List[str]] = getattr(_fetch_ctx, 'deadline_hits', None)
+    if hits is not None:
+        hits.append(message)
+    return DeadlineExceededError(message)
+
+
+def _get_host_guard() -> HostGuard:
+    """Lazily build the process-wide per-host rate limiter / circuit breaker registry."""
+    global _host_guard
+    if _host_guard is None:
+        settings = get_settings()
+        _host_guard = HostGuard(
+            rate=settings.host_rate_limit,
+            burst=settings.host_rate_burst,
+            failure_threshold=settings.circuit_breaker_threshold,
+            cooldown=settings.circuit_breaker_cooldown,
+        )
+    return _host_guard
+
+
+def _requests_get_with_retry(url, *, max_retries=3, backoff=1.5, session=None, **kwargs):
+    """GET request with exponential-backoff retry on transient errors.
+
+    Every attempt goes through the per-host guard: it waits for a rate-limit
+    token and raises ``SourceUnavailableError`` immediately while the host's
+    circuit breaker is open, so dead sources cost no time per cycle.
+
+    If the calling worker belongs to a check cycle with a deadline, request
+    timeouts are clamped to the time left and ``DeadlineExceededError`` is
+    raised once the cycle is cancelled or out of time.
+
+    Pass a ``requests.Session`` as ``session`` to reuse pooled keep-alive
+    connections (and their DNS lookups) across requests to the same host.
+    """
+    import requests
+    guard = _get_host_guard()
+    host = urlparse(url).netloc
+    breaker = guard.breaker(host)
+    cancel: Optional[threading.Event] = getattr(_fetch_ctx, 'cancel', None)
+    deadline: Optional[float] = getattr(_fetch_ctx, 'deadline', None)
     last_exc = None
     for attempt in range(max_retries):
+        remaining = None
+        if cancel is not None and cancel.is_set():
+            raise _deadline_exceeded(f"check cycle cancelled before fetching {host}")
+        if deadline is not None:
+            remaining = deadline - _time.monotonic()
+            if remaining <= 0:
+                raise _deadline_exceeded(f"check cycle deadline reached before fetching {host}")
+            kwargs['timeout'] = min(kwargs.get('timeout') or remaining, remaining)
+        started = _time.perf_counter()
+        try:
+            guard.before_request(host, timeout=remaining)
+        except DeadlineExceededError as exc:
+            raise _deadline_exceeded(str(exc)) from None
+        fetch_started = _time.perf_counter()
+        _record_stage('throttle', fetch_started - started)
         try:
-            resp = requests.get(url, **kwargs)
+            try:
+                resp = (session or requests).get(url, **kwargs)
+            finally:
+                _record_stage('fetch', _time.perf_counter() - fetch_started)
             resp.raise_for_status()
+            breaker.record_success()
             return resp
-        except (requests.ConnectionError, requests.Timeout) as exc:
-            last_exc = exc
-            wait = backoff * (2 ** attempt)
-            scraper_logger.warning(f"Retry {attempt+1}/{max_retries} for {url}: {exc} (wait {wait:.1f}s)")
-            _time.sleep(wait)
         except requests.HTTPError as exc:
             status = exc.response.status_code if exc.response is not None else 0
-            if status in (429, 500, 502, 503, 504):
-                last_exc = exc
-                wait = backoff * (2 ** attempt)
-                scraper_logger.warning(f"Retry {attempt+1}/{max_retries} for {url}: HTTP {status} (wait {wait:.1f}s)")
-                _time.sleep(wait)
-            else:
+            if status not in (429, 500, 502, 503, 504):
+                breaker.record_success()  # host answered; the request itself is bad
                 raise
+            last_exc = exc
+            breaker.record_failure()
+            reason = f"HTTP {status}"
+        except requests.RequestException as exc:
+            last_exc = exc
+            breaker.record_failure()
+            reason = str(exc)
+        except BaseException:
+            # Anything else (a decode error, an interrupt) still gives back a half-open trial
+            breaker.cancel_trial()
+            raise
+        if attempt + 1 >= max_retries or breaker.state != CircuitBreaker.CLOSED:
+            break
+        wait = backoff * (2 ** attempt)
+        scraper_logger.warning("Retry %s/%s for %s: %s (wait %.1fs)",
+                               attempt+1, max_retries, url, reason, wait)
+        if cancel is not None:
+            if cancel.wait(wait):
+                break
+        else:
+            _time.sleep(wait)
     raise last_exc  # type: ignore[misc]
 
 
+def _with_fetch_ctx(fn: Callable) -> Callable:
+    """Wrap ``fn`` so it runs with the calling thread's cycle context (deadline, cancel) in any thread."""
+    ctx = {name: getattr(_fetch_ctx, name, None) for name in _FETCH_CTX_ATTRS}
+
+    def _wrapped(*args, **kwargs):
+        saved = {name: getattr(_fetch_ctx, name, None) for name in _FETCH_CTX_ATTRS}
+        for name, value in ctx.items():
+            setattr(_fetch_ctx, name, value)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            for name, value in saved.items():
+                setattr(_fetch_ctx, name, value)
+    return _wrapped
+
+
+def _timed_parse(fn: Callable, *args):
+    """Run a parse function inline, charging its time to the source's ``parse`` stage."""
+    started = _time.perf_counter()
+    try:
+        return fn(*args)
+    finally:
+        _record_stage('parse', _time.perf_counter() - started)
+
+
+def _to_epoch(value) -> Optional[float]:
+    """Best-effort conversion of an API timestamp (epoch s/ms or ISO-8601) to epoch seconds."""
+    if value is None or value == '':
+        return None
+    if isinstance(value, (int, float)):
+        v = float(value)
+        return v / 1000 if v > 1e11 else v
+    try:
+        return datetime.fromisoformat(str(value).strip().replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return None
+
+
+_HTML_BREAK_RE = re.compile(r"<\s*(?:p|br)\s*/?>", re.IGNORECASE)
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _strip_html(fragment: str) -> str:
+    """Cheap HTML-to-text for small trusted fragments (paragraphs become newlines)."""
+    text = _HTML_BREAK_RE.sub("\n", fragment)
+    return html.unescape(_HTML_TAG_RE.sub(" ", text))
+
+
+def _soup(markup):
+    """BeautifulSoup DOM of ``markup``; bs4 is only imported by sources that need a DOM."""
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(markup, 'html.parser')
+
+
 class JobScraper:
     def __init__(self, timeout: int = 10):
         self.timeout = timeout
@@ -54,17 +212,87 @@ class JobScraper:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         
-        # Import config for API keys
-        try:
-            from config.config import INDEED_API_KEY, INDEED_PUBLISHER_ID, LINKEDIN_API_KEY
-            self.indeed_api_key = INDEED_API_KEY
-            self.indeed_publisher_id = INDEED_PUBLISHER_ID
-            self.linkedin_api_key = LINKEDIN_API_KEY
-        except:
-            self.indeed_api_key = ""
-            self.indeed_publisher_id = ""
-            self.linkedin_api_key = ""
+        settings = get_settings()
+        self.indeed_api_key = settings.indeed_api_key
+        self.indeed_publisher_id = settings.indeed_publisher_id
+        self.linkedin_api_key = settings.linkedin_api_key
+
+        # label -> 'ok' | 'failed' | 'timed_out' for the most recent scrape_all_sources
+        self.last_source_status: Dict[str, str] = {}
+        self.last_source_results: Dict[str, List[Dict]] = {}
+        self.last_source_durations: Dict[str, float] = {}  # label -> seconds spent scraping
+        self.last_source_timings: Dict[str, Dict[str, float]] = {}  # label -> {fetch|throttle|parse: seconds}
+
+        # Incremental fetching: committed high-water marks {key: (ts, id)} and the
+        # advances made by the last scrape, persisted by the caller once jobs are stored
+        self._cursors: Dict[str, Tuple[float, Optional[str]]] = {}
+        self._pending_cursors: Dict[str, Tuple[float, Optional[str]]] = {}
+
+        self._parser: Optional[ParseStage] = None
+        self._session: Optional['requests.Session'] = None
+        self._crawler = None
+
+    @staticmethod
+    def source_health() -> Dict[str, Dict]:
+        """Circuit-breaker state per host, as tracked by the fetch layer."""
+        return _get_host_guard().states()
+
+    @staticmethod
+    def dump_state() -> Dict:
+        """Fetch-layer state worth keeping across a restart (circuit breakers per host)."""
+        return {'hosts': _get_host_guard().dump_state()}
+
+    @staticmethod
+    def load_state(state: Dict, elapsed: float = 0.0):
+        """Restore ``dump_state`` output taken ``elapsed`` seconds ago."""
+        _get_host_guard().load_state(state.get('hosts', {}), elapsed)
     
+    # ---------- Incremental fetching (per-source high-water marks) ----------
+    def load_cursors(self, cursors: Dict[str, Tuple[float, Optional[str]]]):
+        """Seed high-water marks, e.g. from ``JobDatabase.get_source_cursors()``."""
+        self._cursors.update(cursors)
+
+    def pending_cursors(self) -> Dict[str, Tuple[float, Optional[str]]]:
+        """Cursor advances from the last scrape that have not been committed yet."""
+        return dict(self._pending_cursors)
+
+    def commit_cursors(self, cursors: Dict[str, Tuple[float, Optional[str]]]):
+        """Make persisted advances effective for the next scrape."""
+        for key, value in cursors.items():
+            if key not in self._cursors or value[0] > self._cursors[key][0]:
+                self._cursors[key] = value
+            self._pending_cursors.pop(key, None)
+
+    def _cursor_key(self, source: str, keywords: List[str]) -> str:
+        """Cursor key for ``source`` under this keyword set.
+
+        Postings below a high-water mark are never fetched again, including
+        the ones that failed the keyword filter, so a changed keyword or
+        profile set starts its own cursor and rescans what is still listed.
+        """
+        return f"{source}#{self._keywords_key(keywords)[:12]}"
+
+    def _cursor_ts(self, key: str) -> Optional[float]:
+        cur = self._cursors.get(key)
+        return cur[0] if cur else None
+
+    def _advance_cursor(self, key: str, ts: Optional[float], item_id=None):
+        if ts is None:
+            return
+        updates = getattr(_fetch_ctx, 'cursor_updates', None)
+        if updates is None:
+            updates = self._pending_cursors
+        best = updates.get(key) or self._cursors.get(key)
+        if best is None or ts > best[0]:
+            updates[key] = (ts, str(item_id) if item_id is not None else None)
+
+    def _fromage_days(self, key: str, max_days: int = 7) -> int:
+        """Days back to request from APIs that filter by age (Indeed ``fromage``)."""
+        since = self._cursor_ts(key)
+        if since is None:
+            return max_days
+        return max(1, min(max_days, math.ceil((_time.time() - since) / 86400)))
+
     @staticmethod
     def generate_job_id(job_data: Dict) -> str:
         """Generate unique ID for job"""
@@ -75,9 +303,14 @@ class JobScraper:
     def _normalize_text(text: str) -> str:
         return " ".join((text or "").split()).strip().lower()
 
-    def _keyword_match(self, text: str, keywords: List[str]) -> bool:
-        haystack = self._normalize_text(text)
-        return any(self._normalize_text(k) in haystack for k in keywords if k)
+    @staticmethod
+    def _keywords_key(keywords: List[str]) -> str:
+        return hashlib.md5("\n".join(sorted(JobScraper._normalize_text(k) for k in keywords)).encode()).hexdigest()
+
+    @staticmethod
+    def _keyword_match(text: str, keywords: List[str]) -> bool:
+        haystack = JobScraper._normalize_text(text)
+        return any(JobScraper._normalize_text(k) in haystack for k in keywords if k)
 
     # ---------- Fuzzy deduplication ----------
     @staticmethod
@@ -86,22 +319,21 @@ class JobScraper:
 
     @classmethod
     def deduplicate_jobs(cls, jobs: List[Dict], threshold: float = 0.85) -> List[Dict]:
-        """Remove near-duplicate jobs (same title+company from different sources)."""
+        """Remove near-duplicate jobs (similar title at the same company, from different sources).
+
+        Companies match by canonical name ("Stripe" is "Stripe, Inc."), titles by fuzzy ratio.
+        """
         unique: List[Dict] = []
+        titles: Dict[str, List[str]] = {}
         for job in jobs:
             jtitle = job.get('title', '')
-            jcomp = job.get('company', '')
-            is_dup = False
-            for kept in unique:
-                if (cls._sim(jtitle, kept.get('title', '')) > threshold
-                        and cls._sim(jcomp, kept.get('company', '')) > threshold):
-                    is_dup = True
-                    break
-            if not is_dup:
+            kept = titles.setdefault(company_key(job.get('company') or ''), [])
+            if not any(cls._sim(jtitle, ktitle) > threshold for ktitle in kept):
+                kept.append(jtitle)
                 unique.append(job)
         removed = len(jobs) - len(unique)
         if removed:
-            print(f"🧹 Removed {removed} near-duplicate job(s)")
+            scraper_logger.info("🧹 Removed %s near-duplicate job(s)", removed)
         return unique
 
     # ---------- Relevance scoring ----------
@@ -110,9 +342,14 @@ class JobScraper:
                   title_weight: float = 3.0,
                   desc_weight: float = 1.0) -> float:
         """Score a job by keyword relevance (higher = better match)."""
+        return JobScraper.score_text((job.get('title') or '').lower(), (job.get('description') or '').lower(),
+                                     keywords, title_weight, desc_weight)
+
+    @staticmethod
+    def score_text(title: str, desc: str, keywords: List[str],
+                   title_weight: float = 3.0, desc_weight: float = 1.0) -> float:
+        """``score_job`` on an already lower-cased title and description (scoring many keyword sets)."""
         score = 0.0
-        title = (job.get('title') or '').lower()
-        desc = (job.get('description') or '').lower()
         for kw in keywords:
             kw_low = kw.lower().strip()
             if not kw_low:
@@ -137,51 +374,6 @@ class JobScraper:
             j['relevance_score'] = cls.score_job(j, keywords)
         return sorted(jobs, key=lambda j: j.get('relevance_score', 0), reverse=True)
 
-    def _extract_json_ld_jobs(self, soup: BeautifulSoup, base_url: str, source_name: str, keywords: List[str]) -> List[Dict]:
-        jobs = []
-        scripts = soup.find_all("script", attrs={"type": "application/ld+json"})
-        for script in scripts:
-            try:
-                data = json.loads(script.string or "")
-            except Exception:
-                continue
-
-            items = data if isinstance(data, list) else [data]
-            for item in items:
-                if isinstance(item, dict) and item.get("@type") == "JobPosting":
-                    title = item.get("title", "")
-                    description = item.get("description", "")
-                    if keywords and not self._keyword_match(f"{title} {description}", keywords):
-                        continue
-
-                    hiring_org = item.get("hiringOrganization", {}) or {}
-                    company = hiring_org.get("name", "") if isinstance(hiring_org, dict) else str(hiring_org)
-                    job_url = item.get("url") or item.get("applicationUrl") or base_url
-                    if job_url and job_url.startswith("/"):
-                        job_url = urljoin(base_url, job_url)
-
-                    location = ""
-                    job_location = item.get("jobLocation")
-                    if isinstance(job_location, dict):
-                        address = job_location.get("address", {}) or {}
-                        location = address.get("addressLocality") or address.get("addressRegion") or address.get("addressCountry") or ""
-                    elif isinstance(job_location, list) and job_location:
-                        address = job_location[0].get("address", {}) if isinstance(job_location[0], dict) else {}
-                        location = address.get("addressLocality") or address.get("addressRegion") or address.get("addressCountry") or ""
-
-                    job = {
-                        'title': title or 'N/A',
-                        'company': company or 'N/A',
-                        'location': location or 'N/A',
-                        'job_url': job_url or base_url,
-                        'description': BeautifulSoup(description, 'html.parser').get_text(" ")[:1000] if description else '',
-                        'source': source_name,
-                        'posted_date': item.get("datePosted", datetime.now().isoformat()),
-                    }
-                    job['job_id'] = self.generate_job_id(job)
-                    jobs.append(job)
-        return jobs
-
     def _extract_result_url(self, href: str) -> Optional[str]:
         if not href:
             return None
@@ -192,12 +384,13 @@ class JobScraper:
                 return unquote(uddg[0])
         return href
 
-    def _search_duckduckgo(self, query: str, max_results: int) -> List[str]:
+    def _search_duckduckgo(self, query: str, max_results: int) -> Optional[List[str]]:
+        """Result URLs for ``query``; None if the search itself failed (so it is not cached)."""
         urls = []
         try:
             url = "https://duckduckgo.com/html/"
             response = _requests_get_with_retry(url, params={"q": query}, timeout=self.timeout, headers=self.headers)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = _soup(response.content)
             for link in soup.select("a.result__a"):
                 href = self._extract_result_url(link.get("href"))
                 if href and href.startswith("http"):
@@ -205,68 +398,105 @@ class JobScraper:
                 if len(urls) >= max_results:
                     break
         except Exception as e:
-            print(f"❌ Error searching DuckDuckGo: {e}")
+            scraper_logger.error("❌ Error searching DuckDuckGo: %s", e)
+            return None
         return urls
 
+    def _http_session(self) -> 'requests.Session':
+        """Shared keep-alive session for crawlers that hit the same hosts repeatedly."""
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            session = requests.Session()
+            session.headers.update(self.headers)
+            adapter = HTTPAdapter(pool_connections=64, pool_maxsize=16)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+
     def scrape_employer_site_url(self, url: str, keywords: List[str]) -> List[Dict]:
         jobs = []
         try:
-            response = _requests_get_with_retry(url, timeout=self.timeout, headers=self.headers)
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            domain = urlparse(url).netloc
-            source_name = f"Employer Site: {domain}"
-            jobs.extend(self._extract_json_ld_jobs(soup, url, source_name, keywords))
+            response = _requests_get_with_retry(url, timeout=self.timeout, session=self._http_session())
+            # JSON-LD is extracted by byte scanning, cheap enough to do in the fetch thread
+            found, _has_json_ld = _timed_parse(_parse_employer_page, response.content, url,
+                                               f"Employer Site: {urlparse(url).netloc}", keywords)
+            jobs.extend(found)
         except Exception as e:
-            print(f"❌ Error scraping employer site {url}: {e}")
+            scraper_logger.error("❌ Error scraping employer site %s: %s", url, e)
         return jobs
 
-    def scrape_employer_sites(self, keywords: List[str]) -> List[Dict]:
-        jobs = []
-        try:
-            from config.config import (
-                EMPLOYER_SITE_URLS,
-                SEARCH_ENGINE_ENABLED,
-                SEARCH_ENGINE_PROVIDER,
-                SEARCH_ENGINE_MAX_RESULTS,
-                EMPLOYER_SITE_PATH_KEYWORDS,
+    def _employer_crawler(self, path_keywords: List[str]):
+        if self._crawler is None:
+            from src.employer_crawler import EmployerCrawler
+            settings = get_settings()
+            self._crawler = EmployerCrawler(
+                path_keywords=path_keywords,
+                state_file=settings.employer_crawl_state_file,
+                workers=settings.employer_crawl_workers,
+                per_domain_limit=settings.employer_per_domain_limit,
+                sitemap_refresh=settings.employer_sitemap_refresh,
+                sitemap_max_urls=settings.employer_sitemap_max_urls,
+                no_jsonld_ttl=settings.employer_no_jsonld_ttl,
+                search_ttl=settings.search_cache_ttl,
+                empty_search_ttl=settings.search_empty_cache_ttl,
             )
-        except Exception:
-            EMPLOYER_SITE_URLS = []
-            SEARCH_ENGINE_ENABLED = False
-            SEARCH_ENGINE_PROVIDER = "duckduckgo"
-            SEARCH_ENGINE_MAX_RESULTS = 10
-            EMPLOYER_SITE_PATH_KEYWORDS = ["careers", "career", "jobs", "job", "vacancies", "opportunities", "openings"]
+        return self._crawler
 
-        seen_urls = set()
+    def scrape_employer_sites(self, keywords: List[str]) -> List[Dict]:
+        settings = get_settings()
+        crawler = self._employer_crawler(settings.employer_site_path_keywords)
+        session = self._http_session()
+        # Bound to this call's cycle context so the crawler's threads honour its deadline;
+        # passed per call because the crawler (and its state) is shared across cycles
+        fetch = _with_fetch_ctx(
+            lambda page_url: _requests_get_with_retry(page_url, timeout=self.timeout, session=session)
+        )
+        parse = _with_fetch_ctx(lambda content, page_url: _timed_parse(
+            _parse_employer_page, content, page_url, f"Employer Site: {urlparse(page_url).netloc}", keywords))
 
+        try:
+            return self._scrape_employer_sites(crawler, fetch, parse, keywords, settings.employer_site_urls,
+                                               settings.search_engine_enabled, settings.search_engine_provider,
+                                               settings.search_engine_max_results,
+                                               settings.employer_sitemap_discovery)
+        finally:
+            # Keep search/sitemap results even when the cycle deadline cut the crawl short
+            crawler.save_state()
+
+    def _scrape_employer_sites(self, crawler, fetch: Callable, parse: Callable, keywords: List[str],
+                               site_urls: List[str], search_enabled: bool, provider: str, max_results: int,
+                               sitemap_discovery: bool) -> List[Dict]:
+        jobs = []
         # 1) Direct employer URLs (manual list)
-        for site_url in EMPLOYER_SITE_URLS or []:
-            if site_url not in seen_urls:
-                seen_urls.add(site_url)
-                jobs.extend(self.scrape_employer_site_url(site_url, keywords))
-
-        # 2) Search-engine discovery (no API keys)
-        if SEARCH_ENGINE_ENABLED:
-            for keyword in keywords:
-                query = f"{keyword} careers OR jobs site:.com"
-                if SEARCH_ENGINE_PROVIDER == "duckduckgo":
-                    results = self._search_duckduckgo(query, SEARCH_ENGINE_MAX_RESULTS)
-                else:
-                    results = []
-
-                for result_url in results:
-                    path = urlparse(result_url).path.lower()
-                    if any(k in path for k in EMPLOYER_SITE_PATH_KEYWORDS):
-                        if result_url not in seen_urls:
-                            seen_urls.add(result_url)
-                            jobs.extend(self.scrape_employer_site_url(result_url, keywords))
-
+        direct = list(site_urls or [])
+
+        # 2) Search-engine discovery (no API keys), one query per keyword. Results are
+        #    cached on disk for SEARCH_CACHE_TTL (SEARCH_EMPTY_CACHE_TTL when a search came
+        #    back empty); cached URLs are re-scraped directly.
+        found: List[str] = []
+        searched = 0
+        if search_enabled and provider == "duckduckgo" and keywords:
+            queries = [f"{keyword} careers OR jobs site:.com" for keyword in keywords]
+            search = _with_fetch_ctx(lambda q: self._search_duckduckgo(q, max_results))
+            found, searched = crawler.search(queries, search)
+
+        # 3) Sitemap discovery on the same domains (cached; refreshed once a day)
+        discovered: List[str] = []
+        if sitemap_discovery:
+            discovered = crawler.discover(direct + found, fetch)
+
+        jobs.extend(crawler.crawl(direct + found + discovered, fetch, parse, trusted=direct))
+
+        scraper_logger.info("✅ Found %s jobs from employer sites (%s direct, %s from search [%s queries answered], %s from sitemaps)",
+                            len(jobs), len(direct), len(found), searched, len(discovered))
         return jobs
     
     def scrape_github_jobs(self, keywords: List[str]) -> List[Dict]:
         """Scrape jobs from GitHub Jobs API"""
         jobs = []
+        cursor_key = self._cursor_key('github_jobs', keywords)
         
         for keyword in keywords:
             try:
@@ -275,8 +505,13 @@ class JobScraper:
                 
                 response = _requests_get_with_retry(url, params=params, timeout=self.timeout, headers=self.headers)
                 data = response.json()
+                since = self._cursor_ts(cursor_key)
                 
                 for job_data in data:
+                    ts = _to_epoch(job_data.get('created_at'))
+                    if since is not None and ts is not None and ts < since:
+                        continue
+                    self._advance_cursor(cursor_key, ts, job_data.get('id'))
                     job = {
                         'title': job_data.get('title', ''),
                         'company': job_data.get('company', ''),
@@ -289,10 +524,13 @@ class JobScraper:
                     job['job_id'] = self.generate_job_id(job)
                     jobs.append(job)
                 
-                print(f"✅ Found {len(data)} jobs from GitHub Jobs for '{keyword}'")
+                scraper_logger.debug("✅ Found %s jobs from GitHub Jobs for '%s'", len(data), keyword)
             
+            except SourceUnavailableError as e:
+                scraper_logger.info("⏸️  GitHub Jobs skipped: %s", e)
+                break
             except Exception as e:
-                print(f"❌ Error scraping GitHub Jobs: {e}")
+                scraper_logger.error("❌ Error scraping GitHub Jobs: %s", e)
         
         return jobs
     
@@ -304,7 +542,7 @@ class JobScraper:
             response = _requests_get_with_retry(url, timeout=self.timeout, headers=self.headers)
             
             # This is a basic template - customize based on the website structure
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = _soup(response.content)
             
             # Find job listings (customize selectors based on the website)
             job_listings = soup.find_all('div', class_=['job-card', 'job-listing', 'job-result'])
@@ -325,10 +563,10 @@ class JobScraper:
                 except:
                     continue
             
-            print(f"✅ Found {len(jobs)} jobs from {source_name}")
+            scraper_logger.info("✅ Found %s jobs from %s", len(jobs), source_name)
         
         except Exception as e:
-            print(f"❌ Error scraping {source_name}: {e}")
+            scraper_logger.error("❌ Error scraping %s: %s", source_name, e)
         
         return jobs
     
@@ -337,9 +575,11 @@ class JobScraper:
         jobs = []
         
         if not self.indeed_api_key or not self.indeed_publisher_id:
-            print("⚠️  Indeed API key not configured (using web scraping fallback)")
+            scraper_logger.warning("⚠️  Indeed API key not configured (using web scraping fallback)")
             return jobs
         
+        cursor_key = self._cursor_key('indeed', keywords)
+        fromage = self._fromage_days(cursor_key)
         for keyword in keywords:
             try:
                 url = "https://api.indeed.com/ads/apisearch"
@@ -354,13 +594,14 @@ class JobScraper:
                     'jt': 'internship',
                     'start': '0',
                     'limit': '25',
-                    'fromage': '7',
+                    'fromage': str(fromage),
                     'format': 'json',
                     'userip': '1.2.3.4',
                     'useragent': 'Mozilla/5.0'
                 }
                 
                 response = _requests_get_with_retry(url, params=params, timeout=self.timeout)
+                self._advance_cursor(cursor_key, _time.time())
                 
                 data = response.json()
                 
@@ -378,10 +619,14 @@ class JobScraper:
                         job['job_id'] = self.generate_job_id(job)
                         jobs.append(job)
                     
-                    print(f"✅ Found {len(data.get('results', [])[:10])} jobs from Indeed API for '{keyword}'")
+                    scraper_logger.debug("✅ Found %s jobs from Indeed API for '%s'",
+                                         len(data.get('results', [])[:10]), keyword)
             
+            except SourceUnavailableError as e:
+                scraper_logger.info("⏸️  Indeed API skipped: %s", e)
+                break
             except Exception as e:
-                print(f"❌ Error scraping Indeed API: {e}")
+                scraper_logger.error("❌ Error scraping Indeed API: %s", e)
         
         return jobs
     
@@ -390,7 +635,7 @@ class JobScraper:
         jobs = []
         
         if not self.linkedin_api_key:
-            print("⚠️  LinkedIn API key not configured (using web scraping fallback)")
+            scraper_logger.warning("⚠️  LinkedIn API key not configured (using web scraping fallback)")
             return jobs
         
         try:
@@ -425,13 +670,14 @@ class JobScraper:
                         job['job_id'] = self.generate_job_id(job)
                         jobs.append(job)
                     
-                    print(f"✅ Found {len(jobs_list)} jobs from LinkedIn API for '{keyword}'")
+                    scraper_logger.debug("✅ Found %s jobs from LinkedIn API for '%s'",
+                                         len(jobs_list), keyword)
                 
                 except Exception as e:
-                    print(f"❌ Error with LinkedIn API for '{keyword}': {e}")
+                    scraper_logger.error("❌ Error with LinkedIn API for '%s': %s", keyword, e)
         
         except ImportError:
-            print("⚠️  LinkedIn API library not installed (using web scraping)")
+            scraper_logger.warning("⚠️  LinkedIn API library not installed (using web scraping)")
         
         return jobs
     
@@ -440,9 +686,11 @@ class JobScraper:
         jobs = []
         
         if not self.indeed_api_key or not self.indeed_publisher_id:
-            print("⚠️  Indeed API keys not configured")
+            scraper_logger.warning("⚠️  Indeed API keys not configured")
             return jobs
         
+        cursor_key = self._cursor_key('indeed', keywords)
+        fromage = self._fromage_days(cursor_key)
         for keyword in keywords:
             try:
                 url = "https://api.indeed.com/ads/apisearch"
@@ -456,13 +704,14 @@ class JobScraper:
                     'jt': 'internship',
                     'start': '0',
                     'limit': '25',
-                    'fromage': '7',
+                    'fromage': str(fromage),
                     'format': 'json',
                     'userip': '1.2.3.4',
                     'useragent': 'Mozilla/5.0'
                 }
                 
                 response = _requests_get_with_retry(url, params=params, timeout=self.timeout)
+                self._advance_cursor(cursor_key, _time.time())
                 
                 data = response.json()
                 
@@ -480,59 +729,52 @@ class JobScraper:
                         job['job_id'] = self.generate_job_id(job)
                         jobs.append(job)
                     
-                    print(f"✅ Found {min(len(data.get('results', [])), 10)} jobs from Indeed API for '{keyword}'")
+                    scraper_logger.debug("✅ Found %s jobs from Indeed API for '%s'",
+                                         min(len(data.get('results', [])), 10), keyword)
             
+            except SourceUnavailableError as e:
+                scraper_logger.info("⏸️  Indeed API skipped: %s", e)
+                break
             except Exception as e:
-                print(f"❌ Error with Indeed API: {e}")
+                scraper_logger.error("❌ Error with Indeed API: %s", e)
         
         return jobs
 
     def scrape_indeed_snapshot(self, keywords: List[str]) -> List[Dict]:
         """Scrape Indeed for jobs (basic version without API)"""
         jobs = []
+        pending: List[Tuple[str, ParseTask]] = []
 
+        cursor_key = self._cursor_key('indeed', keywords)
+        fromage = self._fromage_days(cursor_key)
         for keyword in keywords:
             try:
-                url = f"https://www.indeed.com/jobs?q={keyword}+internship&limit=25"
+                url = f"https://www.indeed.com/jobs?q={keyword}+internship&limit=25&fromage={fromage}"
 
                 response = _requests_get_with_retry(url, timeout=self.timeout, headers=self.headers)
+                self._advance_cursor(cursor_key, _time.time())
+                pending.append((keyword, self._submit_parse(_parse_indeed_page, response.content)))
 
-                soup = BeautifulSoup(response.content, 'html.parser')
-
-                # Indeed uses dynamic loading, so this captures only visible results
-                job_cards = soup.find_all('div', class_='job_seen_beacon')
-
-                for card in job_cards[:10]:  # Limit to 10 per keyword
-                    try:
-                        title_elem = card.find('h2', class_='jobTitle')
-                        company_elem = card.find('span', class_='companyName')
-                        location_elem = card.find('div', class_='companyLocation')
-                        link_elem = card.find('a', href=True)
-
-                        job = {
-                            'title': title_elem.get_text(strip=True) if title_elem else 'N/A',
-                            'company': company_elem.get_text(strip=True) if company_elem else 'N/A',
-                            'location': location_elem.get_text(strip=True) if location_elem else 'N/A',
-                            'job_url': 'https://www.indeed.com' + (link_elem.get('href') if link_elem else ''),
-                            'description': card.find('div', class_='job-snippet').get_text(" ", strip=True) if card.find('div', class_='job-snippet') else '',
-                            'source': 'Indeed (Web)',
-                            'posted_date': datetime.now().isoformat(),
-                        }
-                        job['job_id'] = self.generate_job_id(job)
-                        jobs.append(job)
-                    except Exception:
-                        continue
-
-                print(f"✅ Found {len(job_cards[:10])} jobs from Indeed for '{keyword}'")
+            except SourceUnavailableError as e:
+                scraper_logger.info("⏸️  Indeed skipped: %s", e)
+                break
+            except Exception as e:
+                scraper_logger.error("❌ Error scraping Indeed: %s", e)
 
+        for keyword, task in pending:
+            try:
+                found = self._parse_result(task)
+                jobs.extend(found)
+                scraper_logger.debug("✅ Found %s jobs from Indeed for '%s'", len(found), keyword)
             except Exception as e:
-                print(f"❌ Error scraping Indeed: {e}")
+                scraper_logger.error("❌ Error parsing Indeed results: %s", e)
 
         return jobs
     
     def scrape_linkedin_jobs(self, keywords: List[str]) -> List[Dict]:
         """Scrape LinkedIn Jobs"""
         jobs = []
+        pending: List[Tuple[str, ParseTask]] = []
         
         for keyword in keywords:
             try:
@@ -541,46 +783,31 @@ class JobScraper:
                 url = f"https://www.linkedin.com/jobs/search/?keywords={search_term}&position=1&pageNum=0"
                 
                 response = _requests_get_with_retry(url, timeout=self.timeout, headers=self.headers)
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Find job listings in LinkedIn's structure
-                job_cards = soup.find_all('div', class_='base-card')
-                
-                for card in job_cards[:8]:  # Limit to 8 per keyword
-                    try:
-                        title_elem = card.find('h3', class_='base-search-card__title')
-                        company_elem = card.find('h4', class_='base-search-card__subtitle')
-                        location_elem = card.find('span', class_='job-search-card__location')
-                        link_elem = card.find('a', class_='base-card__full-link')
-                        
-                        job = {
-                            'title': title_elem.text.strip() if title_elem else 'N/A',
-                            'company': company_elem.text.strip() if company_elem else 'N/A',
-                            'location': location_elem.text.strip() if location_elem else 'N/A',
-                            'job_url': link_elem.get('href', '') if link_elem else '#',
-                            'description': '',
-                            'source': 'LinkedIn',
-                            'posted_date': datetime.now().isoformat(),
-                        }
-                        job['job_id'] = self.generate_job_id(job)
-                        jobs.append(job)
-                    except:
-                        continue
-                
-                if len(job_cards) > 0:
-                    print(f"✅ Found {min(len(job_cards), 8)} jobs from LinkedIn for '{keyword}'")
-                else:
-                    print(f"⚠️  No jobs found on LinkedIn for '{keyword}' (may need login)")
+                pending.append((keyword, self._submit_parse(_parse_linkedin_page, response.content)))
             
+            except SourceUnavailableError as e:
+                scraper_logger.info("⏸️  LinkedIn skipped: %s", e)
+                break
             except Exception as e:
-                print(f"❌ Error scraping LinkedIn: {e}")
+                scraper_logger.error("❌ Error scraping LinkedIn: %s", e)
+
+        for keyword, task in pending:
+            try:
+                found = self._parse_result(task)
+                jobs.extend(found)
+                if found:
+                    scraper_logger.debug("✅ Found %s jobs from LinkedIn for '%s'", len(found), keyword)
+                else:
+                    scraper_logger.info("⚠️  No jobs found on LinkedIn for '%s' (may need login)", keyword)
+            except Exception as e:
+                scraper_logger.error("❌ Error parsing LinkedIn results: %s", e)
         
         return jobs
     
     def scrape_stackoverflow_jobs(self, keywords: List[str]) -> List[Dict]:
         """Scrape Stack Overflow Jobs"""
         jobs = []
+        pending: List[Tuple[str, ParseTask]] = []
         
         try:
             # Stack Overflow Jobs API/scraping
@@ -590,42 +817,24 @@ class JobScraper:
                     url = f"https://stackoverflow.com/jobs?q={search_term}&sort=i"
                     
                     response = _requests_get_with_retry(url, timeout=self.timeout, headers=self.headers)
-                    
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    
-                    # Find job listings
-                    job_cards = soup.find_all('div', class_='s-job-card')
-                    
-                    for card in job_cards[:8]:  # Limit to 8 per keyword
-                        try:
-                            title_elem = card.find('h2')
-                            company_elem = card.find('h3')
-                            link_elem = card.find('a', class_='s-link')
-                            
-                            job = {
-                                'title': title_elem.text.strip() if title_elem else 'N/A',
-                                'company': company_elem.text.strip() if company_elem else 'N/A',
-                                'location': 'Remote',
-                                'job_url': 'https://stackoverflow.com' + link_elem.get('href', '') if link_elem else '#',
-                                'description': '',
-                                'source': 'Stack Overflow',
-                                'posted_date': datetime.now().isoformat(),
-                            }
-                            job['job_id'] = self.generate_job_id(job)
-                            jobs.append(job)
-                        except:
-                            continue
-                    
-                    if len(job_cards) > 0:
-                        print(f"✅ Found {min(len(job_cards), 8)} jobs from Stack Overflow for '{keyword}'")
-                    else:
-                        print(f"⚠️  No jobs found on Stack Overflow for '{keyword}'")
+                    pending.append((keyword, self._submit_parse(_parse_stackoverflow_page, response.content)))
                 
+                except SourceUnavailableError as e:
+                    scraper_logger.info("⏸️  Stack Overflow skipped: %s", e)
+                    break
                 except Exception as e:
-                    print(f"❌ Error scraping Stack Overflow: {e}")
+                    scraper_logger.error("❌ Error scraping Stack Overflow: %s", e)
+
+            for keyword, task in pending:
+                found = self._parse_result(task)
+                jobs.extend(found)
+                if found:
+                    scraper_logger.debug("✅ Found %s jobs from Stack Overflow for '%s'", len(found), keyword)
+                else:
+                    scraper_logger.info("⚠️  No jobs found on Stack Overflow for '%s'", keyword)
         
         except Exception as e:
-            print(f"❌ Error with Stack Overflow scraper: {e}")
+            scraper_logger.error("❌ Error with Stack Overflow scraper: %s", e)
         
         return jobs
 
@@ -633,20 +842,21 @@ class JobScraper:
     #  NEW FREE SOURCES (no API keys required)
     # ----------------------------------------------------------------
 
-    def scrape_greenhouse_boards(self, keywords: List[str]) -> List[Dict]:
-        """Scrape Greenhouse job boards (JSON API, no key needed)."""
+    def scrape_greenhouse_boards(self, keywords: List[str], boards: Optional[List[str]] = None) -> List[Dict]:
+        """Scrape Greenhouse job boards (JSON API, no key needed); ``boards`` defaults to the config."""
         jobs = []
-        try:
-            from config.config import GREENHOUSE_BOARDS
-        except Exception:
-            GREENHOUSE_BOARDS = []
-
-        for company in GREENHOUSE_BOARDS:
+        for company in (get_settings().greenhouse_boards if boards is None else boards):
             try:
                 url = f"https://boards-api.greenhouse.io/v1/boards/{company}/jobs"
                 response = _requests_get_with_retry(url, timeout=self.timeout, headers=self.headers)
                 data = response.json()
+                cursor_key = self._cursor_key(f"greenhouse:{company}", keywords)
+                since = self._cursor_ts(cursor_key)
                 for item in data.get("jobs", []):
+                    ts = _to_epoch(item.get("updated_at"))
+                    if since is not None and ts is not None and ts < since:
+                        continue
+                    self._advance_cursor(cursor_key, ts, item.get("id"))
                     title = item.get("title", "")
                     location_obj = item.get("location", {}) or {}
                     location = location_obj.get("name", "N/A") if isinstance(location_obj, dict) else str(location_obj)
@@ -660,30 +870,28 @@ class JobScraper:
                         'company': company.replace("-", " ").title(),
                         'location': location,
                         'job_url': job_url,
-                        'description': BeautifulSoup(item.get("content", ""), "html.parser").get_text(" ")[:500],
+                        'description': _soup(item.get("content", "")).get_text(" ")[:500],
                         'source': f'Greenhouse ({company})',
                         'posted_date': (item.get("updated_at") or datetime.now().isoformat())[:10],
                     }
                     job['job_id'] = self.generate_job_id(job)
                     jobs.append(job)
+            except SourceUnavailableError as e:
+                scraper_logger.info("⏸️  Greenhouse skipped: %s", e)
+                break
             except Exception as e:
-                print(f"❌ Greenhouse/{company}: {e}")
+                scraper_logger.error("❌ Greenhouse/%s: %s", company, e)
 
         if jobs:
-            print(f"✅ Found {len(jobs)} jobs from Greenhouse boards")
+            scraper_logger.info("✅ Found %s jobs from Greenhouse boards", len(jobs))
         else:
-            print(f"⚠️  No matching jobs on Greenhouse boards")
+            scraper_logger.info("⚠️  No matching jobs on Greenhouse boards")
         return jobs
 
-    def scrape_lever_boards(self, keywords: List[str]) -> List[Dict]:
-        """Scrape Lever job boards (JSON API, no key needed)."""
+    def scrape_lever_boards(self, keywords: List[str], boards: Optional[List[str]] = None) -> List[Dict]:
+        """Scrape Lever job boards (JSON API, no key needed); ``boards`` defaults to the config."""
         jobs = []
-        try:
-            from config.config import LEVER_BOARDS
-        except Exception:
-            LEVER_BOARDS = []
-
-        for company in LEVER_BOARDS:
+        for company in (get_settings().lever_boards if boards is None else boards):
             try:
                 url = f"https://api.lever.co/v0/postings/{company}?mode=json"
                 response = _requests_get_with_retry(url, timeout=self.timeout, headers=self.headers)
@@ -691,7 +899,13 @@ class JobScraper:
                 if not isinstance(data, list):
                     continue
 
+                cursor_key = self._cursor_key(f"lever:{company}", keywords)
+                since = self._cursor_ts(cursor_key)
                 for item in data:
+                    ts = _to_epoch(item.get("createdAt"))
+                    if since is not None and ts is not None and ts < since:
+                        continue
+                    self._advance_cursor(cursor_key, ts, item.get("id"))
                     title = item.get("text", "")
                     categories = item.get("categories", {}) or {}
                     location = categories.get("location", "N/A")
@@ -714,13 +928,16 @@ class JobScraper:
                     }
                     job['job_id'] = self.generate_job_id(job)
                     jobs.append(job)
+            except SourceUnavailableError as e:
+                scraper_logger.info("⏸️  Lever skipped: %s", e)
+                break
             except Exception as e:
-                print(f"❌ Lever/{company}: {e}")
+                scraper_logger.error("❌ Lever/%s: %s", company, e)
 
         if jobs:
-            print(f"✅ Found {len(jobs)} jobs from Lever boards")
+            scraper_logger.info("✅ Found %s jobs from Lever boards", len(jobs))
         else:
-            print(f"⚠️  No matching jobs on Lever boards")
+            scraper_logger.info("⚠️  No matching jobs on Lever boards")
         return jobs
 
     def scrape_remoteok(self, keywords: List[str]) -> List[Dict]:
@@ -734,8 +951,14 @@ class JobScraper:
 
             # First element is metadata; skip it
             listings = data[1:] if len(data) > 1 else []
+            cursor_key = self._cursor_key('remoteok', keywords)
+            since = self._cursor_ts(cursor_key)
 
             for item in listings:
+                ts = _to_epoch(item.get("epoch") or item.get("date"))
+                if since is not None and ts is not None and ts < since:
+                    continue
+                self._advance_cursor(cursor_key, ts, item.get("id"))
                 title = item.get("position", "")
                 company = item.get("company", "")
                 description = item.get("description", "")
@@ -748,7 +971,7 @@ class JobScraper:
                     'company': company,
                     'location': item.get("location", "Remote"),
                     'job_url': item.get("url", ""),
-                    'description': BeautifulSoup(description, "html.parser").get_text(" ")[:500],
+                    'description': _soup(description).get_text(" ")[:500],
                     'source': 'RemoteOK',
                     'posted_date': item.get("date", datetime.now().isoformat())[:10],
                 }
@@ -756,86 +979,188 @@ class JobScraper:
                 jobs.append(job)
 
             if jobs:
-                print(f"✅ Found {len(jobs)} jobs from RemoteOK")
+                scraper_logger.info("✅ Found %s jobs from RemoteOK", len(jobs))
             else:
-                print(f"⚠️  No matching jobs on RemoteOK")
+                scraper_logger.info("⚠️  No matching jobs on RemoteOK")
         except Exception as e:
-            print(f"❌ Error scraping RemoteOK: {e}")
+            scraper_logger.error("❌ Error scraping RemoteOK: %s", e)
         return jobs
 
-    def scrape_hn_hiring(self, keywords: List[str]) -> List[Dict]:
-        """Scrape latest HackerNews 'Who is hiring?' thread (free, no key)."""
-        jobs = []
+    # ---------- HN "Who is hiring?" ----------
+    def _load_hn_cache(self, path: str) -> Dict:
         try:
-            # Find latest "Who is hiring?" story via Algolia HN API
-            search_url = "https://hn.algolia.com/api/v1/search"
-            params = {
-                "query": "Ask HN: Who is hiring?",
-                "tags": "story,ask_hn",
-                "hitsPerPage": 1,
-            }
-            resp = _requests_get_with_retry(search_url, params=params, timeout=self.timeout, headers=self.headers)
-            hits = resp.json().get("hits", [])
-            if not hits:
-                print("⚠️  No HN 'Who is hiring?' thread found")
-                return jobs
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
 
-            story_id = hits[0].get("objectID")
+    def _save_hn_cache(self, path: str, cache: Dict):
+        try:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            tmp = f"{path}.tmp"
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+            os.replace(tmp, path)
+        except OSError as e:
+            scraper_logger.warning("Could not write HN cache %s: %s", path, e)
+
+    def _parse_stage(self) -> ParseStage:
+        """Process-pool parsing stage shared by every source (created on first use)."""
+        if self._parser is None:
+            settings = get_settings()
+            self._parser = ParseStage(workers=settings.parse_workers, max_pending=settings.parse_queue_size)
+        return self._parser
+
+    def _submit_parse(self, fn: Callable, *args) -> ParseTask:
+        """Hand ``fn(*args)`` to the parse stage, waiting for a slot no longer than the cycle deadline."""
+        deadline = getattr(_fetch_ctx, 'deadline', None)
+        timeout = None if deadline is None else max(0.0, deadline - _time.monotonic())
+        try:
+            return self._parse_stage().submit(fn, *args, timeout=timeout)
+        except FuturesTimeout:
+            raise _deadline_exceeded("check cycle deadline reached waiting for a parse slot")
 
-            # Fetch comments (each comment = one job)
-            comments_url = f"https://hn.algolia.com/api/v1/items/{story_id}"
-            resp2 = _requests_get_with_retry(comments_url, timeout=self.timeout, headers=self.headers)
-            children = resp2.json().get("children", [])
+    @staticmethod
+    def _parse_result(task: ParseTask):
+        """Wait for a parse, bounded by the cycle deadline of the calling worker."""
+        deadline = getattr(_fetch_ctx, 'deadline', None)
+        started = _time.perf_counter()
+        try:
+            if deadline is None:
+                return task.result()
+            return task.result(timeout=max(0.0, deadline - _time.monotonic()))
+        except FuturesTimeout:
+            raise _deadline_exceeded("check cycle deadline reached while parsing")
+        finally:
+            _record_stage('parse', _time.perf_counter() - started)
+
+    def apply_settings(self, settings):
+        """Pick up reloaded settings, keeping the HTTP session, caches, cursors and parse pool."""
+        self.timeout = settings.request_timeout
+        self.indeed_api_key = settings.indeed_api_key
+        self.indeed_publisher_id = settings.indeed_publisher_id
+        self.linkedin_api_key = settings.linkedin_api_key
+
+    def close(self):
+        """Shut down background worker pools."""
+        if self._parser is not None:
+            self._parser.close()
+            self._parser = None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _process_hn_comments(self, comments: List[Dict], keywords: List[str],
+                             parallel_threshold: int) -> List[Dict]:
+        """Strip + keyword-filter comments, fanned out to the parse stage for large batches."""
+        if not parallel_threshold or len(comments) < parallel_threshold:
+            return _timed_parse(_parse_hn_comments, comments, keywords)
+        tasks = [
+            self._submit_parse(_parse_hn_comments, comments[i:i + 64], keywords)
+            for i in range(0, len(comments), 64)
+        ]
+        jobs: List[Dict] = []
+        for task in tasks:
+            jobs.extend(self._parse_result(task))
+        return jobs
 
-            for child in children[:200]:  # cap to avoid huge processing
-                text = child.get("text", "")
-                if not text:
-                    continue
-                plain = BeautifulSoup(text, "html.parser").get_text(" ")
+    def scrape_hn_hiring(self, keywords: List[str]) -> List[Dict]:
+        """Scrape latest HackerNews 'Who is hiring?' thread (free, no key).
 
-                if not self._keyword_match(plain, keywords):
-                    continue
+        The whole thread is ingested once per month and cached on disk
+        (``HN_CACHE_FILE``) together with the IDs of every comment already
+        processed. Later cycles only ask Algolia for comments newer than the
+        newest one seen, and return the jobs from the unseen ones.
+        """
+        jobs = []
+        settings = get_settings()
 
-                # First line is usually "Company | Location | ..."
-                first_line = plain.split("\n")[0]
-                parts = [p.strip() for p in first_line.split("|")]
-                company = parts[0] if len(parts) >= 1 else "N/A"
-                location = parts[1] if len(parts) >= 2 else "N/A"
+        try:
+            cache = self._load_hn_cache(settings.hn_cache_file)
+            now = _time.time()
+            this_month = datetime.now().strftime("%Y-%m")
+
+            # Look the thread up again only when the cached one is from an earlier month
+            if (not cache.get("story_id") or cache.get("month") != this_month) \
+                    and now - cache.get("checked_at", 0) >= settings.hn_thread_recheck:
+                # Find latest "Who is hiring?" story via Algolia HN API
+                search_url = "https://hn.algolia.com/api/v1/search"
+                params = {
+                    "query": "Ask HN: Who is hiring?",
+                    "tags": "story,ask_hn",
+                    "hitsPerPage": 1,
+                }
+                resp = _requests_get_with_retry(search_url, params=params, timeout=self.timeout, headers=self.headers)
+                hits = resp.json().get("hits", [])
+                if hits and hits[0].get("objectID") != cache.get("story_id"):
+                    cache = {
+                        "story_id": hits[0].get("objectID"),
+                        "month": (hits[0].get("created_at") or this_month)[:7],
+                    }
+                cache["checked_at"] = now
 
-                hn_url = f"https://news.ycombinator.com/item?id={child.get('id', '')}"
-                job = {
-                    'title': first_line[:120],
-                    'company': company[:80],
-                    'location': location[:80],
-                    'job_url': hn_url,
-                    'description': plain[:500],
-                    'source': 'HackerNews Who is Hiring',
-                    'posted_date': child.get("created_at", datetime.now().isoformat())[:10],
+            story_id = cache.get("story_id")
+            if not story_id:
+                scraper_logger.info("⚠️  No HN 'Who is hiring?' thread found")
+                return jobs
+            keywords_key = self._keywords_key(keywords)
+            if cache.get("keywords") != keywords_key:
+                # Different keyword set: previous matches are meaningless, reprocess the thread
+                cache.update(keywords=keywords_key, seen=[], newest=None)
+            seen = set(cache.get("seen", []))
+
+            # Fetch comments (each top-level comment = one job)
+            if not seen:
+                # First visit to this thread: full comment tree, fetched once
+                comments_url = f"https://hn.algolia.com/api/v1/items/{story_id}"
+                resp2 = _requests_get_with_retry(comments_url, timeout=self.timeout, headers=self.headers)
+                children = resp2.json().get("children", [])
+            else:
+                # Only comments posted since the newest one seen; keep top-level ones (job posts)
+                params = {
+                    "tags": f"comment,story_{story_id}",
+                    "numericFilters": f"created_at_i>={int(cache.get('newest') or 0)}",
+                    "hitsPerPage": 1000,
                 }
-                job['job_id'] = self.generate_job_id(job)
-                jobs.append(job)
+                resp2 = _requests_get_with_retry("https://hn.algolia.com/api/v1/search_by_date", params=params,
+                                                 timeout=self.timeout, headers=self.headers)
+                children = [
+                    {
+                        'id': h.get('objectID'),
+                        'text': h.get('comment_text', ''),
+                        'created_at': h.get('created_at', ''),
+                        'created_at_i': h.get('created_at_i'),
+                    }
+                    for h in resp2.json().get("hits", [])
+                    if str(h.get('parent_id')) == str(story_id)
+                ]
+
+            fresh = [c for c in children if str(c.get("id")) not in seen]
+            new_jobs = self._process_hn_comments(fresh, keywords, settings.hn_parallel_threshold)
+
+            newest = cache.get("newest") or 0
+            for c in fresh:
+                seen.add(str(c.get("id")))
+                newest = max(newest, c.get("created_at_i") or 0)
+            cache["seen"] = sorted(seen)
+            cache["newest"] = newest
+            cache.pop("jobs", None)  # written by older versions
+            self._save_hn_cache(settings.hn_cache_file, cache)
+            jobs = new_jobs
 
             if jobs:
-                print(f"✅ Found {len(jobs)} jobs from HN Who is Hiring")
+                scraper_logger.info("✅ Found %s jobs from HN Who is Hiring (%s new comments)",
+                                    len(jobs), len(fresh))
             else:
-                print(f"⚠️  No matching jobs in HN Who is Hiring")
+                scraper_logger.info("⚠️  No matching jobs in HN Who is Hiring")
         except Exception as e:
-            print(f"❌ Error scraping HN hiring: {e}")
+            scraper_logger.error("❌ Error scraping HN hiring: %s", e)
         return jobs
 
-    def scrape_all_sources(self, keywords: List[str]) -> List[Dict]:
-        """Scrape all configured job sources in parallel."""
-        print("\n🔍 Starting job search across all sources...")
-        print(f"📍 Searching for: {', '.join(keywords)}\n")
-
-        try:
-            from config.config import (SEARCH_EMPLOYER_SITES, SEARCH_GREENHOUSE,
-                                       SEARCH_LEVER, SEARCH_REMOTEOK, SEARCH_HN_HIRING)
-        except Exception:
-            SEARCH_EMPLOYER_SITES = SEARCH_GREENHOUSE = SEARCH_LEVER = False
-            SEARCH_REMOTEOK = SEARCH_HN_HIRING = False
+    def _build_tasks(self, keywords: List[str]) -> List[Tuple[str, Callable]]:
+        """Return the enabled sources as (label, callable) pairs."""
+        settings = get_settings()
 
-        # Build list of (label, callable) tasks
         tasks: List[Tuple[str, Callable]] = [
             ("GitHub Jobs", lambda: self.scrape_github_jobs(keywords)),
         ]
@@ -852,46 +1177,390 @@ class JobScraper:
 
         tasks.append(("Stack Overflow", lambda: self.scrape_stackoverflow_jobs(keywords)))
 
-        if SEARCH_GREENHOUSE:
+        if settings.search_greenhouse:
             tasks.append(("Greenhouse", lambda: self.scrape_greenhouse_boards(keywords)))
-        if SEARCH_LEVER:
+        if settings.search_lever:
             tasks.append(("Lever", lambda: self.scrape_lever_boards(keywords)))
-        if SEARCH_REMOTEOK:
+        if settings.search_remoteok:
             tasks.append(("RemoteOK", lambda: self.scrape_remoteok(keywords)))
-        if SEARCH_HN_HIRING:
+        if settings.search_hn_hiring:
             tasks.append(("HN Hiring", lambda: self.scrape_hn_hiring(keywords)))
-        if SEARCH_EMPLOYER_SITES:
+        if settings.search_employer_sites:
             tasks.append(("Employer Sites", lambda: self.scrape_employer_sites(keywords)))
-
-        print(f"📊 Fetching {len(tasks)} sources in parallel...")
+        return tasks
+
+    def source_labels(self) -> List[str]:
+        """Labels of the enabled sources, in the order they are scheduled."""
+        return [label for label, _ in self._build_tasks([])]
+
+    def iter_source_results(self, keywords: List[str], deadline: Optional[float] = None,
+                            sources: Optional[List[str]] = None) -> Iterator[Tuple[str, List[Dict]]]:
+        """Scrape the configured sources in parallel, yielding ``(label, jobs)`` as each finishes.
+
+        ``deadline`` (seconds, default ``check_deadline`` from settings; 0 disables)
+        bounds the whole cycle. When it expires, outstanding sources are
+        cancelled and marked ``timed_out`` in ``self.last_source_status``, as is a
+        source whose scraper ran into the deadline and returned what it had.
+
+        ``sources`` restricts the run to the given labels (see ``source_labels``).
+
+        Sources keep fetching in the worker pool while the consumer handles a
+        batch; closing the generator early cancels whatever is still running.
+        """
+        scraper_logger.info("🔍 Starting job search across all sources...")
+        scraper_logger.info("📍 Searching for: %s", ', '.join(keywords))
+
+        if deadline is None:
+            deadline = get_settings().check_deadline
+
+        tasks = self._build_tasks(keywords)
+        if sources is not None:
+            wanted = set(sources)
+            tasks = [(label, fn) for label, fn in tasks if label in wanted]
+        if not tasks:
+            self.last_source_status = {}
+            self.last_source_results = {}
+            self.last_source_durations = {}
+            self.last_source_timings = {}
+            self._pending_cursors = {}
+            return
+
+        scraper_logger.info("📊 Fetching %s sources in parallel...", len(tasks))
         for label, _ in tasks:
-            print(f"  📌 {label}")
+            scraper_logger.info("  📌 %s", label)
 
         results: Dict[str, List[Dict]] = {}
-        all_jobs: List[Dict] = []
+        status: Dict[str, str] = {}
+        durations: Dict[str, float] = {}
+        clocks: Dict[str, StageClock] = {label: StageClock() for label, _ in tasks}
+
+        cancel = threading.Event()
+        deadline_at = _time.monotonic() + deadline if deadline else None
+
+        # Cursor advances are buffered per source and only kept for sources that completed,
+        # so a timed-out or failed source is re-fetched from its old high-water mark.
+        task_cursors: Dict[str, Dict] = {label: {} for label, _ in tasks}
+        # Deadline hits per source, including ones its scraper caught and logged
+        deadline_hits: Dict[str, List[str]] = {label: [] for label, _ in tasks}
+
+        def _run(label, fn):
+            _fetch_ctx.cancel = cancel
+            _fetch_ctx.deadline = deadline_at
+            _fetch_ctx.cursor_updates = task_cursors[label]
+            _fetch_ctx.stages = clocks[label]
+            _fetch_ctx.deadline_hits = deadline_hits[label]
+            start = _time.monotonic()
+            try:
+                return fn()
+            finally:
+                durations[label] = _time.monotonic() - start
+                for name in _FETCH_CTX_ATTRS:
+                    setattr(_fetch_ctx, name, None)
 
-        with ThreadPoolExecutor(max_workers=min(len(tasks), 8)) as pool:
-            future_map = {pool.submit(fn): label for label, fn in tasks}
-            for future in as_completed(future_map):
-                label = future_map[future]
-                try:
-                    jobs = future.result()
-                except Exception as exc:
-                    scraper_logger.error(f"{label} failed: {exc}")
-                    print(f"  ❌ {label}: {exc}")
-                    jobs = []
-                results[label] = jobs
-                all_jobs.extend(jobs)
+        def _collect(future, label) -> List[Dict]:
+            try:
+                jobs = future.result()
+                status[label] = 'ok'
+                if deadline_hits[label]:
+                    # The scraper caught the deadline itself: keep what it found, not its cursors
+                    scraper_logger.warning("  ⏱️  %s: %s", label, deadline_hits[label][0], extra={'source': label})
+                    status[label] = 'timed_out'
+            except Exception as exc:
+                scraper_logger.error("  ❌ %s: %s", label, exc, extra={'source': label})
+                jobs = []
+                status[label] = 'failed'
+            results[label] = jobs
+            return jobs
+
+        pool = ThreadPoolExecutor(max_workers=min(len(tasks), 8))
+        future_map = {pool.submit(_run, label, fn): label for label, fn in tasks}
+        try:
+            try:
+                timeout = max(0.0, deadline_at - _time.monotonic()) if deadline_at else None
+                for future in as_completed(future_map, timeout=timeout):
+                    label = future_map[future]
+                    yield label, _collect(future, label)
+            except FuturesTimeout:
+                cancel.set()
+                late_done = []
+                for future, label in future_map.items():
+                    if label in status:
+                        continue
+                    if future.done():
+                        late_done.append((label, _collect(future, label)))
+                    else:
+                        future.cancel()
+                        status[label] = 'timed_out'
+                        results[label] = []
+                late = [l for l, st in status.items() if st == 'timed_out']
+                scraper_logger.warning("  ⏱️  Cycle deadline (%ss) reached — timed out: %s",
+                                       deadline, ', '.join(late), extra={'timed_out': late})
+                for label, jobs in late_done:
+                    yield label, jobs
+        finally:
+            # Don't wait for in-flight workers: they see the cancel flag at their next request
+            cancel.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+            self.last_source_status = status
+            self.last_source_results = results
+            # Timed-out sources have no entry until their worker notices the cancel flag
+            self.last_source_durations = durations
+            self.last_source_timings = {label: clock.seconds() for label, clock in clocks.items()}
+            self._pending_cursors = {}
+            for label, st in status.items():
+                if st == 'ok':
+                    self._pending_cursors.update(task_cursors[label])
 
         # Summary
-        print(f"\n📊 Total jobs found across all sources: {len(all_jobs)}")
-        if all_jobs:
+        total = sum(len(jobs) for jobs in results.values())
+        scraper_logger.info("📊 Total jobs found across all sources: %s", total)
+        if total:
             for label in [l for l, _ in tasks]:
                 count = len(results.get(label, []))
                 if count:
-                    print(f"   - {label}: {count}")
-            print()
+                    scraper_logger.info("   - %s: %s", label, count,
+                                        extra={'source': label, 'jobs': count,
+                                               'seconds': round(durations.get(label, 0.0), 3)})
+        else:
+            scraper_logger.info("   No jobs found (external sources may not be accessible)")
+
+    def scrape_shard(self, shard: Dict) -> Dict:
+        """Scrape one unit of work handed out by a sharding coordinator (see ``src/sharding.py``).
+
+        ``shard`` names a source label, the keywords, optionally a subset of
+        its ``boards``, the coordinator's ``cursors`` and an absolute
+        ``deadline`` (epoch seconds). Returns the jobs together with the cursor
+        advances, per-stage timings and whether the deadline cut it short, all
+        JSON-serialisable.
+        """
+        keywords = shard.get('keywords') or []
+        source = shard['source']
+        boards = shard.get('boards')
+        if source == "Greenhouse" and boards is not None:
+            fn = lambda: self.scrape_greenhouse_boards(keywords, boards=boards)
+        elif source == "Lever" and boards is not None:
+            fn = lambda: self.scrape_lever_boards(keywords, boards=boards)
         else:
-            print("   No jobs found (external sources may not be accessible)\n")
+            fn = dict(self._build_tasks(keywords)).get(source)
+            if fn is None:
+                raise ValueError(f"source {source!r} is not enabled on this worker")
+
+        self._cursors = {key: tuple(value) for key, value in (shard.get('cursors') or {}).items()}
+        cursor_updates: Dict[str, Tuple[float, Optional[str]]] = {}
+        clock = StageClock()
+        deadline_hits: List[str] = []
+        deadline = shard.get('deadline')
+        _fetch_ctx.cancel = None
+        _fetch_ctx.deadline = _time.monotonic() + (deadline - _time.time()) if deadline else None
+        _fetch_ctx.cursor_updates = cursor_updates
+        _fetch_ctx.stages = clock
+        _fetch_ctx.deadline_hits = deadline_hits
+        start = _time.monotonic()
+        try:
+            jobs = fn()
+        finally:
+            for name in _FETCH_CTX_ATTRS:
+                setattr(_fetch_ctx, name, None)
+        return {
+            'jobs': jobs,
+            'cursors': cursor_updates,
+            'timings': clock.seconds(),
+            'seconds': _time.monotonic() - start,
+            'timed_out': bool(deadline_hits),
+        }
+
+    def scrape_all_sources(self, keywords: List[str], deadline: Optional[float] = None,
+                           sources: Optional[List[str]] = None,
+                           on_jobs: Optional[Callable[[str, List[Dict]], None]] = None) -> List[Dict]:
+        """Scrape all configured job sources in parallel and return every job found.
 
+        Same arguments as ``iter_source_results``. ``on_jobs(label, jobs)`` is
+        called from the calling thread as soon as each source finishes.
+        """
+        all_jobs: List[Dict] = []
+        for label, jobs in self.iter_source_results(keywords, deadline=deadline, sources=sources):
+            all_jobs.extend(jobs)
+            if on_jobs and jobs:
+                try:
+                    on_jobs(label, jobs)
+                except Exception as exc:
+                    scraper_logger.error("on_jobs callback failed for %s: %s", label, exc)
         return all_jobs
+
+
+# ----------------------------------------------------------------
+#  Parse functions — module-level so the parse stage can run them in
+#  worker processes. They take raw bytes / plain data and return job dicts.
+# ----------------------------------------------------------------
+
+def _hn_comment_to_job(child: Dict, keywords: List[str]) -> Optional[Dict]:
+    """Turn one HN comment into a job dict, or None if it doesn't match (picklable for the parse pool)."""
+    text = child.get("text") or ""
+    if not text:
+        return None
+    plain = _strip_html(text)
+    haystack = JobScraper._normalize_text(plain)
+    if not any(JobScraper._normalize_text(k) in haystack for k in keywords if k):
+        return None
+
+    # First line is usually "Company | Location | ..."
+    first_line = plain.split("\n")[0].strip()
+    parts = [p.strip() for p in first_line.split("|")]
+    company = parts[0] if len(parts) >= 1 else "N/A"
+    location = parts[1] if len(parts) >= 2 else "N/A"
+
+    hn_url = f"https://news.ycombinator.com/item?id={child.get('id', '')}"
+    job = {
+        'title': first_line[:120],
+        'company': company[:80],
+        'location': location[:80],
+        'job_url': hn_url,
+        'description': " ".join(plain.split())[:500],
+        'source': 'HackerNews Who is Hiring',
+        'posted_date': (child.get("created_at") or datetime.now().isoformat())[:10],
+    }
+    job['job_id'] = JobScraper.generate_job_id(job)
+    return job
+
+
+def _parse_hn_comments(comments: List[Dict], keywords: List[str]) -> List[Dict]:
+    return [job for job in (_hn_comment_to_job(c, keywords) for c in comments) if job]
+
+
+def _job_location(item: Dict) -> str:
+    job_location = item.get("jobLocation")
+    if isinstance(job_location, list):
+        job_location = job_location[0] if job_location else None
+    if not isinstance(job_location, dict):
+        return ""
+    address = job_location.get("address", {}) or {}
+    if not isinstance(address, dict):
+        return str(address)
+    return address.get("addressLocality") or address.get("addressRegion") or address.get("addressCountry") or ""
+
+
+def _extract_json_ld_jobs(content: bytes, base_url: str, source_name: str, keywords: List[str]) -> List[Dict]:
+    """Collect schema.org JobPosting entries from a page's ld+json blocks (raw bytes, no DOM)."""
+    jobs = []
+    for data in iter_json_ld(content):
+        for item in iter_job_postings(data):
+            title = item.get("title", "") or ""
+            description = item.get("description", "") or ""
+            if keywords and not JobScraper._keyword_match(f"{title} {description}", keywords):
+                continue
+
+            hiring_org = item.get("hiringOrganization", {}) or {}
+            company = hiring_org.get("name", "") if isinstance(hiring_org, dict) else str(hiring_org)
+            job_url = item.get("url") or item.get("applicationUrl") or base_url
+            if isinstance(job_url, str) and job_url.startswith("/"):
+                job_url = urljoin(base_url, job_url)
+
+            job = {
+                'title': title or 'N/A',
+                'company': company or 'N/A',
+                'location': _job_location(item) or 'N/A',
+                'job_url': job_url or base_url,
+                # Descriptions are often entity-escaped HTML
+                'description': " ".join(_strip_html(html.unescape(str(description))).split())[:1000],
+                'source': source_name,
+                'posted_date': item.get("datePosted", datetime.now().isoformat()),
+            }
+            job['job_id'] = JobScraper.generate_job_id(job)
+            jobs.append(job)
+    return jobs
+
+
+def _parse_employer_page(content: bytes, url: str, source_name: str,
+                         keywords: List[str]) -> Tuple[List[Dict], bool]:
+    """Return (matching jobs, whether the page has any ld+json block at all)."""
+    return _extract_json_ld_jobs(content, url, source_name, keywords), has_json_ld(content)
+
+
+def _parse_indeed_page(content: bytes) -> List[Dict]:
+    jobs = []
+    soup = _soup(content)
+
+    # Indeed uses dynamic loading, so this captures only visible results
+    job_cards = soup.find_all('div', class_='job_seen_beacon')
+
+    for card in job_cards[:10]:  # Limit to 10 per keyword
+        try:
+            title_elem = card.find('h2', class_='jobTitle')
+            company_elem = card.find('span', class_='companyName')
+            location_elem = card.find('div', class_='companyLocation')
+            link_elem = card.find('a', href=True)
+            snippet_elem = card.find('div', class_='job-snippet')
+
+            job = {
+                'title': title_elem.get_text(strip=True) if title_elem else 'N/A',
+                'company': company_elem.get_text(strip=True) if company_elem else 'N/A',
+                'location': location_elem.get_text(strip=True) if location_elem else 'N/A',
+                'job_url': 'https://www.indeed.com' + (link_elem.get('href') if link_elem else ''),
+                'description': snippet_elem.get_text(" ", strip=True) if snippet_elem else '',
+                'source': 'Indeed (Web)',
+                'posted_date': datetime.now().isoformat(),
+            }
+            job['job_id'] = JobScraper.generate_job_id(job)
+            jobs.append(job)
+        except Exception:
+            continue
+    return jobs
+
+
+def _parse_linkedin_page(content: bytes) -> List[Dict]:
+    jobs = []
+    soup = _soup(content)
+
+    # Find job listings in LinkedIn's structure
+    job_cards = soup.find_all('div', class_='base-card')
+
+    for card in job_cards[:8]:  # Limit to 8 per keyword
+        try:
+            title_elem = card.find('h3', class_='base-search-card__title')
+            company_elem = card.find('h4', class_='base-search-card__subtitle')
+            location_elem = card.find('span', class_='job-search-card__location')
+            link_elem = card.find('a', class_='base-card__full-link')
+
+            job = {
+                'title': title_elem.text.strip() if title_elem else 'N/A',
+                'company': company_elem.text.strip() if company_elem else 'N/A',
+                'location': location_elem.text.strip() if location_elem else 'N/A',
+                'job_url': link_elem.get('href', '') if link_elem else '#',
+                'description': '',
+                'source': 'LinkedIn',
+                'posted_date': datetime.now().isoformat(),
+            }
+            job['job_id'] = JobScraper.generate_job_id(job)
+            jobs.append(job)
+        except Exception:
+            continue
+    return jobs
+
+
+def _parse_stackoverflow_page(content: bytes) -> List[Dict]:
+    jobs = []
+    soup = _soup(content)
+
+    # Find job listings
+    job_cards = soup.find_all('div', class_='s-job-card')
+
+    for card in job_cards[:8]:  # Limit to 8 per keyword
+        try:
+            title_elem = card.find('h2')
+            company_elem = card.find('h3')
+            link_elem = card.find('a', class_='s-link')
+
+            job = {
+                'title': title_elem.text.strip() if title_elem else 'N/A',
+                'company': company_elem.text.strip() if company_elem else 'N/A',
+                'location': 'Remote',
+                'job_url': 'https://stackoverflow.com' + link_elem.get('href', '') if link_elem else '#',
+                'description': '',
+                'source': 'Stack Overflow',
+                'posted_date': datetime.now().isoformat(),
+            }
+            job['job_id'] = JobScraper.generate_job_id(job)
+            jobs.append(job)
+        except Exception:
+            continue
+    return jobs
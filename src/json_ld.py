@@ -0,0 +1,91 @@
+"""
+Targeted schema.org JSON-LD extraction from raw page bytes (no DOM parsing)
+"""
+import json
+import re
+from typing import Dict, Iterator, List
+
+_LD_JSON_MARKER = b"application/ld+json"
+_SCRIPT_CLOSE_RE = re.compile(rb"</script\s*>", re.IGNORECASE)
+# Containers that hold further entities: @graph documents, ItemList / ListItem wrappers
+_NESTED_KEYS = ("@graph", "itemListElement", "item", "mainEntity")
+_MAX_DEPTH = 8
+
+
+def _script_bodies(content: bytes) -> Iterator[bytes]:
+    """Raw contents of every ``<script type="application/ld+json">`` element.
+
+    Jumps between occurrences of the MIME type with ``bytes.find`` and only
+    looks at the surrounding tag, so the cost is one linear scan of the page.
+    """
+    pos = 0
+    while True:
+        hit = content.find(_LD_JSON_MARKER, pos)
+        if hit < 0:
+            return
+        pos = hit + len(_LD_JSON_MARKER)
+        tag_start = content.rfind(b"<", 0, hit)
+        if tag_start < 0 or content[tag_start + 1:tag_start + 7].lower() != b"script":
+            continue  # e.g. a <link type="application/ld+json"> or the string in text
+        tag_end = content.find(b">", pos)
+        if tag_end < 0:
+            return
+        close = _SCRIPT_CLOSE_RE.search(content, tag_end + 1)
+        if close is None:
+            return
+        pos = close.end()
+        yield content[tag_end + 1:close.start()]
+
+
+def _clean(body: bytes) -> str:
+    text = body.decode("utf-8", "replace").strip()
+    # Some CMSes wrap the JSON in HTML comments or CDATA markers
+    for prefix in ("<!--", "//<![CDATA[", "<![CDATA["):
+        if text.startswith(prefix):
+            text = text[len(prefix):]
+    for suffix in ("-->", "//]]>", "]]>"):
+        if text.endswith(suffix):
+            text = text[:-len(suffix)]
+    return text.strip()
+
+
+def iter_json_ld(content: bytes) -> Iterator[object]:
+    """Decoded JSON value of each ld+json block; blocks that are not valid JSON are skipped."""
+    for body in _script_bodies(content):
+        try:
+            # strict=False: raw newlines/tabs inside descriptions are common
+            yield json.loads(_clean(body), strict=False)
+        except ValueError:
+            continue
+
+
+def has_json_ld(content: bytes) -> bool:
+    return next(_script_bodies(content), None) is not None
+
+
+def _types(item: Dict) -> List[str]:
+    value = item.get("@type")
+    if isinstance(value, list):
+        return [str(v) for v in value]
+    return [str(value)] if value else []
+
+
+def iter_job_postings(data: object, _depth: int = 0) -> Iterator[Dict]:
+    """Every ``JobPosting`` in a decoded JSON-LD value, including ones inside
+    ``@graph`` containers and (nested) ``ItemList.itemListElement`` lists."""
+    if _depth > _MAX_DEPTH:
+        return
+    if isinstance(data, list):
+        for entry in data:
+            yield from iter_job_postings(entry, _depth + 1)
+        return
+    if not isinstance(data, dict):
+        return
+    if any(t == "JobPosting" or t.endswith(":JobPosting") or t.endswith("/JobPosting")
+           for t in _types(data)):
+        yield data
+        return
+    for key in _NESTED_KEYS:
+        nested = data.get(key)
+        if isinstance(nested, (list, dict)):
+            yield from iter_job_postings(nested, _depth + 1)
@@ -0,0 +1,102 @@
+"""
+Non-blocking structured logging: QueueHandler on the hot path, QueueListener does the I/O
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+from datetime import datetime, timezone
+from typing import Optional
+
+# Attributes every LogRecord has; anything else was passed via ``extra=`` and is structured data
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "taskName"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: ts, level, logger, thread, msg, plus any ``extra`` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "msg": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class ConsoleFormatter(logging.Formatter):
+    """Human console mode: the message as it used to be printed, with the traceback if any."""
+
+    def __init__(self):
+        super().__init__("%(message)s")
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    dropped = 0
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # Never block a fetch thread on logging; count what the listener couldn't keep up with
+            _QueueHandler.dropped += 1
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stock prepare() formats the message into record.msg and drops args; keep the
+        # record intact so formatters on the listener thread still see extras and exc_info
+        return record
+
+
+def configure_logging(level: str = "INFO", log_file: Optional[str] = None, fmt: str = "console",
+                      queue_size: int = 10000) -> logging.handlers.QueueListener:
+    """Route all logging through a bounded queue drained by a background listener thread.
+
+    ``fmt="console"`` keeps the familiar emoji lines on stdout and writes
+    ``time - level - logger - message`` to ``log_file``; ``fmt="json"`` writes
+    JSON lines to both. Callers only pay for enqueueing the record: message
+    formatting (``%``-args) and all stream/file I/O happen on the listener.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+
+    handlers = []
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(JsonFormatter() if fmt == "json" else ConsoleFormatter())
+    handlers.append(console)
+    if log_file:
+        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        file_handler.setFormatter(JsonFormatter() if fmt == "json" else
+                                  logging.Formatter("%(asctime)s - %(levelname)s - %(name)s - %(message)s"))
+        handlers.append(file_handler)
+
+    log_queue: queue.Queue = queue.Queue(queue_size)
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_QueueHandler(log_queue))
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+    return _listener
+
+
+def stop_logging():
+    """Flush everything still queued and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
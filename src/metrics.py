@@ -0,0 +1,208 @@
+"""
+Constant-memory timing histograms and a Prometheus text-format /metrics endpoint
+"""
+import bisect
+import logging
+import threading
+from collections import deque
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds; spans a fast JSON API call up to a full cycle hitting its deadline
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """Cumulative bucket counts plus a ring buffer of the most recent observations.
+
+    Memory is fixed: ``len(buckets) + 1`` counters and ``recent`` floats, no
+    matter how long the process runs. ``mean``/``quantile`` read the ring
+    buffer, so they reflect recent behaviour rather than all-time averages.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, recent: int = 256):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+        self._recent: deque = deque(maxlen=recent)
+        self._recent_sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        with self._lock:
+            self.counts[bisect.bisect_left(self.buckets, value)] += 1
+            self.sum += value
+            self.count += 1
+            if len(self._recent) == self._recent.maxlen:
+                self._recent_sum -= self._recent[0]
+            self._recent.append(value)
+            self._recent_sum += value
+
+    @property
+    def mean(self) -> float:
+        with self._lock:
+            return self._recent_sum / len(self._recent) if self._recent else 0.0
+
+    def quantile(self, q: float) -> float:
+        with self._lock:
+            values = sorted(self._recent)
+        if not values:
+            return 0.0
+        return values[min(len(values) - 1, int(q * len(values)))]
+
+    def snapshot(self) -> Tuple[List[int], float, int]:
+        with self._lock:
+            return list(self.counts), self.sum, self.count
+
+    def dump_state(self) -> Dict:
+        with self._lock:
+            return {'buckets': self.buckets, 'counts': list(self.counts), 'sum': self.sum,
+                    'count': self.count, 'recent': list(self._recent)}
+
+    def load_state(self, state: Dict):
+        """Restore ``dump_state`` output; ignored if the bucket layout changed since."""
+        if tuple(state['buckets']) != self.buckets:
+            return
+        with self._lock:
+            self.counts = list(state['counts'])
+            self.sum = state['sum']
+            self.count = state['count']
+            self._recent.clear()
+            self._recent.extend(state['recent'])
+            self._recent_sum = sum(self._recent)
+
+
+class HistogramFamily:
+    """One histogram per label set, e.g. ``stage="fetch"``."""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str],
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        self._children: Dict[Labels, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str) -> Histogram:
+        key = tuple(zip(self.label_names, (str(v) for v in values)))
+        with self._lock:
+            hist = self._children.get(key)
+            if hist is None:
+                hist = self._children[key] = Histogram(self.buckets)
+            return hist
+
+    def items(self) -> List[Tuple[Labels, Histogram]]:
+        with self._lock:
+            return sorted(self._children.items())
+
+    def dump_state(self) -> Dict[Labels, Dict]:
+        return {labels: hist.dump_state() for labels, hist in self.items()}
+
+    def load_state(self, state: Dict[Labels, Dict]):
+        for labels, hist_state in state.items():
+            if tuple(name for name, _ in labels) == self.label_names:
+                self.labels(*(value for _, value in labels)).load_state(hist_state)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for labels, hist in self.items():
+            counts, total, count = hist.snapshot()
+            cumulative = 0
+            for bound, n in zip(list(hist.buckets) + [float('inf')], counts):
+                cumulative += n
+                le = "+Inf" if bound == float('inf') else repr(float(bound))
+                lines.append(f"{self.name}_bucket{format_labels(labels + (('le', le),))} {cumulative}")
+            lines.append(f"{self.name}_sum{format_labels(labels)} {total}")
+            lines.append(f"{self.name}_count{format_labels(labels)} {count}")
+        return lines
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def format_labels(labels: Iterable[Tuple[str, str]]) -> str:
+    inner = ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels)
+    return "{" + inner + "}" if inner else ""
+
+
+def render_samples(name: str, help_text: str, kind: str,
+                   samples: Iterable[Tuple[Labels, float]]) -> List[str]:
+    """Text exposition lines for a counter or gauge."""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    lines.extend(f"{name}{format_labels(labels)} {value}" for labels, value in samples)
+    return lines
+
+
+class MetricsServer:
+    """Serves ``render()`` at ``/metrics`` from a daemon thread (Prometheus text format 0.0.4)."""
+
+    def __init__(self, render: Callable[[], str], host: str = "127.0.0.1", port: int = 9105):
+        self.render = render
+        self.host = host
+        self.port = port
+        self._server = None  # ThreadingHTTPServer once started
+
+    def start(self):
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        render = self.render
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                try:
+                    body = render().encode('utf-8')
+                except Exception as e:
+                    logger.error("Rendering metrics failed: %s", e)
+                    self.send_error(500)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, fmt, *args):  # keep scrapes out of the console
+                logger.debug(fmt, *args)
+
+        self._server = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, name="metrics-http", daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+class StageClock:
+    """Thread-safe accumulator of seconds (and call counts) per stage for one unit of work."""
+
+    def __init__(self):
+        self._seconds: Dict[str, float] = {}
+        self._calls: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, seconds: float):
+        with self._lock:
+            self._seconds[stage] = self._seconds.get(stage, 0.0) + seconds
+            self._calls[stage] = self._calls.get(stage, 0) + 1
+
+    def seconds(self) -> Dict[str, float]:
+        with self._lock:
+            return dict(self._seconds)
+
+    def calls(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._calls)
@@ -1,13 +1,14 @@
 """
 Notification module for sending alerts via Telegram and Email
+
+``requests``, ``smtplib`` and ``email`` are imported when a message is sent.
 """
-import smtplib
-import requests
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import Dict, List, Optional
+import logging
+from typing import Dict, List
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 
 class TelegramNotifier:
     def __init__(self, bot_token: str, chat_id: str):
@@ -18,10 +19,11 @@ class TelegramNotifier:
     def send_message(self, message: str) -> bool:
         """Send a message via Telegram"""
         if not self.bot_token or self.bot_token == "YOUR_BOT_TOKEN_HERE":
-            print("⚠️  Telegram bot token not configured")
+            logger.warning("⚠️  Telegram bot token not configured")
             return False
         
         try:
+            import requests
             url = f"{self.api_url}/sendMessage"
             payload = {
                 "chat_id": self.chat_id,
@@ -32,13 +34,13 @@ class TelegramNotifier:
             response = requests.post(url, json=payload, timeout=10)
             
             if response.status_code == 200:
-                print("✅ Telegram message sent successfully")
+                logger.info("✅ Telegram message sent successfully")
                 return True
             else:
-                print(f"❌ Telegram error: {response.text}")
+                logger.error("❌ Telegram error: %s", response.text)
                 return False
         except Exception as e:
-            print(f"❌ Error sending Telegram message: {e}")
+            logger.error("❌ Error sending Telegram message: %s", e)
             return False
     
     def send_job_alert(self, job: Dict) -> bool:
@@ -66,10 +68,14 @@ class EmailNotifier:
     def send_email(self, recipient_email: str, subject: str, body: str, is_html: bool = False) -> bool:
         """Send an email"""
         if not self.sender_email or self.sender_email == "your_email@gmail.com":
-            print("⚠️  Email sender not configured")
+            logger.warning("⚠️  Email sender not configured")
             return False
         
         try:
+            import smtplib
+            from email.mime.text import MIMEText
+            from email.mime.multipart import MIMEMultipart
+
             msg = MIMEMultipart("alternative")
             msg["Subject"] = subject
             msg["From"] = self.sender_email
@@ -85,10 +91,10 @@ class EmailNotifier:
                 server.login(self.sender_email, self.sender_password)
                 server.sendmail(self.sender_email, recipient_email, msg.as_string())
             
-            print("✅ Email sent successfully")
+            logger.info("✅ Email sent successfully")
             return True
         except Exception as e:
-            print(f"❌ Error sending email: {e}")
+            logger.error("❌ Error sending email: %s", e)
             return False
     
     def send_job_alert(self, recipient_email: str, job: Dict) -> bool:
@@ -131,20 +137,21 @@ class EmailNotifier:
 
 
 class NotificationManager:
-    def __init__(self, config):
-        self.config = config
+    def __init__(self, settings):
+        """``settings`` is a ``config.settings.Settings``."""
+        self.settings = settings
         self.telegram = None
         self.email = None
         
-        if config.TELEGRAM_ENABLED:
-            self.telegram = TelegramNotifier(config.TELEGRAM_BOT_TOKEN, config.TELEGRAM_CHAT_ID)
+        if settings.telegram_enabled:
+            self.telegram = TelegramNotifier(settings.telegram_bot_token, settings.telegram_chat_id)
         
-        if config.EMAIL_ENABLED:
+        if settings.email_enabled:
             self.email = EmailNotifier(
-                config.EMAIL_SENDER,
-                config.EMAIL_PASSWORD,
-                config.SMTP_SERVER,
-                config.SMTP_PORT
+                settings.email_sender,
+                settings.email_password,
+                settings.smtp_server,
+                settings.smtp_port
             )
     
     def send_job_alert(self, job: Dict) -> bool:
@@ -156,7 +163,7 @@ class NotificationManager:
                 success = True
         
         if self.email:
-            if self.email.send_job_alert(self.config.EMAIL_RECIPIENT, job):
+            if self.email.send_job_alert(self.settings.email_recipient, job):
                 success = True
         
         return success
@@ -219,4 +226,4 @@ class NotificationManager:
         </div>
         </body></html>"""
         subject = f"📋 Job Digest: {len(jobs)} new positions found"
-        return self.email.send_email(self.config.EMAIL_RECIPIENT, subject, html, is_html=True)
+        return self.email.send_email(self.settings.email_recipient, subject, html, is_html=True)
@@ -0,0 +1,101 @@
+"""
+Process-pool parsing stage fed by the network I/O threads
+"""
+import logging
+import threading
+from concurrent.futures import BrokenExecutor, Future  # BrokenProcessPool's base; avoids importing multiprocessing
+from concurrent.futures import TimeoutError as FuturesTimeout
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ParseTask:
+    """Handle for one submitted parse; falls back to parsing inline if the pool died."""
+
+    def __init__(self, stage: "ParseStage", future: Future, fn: Callable, args: tuple):
+        self.stage = stage
+        self.future = future
+        self.fn = fn
+        self.args = args
+
+    def result(self, timeout: Optional[float] = None):
+        try:
+            return self.future.result(timeout=timeout)
+        except BrokenExecutor:
+            self.stage.mark_broken()
+            return self.fn(*self.args)
+
+
+class ParseStage:
+    """Runs CPU-bound parse functions (BeautifulSoup etc.) in worker processes.
+
+    Fetch threads hand raw response bytes to ``submit`` and go straight back to
+    the network, so parsing no longer holds the GIL against I/O. At most
+    ``max_pending`` parses are queued at once: ``submit`` blocks when the
+    parsers fall behind, which throttles the fetchers instead of buffering an
+    unbounded number of pages. ``workers=0`` parses inline in the caller.
+    """
+
+    def __init__(self, workers: int = 0, max_pending: int = 32):
+        self.workers = max(0, workers)
+        self._slots = threading.BoundedSemaphore(max(1, max_pending))
+        self._pool = None
+        self._broken = False
+        self._lock = threading.Lock()
+
+    @property
+    def parallel(self) -> bool:
+        return self.workers > 0 and not self._broken
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+                # spawn, not fork: the parent is multi-threaded when the pool starts
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pool
+
+    def mark_broken(self):
+        if not self._broken:
+            logger.warning("Parse worker pool is broken; parsing inline from now on")
+        self._broken = True
+
+    @staticmethod
+    def _run_inline(fn: Callable, args: tuple) -> Future:
+        fut: Future = Future()
+        try:
+            fut.set_result(fn(*args))
+        except Exception as exc:
+            fut.set_exception(exc)
+        return fut
+
+    def submit(self, fn: Callable, *args, timeout: Optional[float] = None) -> ParseTask:
+        """Queue ``fn(*args)`` for parsing. ``fn`` and ``args`` must be picklable.
+
+        Waits at most ``timeout`` seconds for a free slot, then raises
+        ``concurrent.futures.TimeoutError``.
+        """
+        if not self.parallel:
+            return ParseTask(self, self._run_inline(fn, args), fn, args)
+        if not self._slots.acquire(timeout=timeout):
+            raise FuturesTimeout(f"no parse slot free within {timeout:.1f}s")
+        try:
+            fut = self._get_pool().submit(fn, *args)
+        except Exception as exc:
+            self._slots.release()
+            logger.warning("Could not submit to parse pool (%s); parsing inline", exc)
+            self.mark_broken()
+            return ParseTask(self, self._run_inline(fn, args), fn, args)
+        fut.add_done_callback(lambda _: self._slots.release())
+        return ParseTask(self, fut, fn, args)
+
+    def close(self):
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
@@ -0,0 +1,164 @@
+"""
+Streaming job pipeline: source → normalize → dedup → score → exists-filter → persist → notify
+
+Every stage is a generator that takes an iterator and yields jobs, so stages
+compose with ``build_pipeline`` and run lazily: the consumer pulls one job at
+a time, and a new source batch is only taken once the previous one has been
+stored. Scraping keeps running in the scraper's worker pool meanwhile, so jobs
+from fast sources are persisted and notified while slow sources still fetch.
+
+Pass a ``StageTimer`` to ``build_pipeline`` to get the wall time spent in each
+stage (excluding the stages upstream of it).
+"""
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.canonical import company_key
+from src.job_scraper import JobScraper
+
+Stage = Callable[[Iterator], Iterator]
+
+
+def stage_name(stage: Stage) -> str:
+    name = getattr(stage, '__name__', None)
+    return name if name else type(stage).__name__.lower()
+
+
+def _named(name: str) -> Callable[[Stage], Stage]:
+    def _set(stage: Stage) -> Stage:
+        stage.__name__ = name
+        return stage
+    return _set
+
+
+class StageTimer:
+    """Collects the exclusive wall time of every stage in one pipeline run."""
+
+    def __init__(self):
+        self._slots: List[List] = []  # [name, cumulative seconds pulling from this stage's output]
+
+    def wrap(self, name: str, stream: Iterator) -> Iterator:
+        slot = [name, 0.0]
+        self._slots.append(slot)
+        return self._clock(stream, slot)
+
+    @staticmethod
+    def _clock(stream: Iterator, slot: List) -> Iterator:
+        clock = time.perf_counter
+        while True:
+            start = clock()
+            try:
+                item = next(stream)
+            except StopIteration:
+                slot[1] += clock() - start
+                return
+            slot[1] += clock() - start
+            yield item
+
+    def exclusive(self) -> Dict[str, float]:
+        """Seconds spent inside each stage itself; stages sharing a name are summed."""
+        out: Dict[str, float] = {}
+        upstream = 0.0
+        for name, cumulative in self._slots:
+            out[name] = out.get(name, 0.0) + max(0.0, cumulative - upstream)
+            upstream = cumulative
+        return out
+
+
+def build_pipeline(source: Iterable, *stages: Stage, timer: Optional[StageTimer] = None) -> Iterator:
+    """Chain ``stages`` onto ``source``; returns the lazy output iterator.
+
+    The source itself is timed as stage ``scrape`` when ``timer`` is given.
+    """
+    stream = iter(source)
+    if timer is not None:
+        stream = timer.wrap('scrape', stream)
+    for stage in stages:
+        stream = stage(stream)
+        if timer is not None:
+            stream = timer.wrap(stage_name(stage), stream)
+    return stream
+
+
+def flatten(batches: Iterable[Tuple[str, List[Dict]]]) -> Iterator[Dict]:
+    """``(label, jobs)`` batches from ``JobScraper.iter_source_results`` → single jobs."""
+    for _label, jobs in batches:
+        yield from jobs
+
+
+def normalize(jobs: Iterable[Dict]) -> Iterator[Dict]:
+    """Trim whitespace in the text fields and make sure every job has a ``job_id``."""
+    for job in jobs:
+        for field in ('title', 'company', 'location'):
+            value = job.get(field)
+            if isinstance(value, str):
+                job[field] = " ".join(value.split())
+        if not job.get('job_id'):
+            job['job_id'] = JobScraper.generate_job_id(job)
+        yield job
+
+
+class Dedup:
+    """Streaming version of ``JobScraper.deduplicate_jobs`` (same rule, one cycle's memory).
+
+    Titles are only compared within one canonical company, so a job costs a
+    dict lookup plus a fuzzy match per kept title of that company.
+    """
+
+    __name__ = 'dedup'
+
+    def __init__(self, threshold: float = 0.85):
+        self.threshold = threshold
+        self.removed = 0
+        self._kept: Dict[str, List[str]] = {}
+
+    def __call__(self, jobs: Iterable[Dict]) -> Iterator[Dict]:
+        sim = JobScraper._sim
+        for job in jobs:
+            title = job.get('title', '')
+            kept = self._kept.setdefault(company_key(job.get('company') or ''), [])
+            if any(sim(title, kt) > self.threshold for kt in kept):
+                self.removed += 1
+                continue
+            kept.append(title)
+            yield job
+
+
+def score(keywords: List[str]) -> Stage:
+    """Attach ``relevance_score`` (see ``JobScraper.score_job``)."""
+    @_named('rank')
+    def _stage(jobs: Iterable[Dict]) -> Iterator[Dict]:
+        for job in jobs:
+            job['relevance_score'] = JobScraper.score_job(job, keywords)
+            yield job
+    return _stage
+
+
+def only_new(database) -> Stage:
+    """Drop jobs already in the database."""
+    @_named('db_lookup')
+    def _stage(jobs: Iterable[Dict]) -> Iterator[Dict]:
+        for job in jobs:
+            if not database.job_exists(job['job_id']):
+                yield job
+    return _stage
+
+
+def persist(database) -> Stage:
+    """Store each job; only the ones actually inserted continue downstream."""
+    @_named('db_write')
+    def _stage(jobs: Iterable[Dict]) -> Iterator[Dict]:
+        for job in jobs:
+            if database.add_job(job):
+                yield job
+    return _stage
+
+
+def notify_each(on_job: Callable[[Dict], None]) -> Stage:
+    """Call ``on_job`` for every job as it passes (instant alerts, digest queueing, ...)."""
+    @_named('notify')
+    def _stage(jobs: Iterable[Dict]) -> Iterator[Dict]:
+        for job in jobs:
+            on_job(job)
+            yield job
+    return _stage
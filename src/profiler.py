@@ -0,0 +1,177 @@
+"""
+On-demand profiling of individual check cycles (sampling or cProfile)
+"""
+import io
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+Frame = str  # "module.py:function"
+
+
+class SamplingProfiler:
+    """Samples the stacks of *all* threads every ``interval`` seconds from a daemon thread.
+
+    Unlike cProfile it also sees the scraper's worker threads, and its cost is
+    one ``sys._current_frames()`` walk per sample, independent of how many
+    function calls the profiled code makes.
+    """
+
+    def __init__(self, interval: float = 0.005, max_depth: int = 64):
+        self.interval = interval
+        self.max_depth = max_depth
+        self.stacks: Counter = Counter()  # tuple of frames (root first) -> samples
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _stack(self, frame) -> Tuple[Frame, ...]:
+        out: List[Frame] = []
+        while frame is not None and len(out) < self.max_depth:
+            code = frame.f_code
+            out.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+            frame = frame.f_back
+        out.reverse()
+        return tuple(out)
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for ident, frame in sys._current_frames().items():
+                if ident != own:
+                    self.stacks[self._stack(frame)] += 1
+            self.samples += 1
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="cycle-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def write(self, path: str):
+        """Collapsed-stack ("folded") format, readable by flamegraph.pl and speedscope."""
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{';'.join(stack)} {count}\n")
+
+    def top(self, limit: int = 20) -> str:
+        own: Counter = Counter()
+        total: Counter = Counter()
+        for stack, count in self.stacks.items():
+            if not stack:
+                continue
+            own[stack[-1]] += count
+            for frame in set(stack):
+                total[frame] += count
+        all_samples = sum(self.stacks.values()) or 1
+        lines = [f"{'self%':>6} {'total%':>7}  function"]
+        for frame, count in own.most_common(limit):
+            lines.append(f"{100 * count / all_samples:>6.1f} {100 * total[frame] / all_samples:>7.1f}  {frame}")
+        return "\n".join(lines)
+
+
+class _CProfile:
+    """cProfile adapter; deterministic, but only sees the thread that runs the check."""
+
+    def __init__(self):
+        import cProfile
+        self.profile = cProfile.Profile()
+
+    def start(self):
+        self.profile.enable()
+
+    def stop(self):
+        self.profile.disable()
+
+    def write(self, path: str):
+        self.profile.dump_stats(path)
+
+    def top(self, limit: int = 20) -> str:
+        import pstats
+        out = io.StringIO()
+        pstats.Stats(self.profile, stream=out).sort_stats('cumulative').print_stats(limit)
+        return out.getvalue().strip()
+
+
+class CycleProfiler:
+    """Profiles the next N check cycles once armed (by config at startup or by a signal).
+
+    Each profiled cycle writes ``<directory>/check-<n>-<timestamp>.{folded,prof}``
+    and logs the top functions. When not armed, ``cycle`` costs two integer checks.
+    """
+
+    def __init__(self, directory: str = "logs/profiles", mode: str = "sample",
+                 top: int = 20, interval: float = 0.005):
+        self.directory = directory
+        self.mode = mode if mode in ("sample", "cprofile") else "sample"
+        self.top_n = top
+        self.interval = interval
+        self.remaining = 0
+        self.written: List[str] = []
+        self._lock = threading.Lock()
+        # Cycles requested by signal; only arm_from_signal writes _signalled, only _take writes _folded
+        self._signalled = 0
+        self._folded = 0
+
+    def arm(self, cycles: int):
+        with self._lock:
+            self.remaining += max(0, cycles)
+            remaining = self.remaining
+        logger.info("Profiling the next %s check(s) (%s)", remaining, self.mode)
+
+    def arm_from_signal(self, cycles: int):
+        """``arm`` for signal handlers: no lock and no logging, picked up by the next ``cycle``."""
+        self._signalled += max(0, cycles)
+
+    def _take(self) -> bool:
+        signalled = self._signalled - self._folded
+        if signalled:
+            self._folded += signalled
+            self.arm(signalled)
+        with self._lock:
+            if self.remaining <= 0:
+                return False
+            self.remaining -= 1
+            return True
+
+    @contextmanager
+    def cycle(self, name: str):
+        if not self._take():
+            yield
+            return
+        prof = SamplingProfiler(self.interval) if self.mode == "sample" else _CProfile()
+        started = time.perf_counter()
+        prof.start()
+        try:
+            yield
+        finally:
+            prof.stop()
+            self._finish(prof, name, time.perf_counter() - started)
+
+    def _finish(self, prof, name: str, elapsed: float):
+        ext = "folded" if self.mode == "sample" else "prof"
+        path = os.path.join(self.directory, f"{name}-{time.strftime('%Y%m%d-%H%M%S')}.{ext}")
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            prof.write(path)
+            self.written.append(path)
+        except OSError as e:
+            logger.warning("Could not write profile %s: %s", path, e)
+            path = "(not written)"
+        logger.info("Profile of %s (%.1fs) → %s\n%s", name, elapsed, path, prof.top(self.top_n))
+
+    def status(self) -> Dict:
+        return {'mode': self.mode, 'remaining': self.remaining + self._signalled - self._folded,
+                'written': list(self.written[-10:])}
@@ -0,0 +1,137 @@
+"""
+Search profiles: per-recipient keywords, filters and channels served from one scrape
+"""
+from dataclasses import dataclass, replace
+from typing import Dict, List, Tuple
+
+from src.job_scraper import JobScraper
+from src.search_index import KeywordIndex
+
+_PROFILE_KEYS = {'name', 'keywords', 'locations', 'exclude', 'telegram_chat_id', 'email_recipient'}
+
+
+@dataclass(frozen=True)
+class SearchProfile:
+    """One recipient's interests and where to send their matches.
+
+    A profile without keywords receives every job the sources return. Channels
+    are per profile: an empty chat id / recipient turns that channel off.
+    """
+
+    name: str
+    keywords: Tuple[str, ...] = ()
+    locations: Tuple[str, ...] = ()  # any of these in the job location; empty = anywhere
+    exclude: Tuple[str, ...] = ()    # skip jobs whose title or description mentions one
+    telegram_chat_id: str = ""
+    email_recipient: str = ""
+
+    def notification_settings(self, settings):
+        """``settings`` with this profile's recipients (bot token and SMTP account are shared)."""
+        return replace(
+            settings,
+            telegram_chat_id=self.telegram_chat_id,
+            email_recipient=self.email_recipient,
+            telegram_enabled=settings.telegram_enabled and bool(self.telegram_chat_id),
+            email_enabled=settings.email_enabled and bool(self.email_recipient),
+        )
+
+    def channel(self, kind: str) -> str:
+        """Notification type recorded in the database, e.g. ``digest:alice``."""
+        return kind if self.name == "default" else f"{kind}:{self.name}"
+
+
+def _strings(value) -> Tuple[str, ...]:
+    if isinstance(value, str):
+        value = [value]
+    return tuple(str(v) for v in (value or ()) if str(v).strip())
+
+
+def load_profiles(settings) -> List[SearchProfile]:
+    """Profiles from ``SEARCH_PROFILES``; without any, one ``default`` profile for the global recipients."""
+    if not settings.search_profiles:
+        return [SearchProfile("default", telegram_chat_id=settings.telegram_chat_id,
+                              email_recipient=settings.email_recipient)]
+    profiles: List[SearchProfile] = []
+    seen = set()
+    for i, raw in enumerate(settings.search_profiles, 1):
+        unknown = set(raw) - _PROFILE_KEYS
+        if unknown:
+            raise ValueError(f"search profile #{i}: unknown key(s) {', '.join(sorted(unknown))}")
+        name = str(raw.get('name') or f"profile-{i}")
+        if name in seen:
+            raise ValueError(f"search profile #{i}: duplicate name {name!r}")
+        seen.add(name)
+        profiles.append(SearchProfile(
+            name=name,
+            keywords=_strings(raw.get('keywords')),
+            locations=_strings(raw.get('locations')),
+            exclude=_strings(raw.get('exclude')),
+            telegram_chat_id=str(raw.get('telegram_chat_id') or ""),
+            email_recipient=str(raw.get('email_recipient') or ""),
+        ))
+    return profiles
+
+
+def scrape_keywords(profiles: List[SearchProfile], fallback: List[str]) -> List[str]:
+    """Union of all profiles' keywords (first occurrence wins), so each source is fetched once."""
+    seen = set()
+    keywords = []
+    for profile in profiles:
+        for keyword in profile.keywords:
+            key = JobScraper._normalize_text(keyword)
+            if key not in seen:
+                seen.add(key)
+                keywords.append(keyword)
+    return keywords or list(fallback)
+
+
+class ProfileMatcher:
+    """Matches one job against every profile (saved search) in a single pass.
+
+    Keywords are normalised, de-duplicated across profiles and put in a
+    ``KeywordIndex`` up front. Per job the text is normalised once, its character
+    trigrams are looked up in the index to find the keywords it contains, and hits are
+    mapped back to the profiles that asked for them, so cost follows the job's
+    length and the number of matches, not the number of profiles. Filters and
+    ``score_job`` scoring only run for the profiles that matched.
+    """
+
+    def __init__(self, profiles: List[SearchProfile]):
+        norm = JobScraper._normalize_text
+        self.profiles = list(profiles)
+        owners: Dict[str, List[int]] = {}
+        self._match_all = [i for i, p in enumerate(self.profiles) if not p.keywords]
+        self._filters: List[Tuple[Tuple[str, ...], Tuple[str, ...]]] = []
+        for i, profile in enumerate(self.profiles):
+            for keyword in {norm(k) for k in profile.keywords} - {""}:
+                owners.setdefault(keyword, []).append(i)
+            self._filters.append((tuple(norm(l) for l in profile.locations),
+                                  tuple(norm(x) for x in profile.exclude)))
+        self._index = KeywordIndex(owners)
+        self._owners = [owners[k] for k in self._index.keywords]
+
+    def match(self, job: Dict) -> List[Tuple[SearchProfile, float]]:
+        """``(profile, relevance score for that profile)`` for every profile that wants ``job``."""
+        norm = JobScraper._normalize_text
+        title = job.get('title') or ''
+        description = job.get('description') or ''
+        text = norm(f"{title} {description}")
+        hits = set(self._match_all)
+        for kid in self._index.match(text):
+            hits.update(self._owners[kid])
+        if not hits:
+            return []
+        location = norm(job.get('location') or '')
+        title_low, desc_low = title.lower(), description.lower()
+        matched = []
+        for i in sorted(hits):
+            locations, exclude = self._filters[i]
+            if locations and not any(l in location for l in locations):
+                continue
+            if exclude and any(x in text for x in exclude):
+                continue
+            profile = self.profiles[i]
+            score = (JobScraper.score_text(title_low, desc_low, profile.keywords) if profile.keywords
+                     else job.get('relevance_score', 0))
+            matched.append((profile, score))
+        return matched
@@ -0,0 +1,140 @@
+"""
+Adaptive per-source polling scheduler
+"""
+import hashlib
+import time
+from typing import Dict, Iterable, List, Optional
+
+
+class SourceSchedule:
+    """Polling state for a single source."""
+
+    def __init__(self, interval: float, next_due: float):
+        self.interval = interval
+        self.next_due = next_due
+        self.fingerprint: Optional[str] = None
+        self.polls = 0
+        self.changes = 0
+
+
+class AdaptiveScheduler:
+    """Keeps a separate next-due time per source and adapts it to the change rate.
+
+    A source whose listing changed since its last poll is polled ``speedup``
+    times sooner; an unchanged source backs off by ``slowdown``. Intervals are
+    clamped to ``[min_interval, max_interval]``. Change is detected from a
+    fingerprint of the job IDs returned, so it works for every source without
+    relying on HTTP validators.
+    """
+
+    def __init__(self, sources: Iterable[str], base_interval: float,
+                 min_interval: float, max_interval: float,
+                 initial_intervals: Optional[Dict[str, float]] = None,
+                 speedup: float = 0.5, slowdown: float = 1.5):
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.speedup = speedup
+        self.slowdown = slowdown
+        now = time.monotonic()
+        initial_intervals = initial_intervals or {}
+        self._sources: Dict[str, SourceSchedule] = {
+            label: SourceSchedule(self._clamp(initial_intervals.get(label, base_interval)), now)
+            for label in sources
+        }
+
+    def _clamp(self, interval: float) -> float:
+        return min(self.max_interval, max(self.min_interval, interval))
+
+    @property
+    def sources(self) -> List[str]:
+        return list(self._sources)
+
+    def due(self, now: Optional[float] = None) -> List[str]:
+        """Sources whose next-due time has passed."""
+        now = time.monotonic() if now is None else now
+        return [label for label, st in self._sources.items() if st.next_due <= now]
+
+    def seconds_until_next(self, now: Optional[float] = None) -> float:
+        if not self._sources:
+            return self.max_interval
+        now = time.monotonic() if now is None else now
+        return max(0.0, min(st.next_due for st in self._sources.values()) - now)
+
+    def record(self, label: str, job_ids: Iterable[str] = (), ok: bool = True,
+               now: Optional[float] = None) -> bool:
+        """Record a poll of ``label`` and schedule its next run. Returns True if it changed."""
+        st = self._sources.get(label)
+        if st is None:
+            return False
+        now = time.monotonic() if now is None else now
+        changed = False
+        if ok:
+            fp = hashlib.md5("\n".join(sorted(job_ids)).encode()).hexdigest()
+            if st.fingerprint is not None:
+                changed = fp != st.fingerprint
+                factor = self.speedup if changed else self.slowdown
+                st.interval = self._clamp(st.interval * factor)
+            st.fingerprint = fp
+            st.polls += 1
+            st.changes += int(changed)
+        # Failed / timed-out polls keep their interval; the circuit breaker handles dead hosts
+        st.next_due = now + st.interval
+        return changed
+
+    def sync(self, sources: Iterable[str], base_interval: float, min_interval: float, max_interval: float,
+             initial_intervals: Optional[Dict[str, float]] = None):
+        """Adopt a new source list and bounds (config reload); known sources keep their state."""
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        now = time.monotonic()
+        initial_intervals = initial_intervals or {}
+        current = self._sources
+        self._sources = {}
+        for label in sources:
+            st = current.get(label)
+            if st is None:
+                st = SourceSchedule(initial_intervals.get(label, base_interval), now)
+            st.interval = self._clamp(st.interval)
+            self._sources[label] = st
+
+    def postpone(self, labels: Iterable[str], now: Optional[float] = None):
+        """Push still-due sources back one interval (e.g. after a cycle that crashed)."""
+        now = time.monotonic() if now is None else now
+        for label in labels:
+            st = self._sources.get(label)
+            if st is not None and st.next_due <= now:
+                st.next_due = now + st.interval
+
+    def dump_state(self) -> Dict[str, Dict]:
+        """Per-source state with next-due times relative to now, so it survives a restart."""
+        now = time.monotonic()
+        return {
+            label: {'interval': st.interval, 'due_in': st.next_due - now, 'fingerprint': st.fingerprint,
+                    'polls': st.polls, 'changes': st.changes}
+            for label, st in self._sources.items()
+        }
+
+    def load_state(self, state: Dict[str, Dict], elapsed: float = 0.0):
+        """Restore ``dump_state`` output taken ``elapsed`` seconds ago; unknown sources are skipped."""
+        now = time.monotonic()
+        for label, saved in state.items():
+            st = self._sources.get(label)
+            if st is None:
+                continue
+            st.interval = self._clamp(saved['interval'])
+            st.next_due = now + saved['due_in'] - elapsed
+            st.fingerprint = saved['fingerprint']
+            st.polls = saved['polls']
+            st.changes = saved['changes']
+
+    def snapshot(self, now: Optional[float] = None) -> Dict[str, Dict]:
+        now = time.monotonic() if now is None else now
+        return {
+            label: {
+                'interval': round(st.interval, 1),
+                'due_in': round(max(0.0, st.next_due - now), 1),
+                'polls': st.polls,
+                'changes': st.changes,
+            }
+            for label, st in self._sources.items()
+        }
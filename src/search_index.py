@@ -0,0 +1,68 @@
+"""
+Reverse (percolator-style) index of saved-search keywords, matched against job text
+"""
+from typing import Dict, Iterable, List, Set
+
+GRAM = 3
+
+
+def grams(text: str, n: int = GRAM) -> Set[str]:
+    """Distinct character ``n``-grams of ``text`` (the whole text when it is shorter)."""
+    if len(text) <= n:
+        return {text} if text else set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class KeywordIndex:
+    """Keywords indexed by one *anchor* character trigram each, so a document finds its keywords by lookup.
+
+    A text that contains a keyword contains every trigram of it, so looking
+    up the document's trigrams yields a superset of the keywords it contains,
+    wherever they occur ("end" in "backend", "script" in "javascript"). The
+    anchor is the keyword's rarest trigram across all indexed keywords, which
+    keeps posting lists short. Keywords shorter than a trigram ("go", "c#")
+    are filed under themselves and looked up among the document's grams of
+    that length.
+
+    ``match`` verifies the candidates with the substring rule of
+    ``JobScraper._keyword_match``, so it returns exactly the keywords a scan
+    would.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = list(keywords)
+        keyword_grams = [grams(k) for k in self.keywords]
+        frequency: Dict[str, int] = {}
+        for kgrams in keyword_grams:
+            for gram in kgrams:
+                frequency[gram] = frequency.get(gram, 0) + 1
+
+        self._postings: Dict[str, List[int]] = {}
+        self._unanchored: List[int] = []  # empty keyword: always verified
+        for kid, kgrams in enumerate(keyword_grams):
+            if not kgrams:
+                self._unanchored.append(kid)
+                continue
+            anchor = min(kgrams, key=lambda g: (frequency[g], g))
+            self._postings.setdefault(anchor, []).append(kid)
+        # Gram lengths worth taking from a document (GRAM, plus shorter keywords)
+        self._lengths = sorted({len(anchor) for anchor in self._postings})
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def candidates(self, text: str) -> Set[int]:
+        """Ids of keywords whose anchor occurs in ``text`` (superset of ``match``)."""
+        postings = self._postings
+        found: Set[int] = set(self._unanchored)
+        for n in self._lengths:
+            if n > len(text):
+                break
+            for gram in grams(text, n) & postings.keys():
+                found.update(postings[gram])
+        return found
+
+    def match(self, text: str) -> List[int]:
+        """Ids of the keywords contained in ``text`` (normalised the same way as the keywords)."""
+        keywords = self.keywords
+        return [kid for kid in self.candidates(text) if keywords[kid] in text]
@@ -0,0 +1,245 @@
+"""
+Coordinator/worker sharding of the sources over a shared work queue
+"""
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.job_scraper import JobScraper, _get_host_guard
+from src.work_queue import WorkQueue
+from config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Sources whose board list is split across shards; everything else is one shard per source
+BOARD_SOURCES = {"Greenhouse": "greenhouse_boards", "Lever": "lever_boards"}
+QUEUE_RETENTION = 86400  # seconds finished tasks of earlier cycles are kept for inspection
+
+
+def plan_shards(labels: List[str], keywords: List[str], boards_per_shard: int, settings=None) -> List[Dict]:
+    """One shard per source, with Greenhouse/Lever boards chunked ``boards_per_shard`` at a time."""
+    settings = settings or get_settings()
+    shards = []
+    for label in labels:
+        field = BOARD_SOURCES.get(label)
+        if field is None:
+            shards.append({'source': label, 'keywords': list(keywords)})
+            continue
+        boards = list(getattr(settings, field))
+        size = max(1, boards_per_shard)
+        for start in range(0, len(boards), size):
+            shards.append({'source': label, 'keywords': list(keywords), 'boards': boards[start:start + size]})
+    return shards
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class ShardWorker:
+    """Leases shards from the queue, scrapes them and reports the jobs back.
+
+    ``scraper`` is anything with ``scrape_shard(shard) -> dict`` (a ``JobScraper``).
+
+    ``host_rate`` and ``host_burst`` (HOST_RATE_LIMIT, HOST_RATE_BURST) are
+    shared out among the workers seen in the queue within ``lease_seconds``:
+    each worker's host guard gets ``1 / workers`` of them, so the hosts see
+    the configured rate in total however many workers run. Circuit breakers
+    stay per worker.
+    """
+
+    def __init__(self, queue: WorkQueue, scraper, worker_id: Optional[str] = None,
+                 lease_seconds: float = 300, poll_interval: float = 1.0, host_rate: Optional[float] = None,
+                 host_burst: int = 5):
+        self.queue = queue
+        self.scraper = scraper
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.host_rate = host_rate
+        self.host_burst = host_burst
+        self.completed = 0
+        self.failed = 0
+        self._workers = 0
+
+    def _share_host_rate(self):
+        """Set this worker's per-host rate to its share of ``host_rate``."""
+        if not self.host_rate or self.host_rate <= 0:
+            return
+        workers = max(1, self.queue.active_workers(self.lease_seconds))
+        if workers != self._workers:
+            self._workers = workers
+            _get_host_guard().set_rate(self.host_rate / workers, max(1, self.host_burst // workers))
+            logger.info("🚦 %s active workers: %.2f requests/s per host each", workers, self.host_rate / workers)
+
+    def run_once(self) -> bool:
+        """Process one shard; False when the queue had nothing to do."""
+        task = self.queue.lease(self.worker_id, self.lease_seconds)
+        if task is None:
+            return False
+        task_id, shard = task
+        label = shard.get('source', '?')
+        self._share_host_rate()
+        try:
+            result = self.scraper.scrape_shard(shard)
+        except Exception as e:
+            logger.error("❌ Shard %s (%s) failed: %s", task_id, label, e, extra={'source': label})
+            self.failed += 1
+            self.queue.fail(task_id, self.worker_id, str(e))
+            return True
+        if self.queue.complete(task_id, self.worker_id, result):
+            self.completed += 1
+            logger.info("✅ Shard %s (%s): %s jobs in %.1fs", task_id, label, len(result['jobs']),
+                        result.get('seconds', 0.0), extra={'source': label, 'jobs': len(result['jobs'])})
+        else:
+            logger.warning("Shard %s (%s) finished after its lease was lost; result dropped", task_id, label)
+        return True
+
+    def run(self, stop: Optional[threading.Event] = None):
+        """Work until ``stop`` is set (forever when None)."""
+        stop = stop or threading.Event()
+        logger.info("👷 Worker %s polling %s", self.worker_id, self.queue.path)
+        while not stop.is_set():
+            if not self.run_once():
+                stop.wait(self.poll_interval)
+
+
+class ShardingScraper(JobScraper):
+    """A ``JobScraper`` whose sources are scraped by worker processes instead of local threads.
+
+    ``iter_source_results`` splits the enabled sources into shards, queues
+    them for the cycle and yields each shard's jobs as its worker reports
+    back, so the check pipeline (dedup, insert, notify) stays central and
+    unchanged. Cursors are shipped with every shard and the advances of
+    completed shards come back to be persisted as usual.
+    """
+
+    def __init__(self, timeout: int = 10, queue: Optional[WorkQueue] = None):
+        super().__init__(timeout=timeout)
+        settings = get_settings()
+        self.queue = queue or WorkQueue(settings.work_queue_file, max_attempts=settings.shard_max_attempts)
+        self.boards_per_shard = settings.shard_boards_per_task
+        self.poll_interval = settings.shard_poll_interval
+        self.stall_timeout = settings.shard_stall_timeout
+
+    def iter_source_results(self, keywords: List[str], deadline: Optional[float] = None,
+                            sources: Optional[List[str]] = None) -> Iterator[Tuple[str, List[Dict]]]:
+        """Queue the cycle's shards and yield ``(label, jobs)`` as workers complete them.
+
+        Same contract as ``JobScraper.iter_source_results``: a source is
+        ``ok`` only when all of its shards are, ``failed`` if any shard failed
+        and ``timed_out`` if shards were still outstanding at the deadline, a
+        shard's scraper ran into it, or no worker made progress for
+        ``stall_timeout`` seconds.
+        """
+        logger.info("🔍 Starting sharded job search across all sources...")
+        logger.info("📍 Searching for: %s", ', '.join(keywords))
+        if deadline is None:
+            deadline = get_settings().check_deadline
+        labels = self.source_labels()
+        if sources is not None:
+            wanted = set(sources)
+            labels = [label for label in labels if label in wanted]
+
+        shards = plan_shards(labels, keywords, self.boards_per_shard)
+        status: Dict[str, str] = {}
+        results: Dict[str, List[Dict]] = {}
+        durations: Dict[str, float] = {}
+        timings: Dict[str, Dict[str, float]] = {}
+        label_cursors: Dict[str, Dict] = {}
+        remaining: Dict[str, int] = {}
+        for shard in shards:
+            remaining[shard['source']] = remaining.get(shard['source'], 0) + 1
+        if not shards:
+            self._set_last(status, results, durations, timings, {})
+            return
+
+        deadline_at = time.time() + deadline if deadline else None
+        cursors = {key: list(value) for key, value in self._cursors.items()}
+        for shard in shards:
+            shard['cursors'] = cursors
+            shard['deadline'] = deadline_at
+        cycle = uuid.uuid4().hex
+        self.queue.purge(QUEUE_RETENTION)
+        self.queue.submit(cycle, shards)
+        logger.info("📊 Queued %s shards of %s sources for the workers", len(shards), len(remaining))
+
+        seen: set = set()
+
+        def _collect(rows) -> List[Tuple[str, List[Dict]]]:
+            done = []
+            for task_id, state, shard, result, error in rows:
+                seen.add(task_id)
+                label = shard['source']
+                remaining[label] -= 1
+                results.setdefault(label, [])
+                if state != 'done':
+                    logger.error("  ❌ %s: %s", label, error, extra={'source': label})
+                    status[label] = 'failed'
+                    done.append((label, []))
+                    continue
+                results[label].extend(result['jobs'])
+                label_cursors.setdefault(label, {}).update(result['cursors'])
+                # Shards of a source run side by side, so its wall time is the slowest shard
+                durations[label] = max(durations.get(label, 0.0), result['seconds'])
+                clock = timings.setdefault(label, {})
+                for stage, seconds in result['timings'].items():
+                    clock[stage] = clock.get(stage, 0.0) + seconds
+                if result.get('timed_out') and status.get(label) != 'failed':
+                    status[label] = 'timed_out'  # the worker's scraper caught the deadline itself
+                if remaining[label] == 0 and label not in status:
+                    status[label] = 'ok'
+                done.append((label, result['jobs']))
+            return done
+
+        last_progress, last_change = None, time.monotonic()
+        try:
+            while len(seen) < len(shards):
+                for label, jobs in _collect(self.queue.finished(cycle, exclude=seen)):
+                    yield label, jobs
+                if len(seen) >= len(shards):
+                    break
+                progress = self.queue.progress(cycle)
+                if progress != last_progress:
+                    last_progress, last_change = progress, time.monotonic()
+                if deadline_at is not None and time.time() >= deadline_at:
+                    reason = f"cycle deadline ({deadline}s) reached"
+                elif self.stall_timeout and time.monotonic() - last_change > self.stall_timeout:
+                    reason = f"no worker progress for {self.stall_timeout:.0f}s"
+                else:
+                    time.sleep(self.poll_interval)
+                    continue
+                self.queue.cancel(cycle)
+                # Results that landed between the last poll and the cancel still count
+                late_done = _collect(self.queue.finished(cycle, exclude=seen))
+                late = [label for label, left in remaining.items() if left and status.get(label) != 'failed']
+                for label in late:
+                    status[label] = 'timed_out'
+                    results.setdefault(label, [])
+                logger.warning("  ⏱️  %s — timed out: %s", reason.capitalize(), ', '.join(late),
+                               extra={'timed_out': late})
+                for label, jobs in late_done:
+                    yield label, jobs
+                break
+        finally:
+            self.queue.cancel(cycle)
+            pending = {}
+            for label, st in status.items():
+                if st == 'ok':
+                    pending.update({key: tuple(value) for key, value in label_cursors.get(label, {}).items()})
+            self._set_last(status, results, durations, timings, pending)
+
+        total = sum(len(jobs) for jobs in results.values())
+        logger.info("📊 Total jobs found across all sources: %s", total)
+
+    def _set_last(self, status, results, durations, timings, cursors):
+        self.last_source_status = status
+        self.last_source_results = results
+        self.last_source_durations = durations
+        self.last_source_timings = timings
+        self._pending_cursors = cursors
+
@@ -0,0 +1,129 @@
+"""
+On-disk snapshots of in-memory state (metrics, schedules, circuit breakers) for warm restarts
+"""
+import logging
+import mmap
+import os
+import pickle
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+# Snapshots hold plain data only; anything else in the file is refused on load
+_ALLOWED_CLASSES = {("datetime", "datetime")}
+
+
+class _StateUnpickler(pickle.Unpickler):
+    def find_class(self, module, name):
+        if (module, name) in _ALLOWED_CLASSES:
+            return super().find_class(module, name)
+        raise pickle.UnpicklingError(f"snapshot may not contain {module}.{name}")
+
+
+def save_snapshot(path: str, state: Dict) -> int:
+    """Write ``state`` atomically (pickle protocol 5); returns the file size in bytes."""
+    data = pickle.dumps({'version': SNAPSHOT_VERSION, 'saved_at': time.time(), 'state': state},
+                        protocol=5)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return len(data)
+
+
+def load_snapshot(path: str, max_age: Optional[float] = None) -> Optional[Tuple[Dict, float]]:
+    """``(state, seconds since it was saved)``, or None if missing, unreadable, stale or outdated.
+
+    The file is memory-mapped and unpickled in place instead of being read
+    into an intermediate buffer first.
+    """
+    try:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            payload = _StateUnpickler(mm).load()
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        # A damaged file can fail in the unpickler in many ways (TypeError, KeyError,
+        # OverflowError, MemoryError, ...); none of them should stop a start-up
+        logger.warning("⚠️  Ignoring unreadable snapshot %s: %s", path, e)
+        return None
+    if not isinstance(payload, dict) or payload.get('version') != SNAPSHOT_VERSION:
+        logger.warning("⚠️  Ignoring snapshot %s from another version", path)
+        return None
+    if not isinstance(payload.get('saved_at'), (int, float)) or not isinstance(payload.get('state'), dict):
+        logger.warning("⚠️  Ignoring malformed snapshot %s", path)
+        return None
+    elapsed = max(0.0, time.time() - payload['saved_at'])
+    if max_age and elapsed > max_age:
+        logger.info("Snapshot %s is %.0fs old (limit %ss); starting cold", path, elapsed, max_age)
+        return None
+    return payload['state'], elapsed
+
+
+_NUMBER = (int, float)
+
+
+def _check(ok: bool, where: str):
+    if not ok:
+        raise ValueError(f"malformed {where}")
+
+
+def _check_fields(data: Any, where: str, **kinds):
+    _check(isinstance(data, dict), where)
+    for name, kind in kinds.items():
+        _check(isinstance(data.get(name), kind), f"{where}.{name}")
+
+
+def _pair(value: Any, first, second) -> bool:
+    return isinstance(value, tuple) and len(value) == 2 and isinstance(value[0], first) \
+        and isinstance(value[1], second)
+
+
+def validate_state(state: Any):
+    """Check that ``state`` has the shape ``JobMonitoringSystem.save_state`` writes; raises ValueError.
+
+    Run before anything is restored, so a damaged snapshot is refused as a
+    whole instead of being half applied.
+    """
+    _check_fields(state, "state", system=dict, health=dict, scheduler=dict, scraper=dict)
+
+    system = state['system']
+    _check_fields(system, "system", check_count=int, jobs_found=int, notifications_sent=int, paused_sources=list)
+    _check(all(isinstance(label, str) for label in system['paused_sources']), "system.paused_sources")
+
+    health = state['health']
+    _check_fields(health, "health", errors=list, check_times=list, consecutive_failures=int, checks_total=int,
+                  check_failures_total=int, jobs_found_total=int, new_jobs_total=int, source_status_total=dict,
+                  source_timeouts=dict, histograms=dict)
+    _check(all(_pair(e, datetime, str) for e in health['errors']), "health.errors")
+    _check(all(_pair(t, datetime, _NUMBER) for t in health['check_times']), "health.check_times")
+    _check(all(_pair(key, str, str) and isinstance(n, int) for key, n in health['source_status_total'].items()),
+           "health.source_status_total")
+    _check(all(isinstance(label, str) and isinstance(n, int) for label, n in health['source_timeouts'].items()),
+           "health.source_timeouts")
+    for name, family in health['histograms'].items():
+        where = f"health.histograms.{name}"
+        _check(isinstance(family, dict), where)
+        for labels, hist in family.items():
+            _check(isinstance(labels, tuple) and all(_pair(label, str, str) for label in labels), where)
+            _check_fields(hist, where, buckets=(list, tuple), counts=list, sum=_NUMBER, count=int, recent=list)
+            _check(len(hist['counts']) == len(hist['buckets']) + 1
+                   and all(isinstance(n, int) for n in hist['counts'])
+                   and all(isinstance(v, _NUMBER) for v in list(hist['buckets']) + hist['recent']), where)
+
+    for label, saved in state['scheduler'].items():
+        where = f"scheduler.{label}"
+        _check_fields(saved, where, interval=_NUMBER, due_in=_NUMBER, polls=int, changes=int)
+        _check(saved.get('fingerprint') is None or isinstance(saved['fingerprint'], str), f"{where}.fingerprint")
+
+    hosts = state['scraper'].get('hosts', {})
+    _check(isinstance(hosts, dict), "scraper.hosts")
+    for host, saved in hosts.items():
+        where = f"scraper.hosts.{host}"
+        _check_fields(saved, where, failures=int, total_failures=int)
+        _check(saved.get('open_for') is None or isinstance(saved['open_for'], _NUMBER), f"{where}.open_for")
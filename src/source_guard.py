@@ -0,0 +1,207 @@
+"""
+Per-host rate limiting and circuit breaking for the fetch layer
+"""
+import threading
+import time
+from typing import Dict, Optional
+
+
+class SourceUnavailableError(Exception):
+    """Raised when a host's circuit breaker is open and the request is skipped."""
+
+
+class DeadlineExceededError(SourceUnavailableError):
+    """Raised when the check-cycle deadline has passed or the cycle was cancelled."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket (``rate`` tokens/sec, up to ``burst`` stored)."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Block until a token is available. Returns False if ``timeout`` expires first."""
+        if self.rate <= 0:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+            if deadline is not None and now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+
+class CircuitBreaker:
+    """Closed → open after ``threshold`` consecutive failures → half-open after ``cooldown``.
+
+    While open every request is rejected without touching the network. Once the
+    cooldown elapses a single trial request is let through; success closes the
+    breaker, failure re-opens it for another cooldown.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, threshold: int = 3, cooldown: float = 600.0):
+        self.threshold = max(1, threshold)
+        self.cooldown = cooldown
+        self.failures = 0
+        self.total_failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state(time.monotonic())
+
+    def _state(self, now: float) -> str:
+        if self.opened_at is None:
+            return self.CLOSED
+        if now - self.opened_at >= self.cooldown:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self._state(time.monotonic())
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self.total_failures += 1
+            if self._trial_in_flight or self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+    def cancel_trial(self):
+        """Give back a half-open trial slot that was claimed but never used."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def seconds_until_retry(self) -> float:
+        with self._lock:
+            if self.opened_at is None:
+                return 0.0
+            return max(0.0, self.cooldown - (time.monotonic() - self.opened_at))
+
+
+class HostGuard:
+    """Registry of one ``TokenBucket`` + ``CircuitBreaker`` per host."""
+
+    def __init__(self, rate: float = 2.0, burst: int = 5,
+                 failure_threshold: int = 3, cooldown: float = 600.0):
+        self.rate = rate
+        self.burst = burst
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def set_rate(self, rate: float, burst: Optional[int] = None):
+        """Change the per-host rate (and burst) of every bucket, existing and future."""
+        with self._lock:
+            self.rate = rate
+            if burst is not None:
+                self.burst = burst
+            buckets = list(self._buckets.values())
+        for b in buckets:
+            with b._lock:
+                b._refill(time.monotonic())  # tokens earned so far accrue at the old rate
+                b.rate = rate
+                if burst is not None:
+                    b.burst = max(1, burst)
+                    b._tokens = min(b._tokens, b.burst)
+
+    def bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            b = self._buckets.get(host)
+            if b is None:
+                b = self._buckets[host] = TokenBucket(self.rate, self.burst)
+            return b
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        with self._lock:
+            cb = self._breakers.get(host)
+            if cb is None:
+                cb = self._breakers[host] = CircuitBreaker(self.failure_threshold, self.cooldown)
+            return cb
+
+    def before_request(self, host: str, timeout: Optional[float] = None):
+        """Reject if the host's breaker is open, otherwise wait for a rate-limit token."""
+        breaker = self.breaker(host)
+        if not breaker.allow():
+            raise SourceUnavailableError(
+                f"circuit open for {host} (retry in {breaker.seconds_until_retry():.0f}s)"
+            )
+        if not self.bucket(host).acquire(timeout=timeout):
+            breaker.cancel_trial()
+            raise DeadlineExceededError(f"rate-limit wait for {host} exceeds the cycle deadline")
+
+    def dump_state(self) -> Dict[str, Dict]:
+        """Breaker state per host, with the open time as an age so it survives a restart."""
+        now = time.monotonic()
+        with self._lock:
+            items = list(self._breakers.items())
+        return {
+            host: {
+                'failures': cb.failures,
+                'total_failures': cb.total_failures,
+                'open_for': None if cb.opened_at is None else now - cb.opened_at,
+            }
+            for host, cb in items
+        }
+
+    def load_state(self, state: Dict[str, Dict], elapsed: float = 0.0):
+        """Restore ``dump_state`` output taken ``elapsed`` seconds ago."""
+        now = time.monotonic()
+        for host, st in state.items():
+            cb = self.breaker(host)
+            with cb._lock:
+                cb.failures = st['failures']
+                cb.total_failures = st['total_failures']
+                cb.opened_at = None if st['open_for'] is None else now - st['open_for'] - elapsed
+
+    def states(self) -> Dict[str, Dict]:
+        """Snapshot of every known breaker, keyed by host."""
+        with self._lock:
+            items = list(self._breakers.items())
+        return {
+            host: {
+                'state': cb.state,
+                'failures': cb.failures,
+                'total_failures': cb.total_failures,
+                'retry_in': round(cb.seconds_until_retry(), 1),
+            }
+            for host, cb in items
+        }
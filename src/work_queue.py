@@ -0,0 +1,167 @@
+"""
+SQLite-backed work queue shared by a sharding coordinator and its workers
+"""
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+
+class WorkQueue:
+    """Tasks leased by workers for a limited time and re-offered when a lease expires.
+
+    A task is ``pending`` until a worker leases it, then ``done``/``failed``
+    (or ``cancelled`` by the coordinator). A worker that dies simply lets its
+    lease run out; after ``max_attempts`` leases the task is marked failed.
+    Every lease also records the worker as seen, so ``active_workers`` tells
+    how many workers currently share the sources' hosts.
+
+    Every process opens the file itself, so workers can run on other hosts
+    that mount the same directory. The rollback journal is used instead of WAL
+    because WAL needs shared memory, which network filesystems don't provide.
+    """
+
+    def __init__(self, path: str = "data/work_queue.db", max_attempts: int = 3):
+        self.path = path
+        self.max_attempts = max_attempts
+        self._init_queue()
+
+    @contextmanager
+    def _connect(self, immediate: bool = False):
+        """Yield a (conn, cursor) pair and auto-commit / close."""
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+        try:
+            yield conn, cursor
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def _init_queue(self):
+        queue_dir = os.path.dirname(self.path)
+        if queue_dir:
+            os.makedirs(queue_dir, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=DELETE")
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS tasks (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    cycle TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    worker TEXT,
+                    lease_until REAL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    result TEXT,
+                    error TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            ''')
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status, id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_cycle ON tasks(cycle, status)")
+            conn.execute("CREATE TABLE IF NOT EXISTS workers (id TEXT PRIMARY KEY, seen_at REAL NOT NULL)")
+            conn.commit()
+        finally:
+            conn.close()
+
+    # ---- coordinator side ----
+
+    def submit(self, cycle: str, payloads: List[Dict]) -> List[int]:
+        """Queue one task per payload under ``cycle``; returns the task ids."""
+        now = time.time()
+        ids = []
+        with self._connect(immediate=True) as (conn, cursor):
+            for payload in payloads:
+                cursor.execute(
+                    "INSERT INTO tasks (cycle, payload, created_at, updated_at) VALUES (?, ?, ?, ?)",
+                    (cycle, json.dumps(payload), now, now))
+                ids.append(cursor.lastrowid)
+        return ids
+
+    def finished(self, cycle: str, exclude: Optional[set] = None) -> List[Tuple[int, str, Dict, Optional[Dict], str]]:
+        """``(id, status, payload, result, error)`` of the cycle's done/failed tasks not in ``exclude``."""
+        with self._connect() as (conn, cursor):
+            # One query; ids already collected are left out in SQL so their results aren't read again
+            rows = cursor.execute(
+                "SELECT id, status, payload, result, error FROM tasks WHERE cycle = ? "
+                "AND status IN ('done', 'failed') AND id NOT IN (SELECT value FROM json_each(?)) "
+                "ORDER BY updated_at, id", (cycle, json.dumps(sorted(exclude or ())))).fetchall()
+        return [(task_id, status, json.loads(payload), json.loads(result) if result else None, error or "")
+                for task_id, status, payload, result, error in rows]
+
+    def progress(self, cycle: str) -> Dict[str, int]:
+        """Task count per status for ``cycle``, plus ``attempts`` (total leases so far)."""
+        with self._connect() as (conn, cursor):
+            rows = cursor.execute("SELECT status, COUNT(*), SUM(attempts) FROM tasks WHERE cycle = ? GROUP BY status",
+                                  (cycle,)).fetchall()
+        counts = {status: n for status, n, _ in rows}
+        counts['attempts'] = sum(a or 0 for _, _, a in rows)
+        return counts
+
+    def cancel(self, cycle: str) -> int:
+        """Withdraw the cycle's unfinished tasks; results that still arrive are ignored."""
+        with self._connect(immediate=True) as (conn, cursor):
+            cursor.execute("UPDATE tasks SET status = 'cancelled', updated_at = ? "
+                           "WHERE cycle = ? AND status IN ('pending', 'leased')", (time.time(), cycle))
+            return cursor.rowcount
+
+    def purge(self, older_than: float) -> int:
+        """Delete tasks last touched more than ``older_than`` seconds ago."""
+        with self._connect(immediate=True) as (conn, cursor):
+            cursor.execute("DELETE FROM tasks WHERE updated_at < ?", (time.time() - older_than,))
+            deleted = cursor.rowcount
+            cursor.execute("DELETE FROM workers WHERE seen_at < ?", (time.time() - older_than,))
+            return deleted
+
+    # ---- worker side ----
+
+    def active_workers(self, within: float) -> int:
+        """Workers that leased, or polled for, a task in the last ``within`` seconds."""
+        with self._connect() as (conn, cursor):
+            return cursor.execute("SELECT COUNT(*) FROM workers WHERE seen_at >= ?",
+                                  (time.time() - within,)).fetchone()[0]
+
+    def lease(self, worker: str, lease_seconds: float) -> Optional[Tuple[int, Dict]]:
+        """Take the oldest available task (pending, or leased with an expired lease)."""
+        now = time.time()
+        with self._connect(immediate=True) as (conn, cursor):
+            cursor.execute("INSERT INTO workers (id, seen_at) VALUES (?, ?) "
+                           "ON CONFLICT(id) DO UPDATE SET seen_at = excluded.seen_at", (worker, now))
+            while True:
+                row = cursor.execute(
+                    "SELECT id, payload, attempts FROM tasks WHERE status = 'pending' "
+                    "OR (status = 'leased' AND lease_until < ?) ORDER BY id LIMIT 1", (now,)).fetchone()
+                if row is None:
+                    return None
+                task_id, payload, attempts = row
+                if attempts >= self.max_attempts:
+                    cursor.execute("UPDATE tasks SET status = 'failed', error = ?, updated_at = ? WHERE id = ?",
+                                   (f"lease expired {attempts} times", now, task_id))
+                    continue
+                cursor.execute(
+                    "UPDATE tasks SET status = 'leased', worker = ?, lease_until = ?, attempts = attempts + 1, "
+                    "updated_at = ? WHERE id = ?", (worker, now + lease_seconds, now, task_id))
+                return task_id, json.loads(payload)
+
+    def complete(self, task_id: int, worker: str, result: Dict) -> bool:
+        """Store the result; False if the lease was lost (expired and re-leased, or cancelled)."""
+        return self._finish(task_id, worker, 'done', result=json.dumps(result))
+
+    def fail(self, task_id: int, worker: str, error: str) -> bool:
+        return self._finish(task_id, worker, 'failed', error=error)
+
+    def _finish(self, task_id: int, worker: str, status: str, result: Optional[str] = None,
+                error: Optional[str] = None) -> bool:
+        with self._connect(immediate=True) as (conn, cursor):
+            cursor.execute("UPDATE tasks SET status = ?, result = ?, error = ?, updated_at = ? "
+                           "WHERE id = ? AND worker = ? AND status = 'leased'",
+                           (status, result, error, time.time(), task_id, worker))
+            return cursor.rowcount == 1